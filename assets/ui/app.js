@@ -30,7 +30,6 @@ const previews = {
 
 let isRunning = false;
 let jobSource = 'url';
-let progressTimer = null;
 
 const steps = [
   'Parsing job description',
@@ -40,39 +39,55 @@ const steps = [
   'Exporting PDF pack'
 ];
 
+const stageSteps = {
+  load_jobs: 0,
+  candidate: 0,
+  job: 0,
+  mapping: 1,
+  cv_draft: 2,
+  ats_audit: 2,
+  cover_letter: 3,
+  pdf: 4
+};
+
+const streamTargets = {
+  cv_draft: 'cv',
+  cover_letter: 'cover'
+};
+
+// load_jobs, six pipeline stages and PDF export for a single job.
+const expectedStages = 8;
+
+let stagesStarted = 0;
+let stagesFinished = 0;
+
 function resetProgress() {
   progressFill.style.width = '0%';
   progressLabel.textContent = 'Ready to tailor';
-  progressList.forEach((item) => item.classList.remove('active'));
-}
-
-function startProgress() {
-  let progress = 0;
-  let step = 0;
-  const stepSize = 92 / steps.length;
-
-  progressLabel.textContent = steps[0];
   progressList.forEach((item, index) => {
     item.textContent = steps[index];
     item.classList.remove('active');
   });
+  stagesStarted = 0;
+  stagesFinished = 0;
+}
 
-  progressTimer = setInterval(() => {
-    progress = Math.min(92, progress + 6);
-    progressFill.style.width = `${progress}%`;
-    if (progress >= (step + 1) * stepSize && step < steps.length) {
+function updateProgress(event) {
+  const step = stageSteps[event.stage];
+  if (event.type === 'stage_start') {
+    stagesStarted += 1;
+    if (step !== undefined) {
       progressList[step].classList.add('active');
       progressLabel.textContent = steps[step];
-      step += 1;
     }
-  }, 350);
+  } else if (event.type === 'stage_finish') {
+    stagesFinished += 1;
+  }
+  const progress = (92 * stagesFinished) / Math.max(stagesStarted, expectedStages);
+  progressFill.style.width = `${Math.min(92, progress)}%`;
 }
 
 function finishProgress(label) {
-  if (progressTimer) {
-    clearInterval(progressTimer);
-    progressTimer = null;
-  }
   progressFill.style.width = '100%';
   progressLabel.textContent = label;
 }
@@ -85,6 +100,154 @@ function setPreview(key, value) {
   }
 }
 
+function appendPreview(key, text) {
+  previews[key] += text;
+  const active = document.querySelector('[data-tab].active');
+  if (active && active.dataset.tab === key) {
+    preview.textContent = previews[key];
+  }
+}
+
+function showResult(payload) {
+  finishProgress('Tailor pack ready');
+  if (payload.preview) {
+    setPreview('cv', payload.preview.cv || previews.cv);
+    setPreview('cover', payload.preview.cover || previews.cover);
+    setPreview('audit', payload.preview.audit || previews.audit);
+  }
+
+  (payload.created_files || []).forEach((path) => {
+    const item = document.createElement('li');
+    const link = document.createElement('a');
+    link.href = `/${path}`;
+    link.textContent = path;
+    link.target = '_blank';
+    item.appendChild(link);
+    outputList.appendChild(item);
+  });
+}
+
+function handleStreamEvent(name, event) {
+  if (name === 'stage_start' || name === 'stage_finish') {
+    const target = streamTargets[event.stage];
+    if (name === 'stage_start' && target) {
+      previews[target] = '';
+      appendPreview(target, '');
+    }
+    updateProgress(event);
+  } else if (name === 'token') {
+    const target = streamTargets[event.stage];
+    if (target) appendPreview(target, event.text);
+  } else if (name === 'result') {
+    showResult(event);
+    return true;
+  } else if (name === 'error') {
+    throw new Error(event.message || 'Failed to run JobTailor.');
+  }
+  return false;
+}
+
+const jobStorageKey = 'jobtailor.job';
+const streamEvents = ['stage_start', 'stage_finish', 'token', 'result', 'error'];
+
+// Returns the CV's SHA-256 if the server already stores it, so the run can
+// refer to it by hash instead of uploading the bytes again.
+async function storedUploadHash(file) {
+  if (!window.crypto || !window.crypto.subtle) return null;
+  try {
+    const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+    const hash = Array.from(new Uint8Array(digest))
+      .map((byte) => byte.toString(16).padStart(2, '0'))
+      .join('');
+    const response = await fetch(`/api/uploads/${hash}`);
+    return response.ok ? hash : null;
+  } catch (error) {
+    return null;
+  }
+}
+
+async function submitJob(data) {
+  const response = await fetch('/api/jobs', {
+    method: 'POST',
+    body: data
+  });
+  const payload = await response.json();
+  if (!response.ok) {
+    throw new Error(payload.message || 'Failed to queue JobTailor run.');
+  }
+  return payload.job_id;
+}
+
+function followJob(jobId) {
+  // The server replays a running job's events (tokens merged per stage), so
+  // a reload rebuilds the progress and previews before following it live.
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`/api/jobs/${jobId}/events`);
+    streamEvents.forEach((name) => {
+      source.addEventListener(name, (message) => {
+        try {
+          if (handleStreamEvent(name, JSON.parse(message.data))) {
+            source.close();
+            resolve();
+          }
+        } catch (error) {
+          source.close();
+          reject(error);
+        }
+      });
+    });
+    source.onerror = () => {
+      // Reconnecting would replay the whole run; the job id stays stored
+      // so a reload can pick it up again.
+      source.close();
+      const error = new Error('Lost connection to the JobTailor server. Reload to resume.');
+      error.resumable = true;
+      reject(error);
+    };
+  });
+}
+
+async function trackJob(jobId) {
+  isRunning = true;
+  runButton.textContent = 'Tailoring...';
+  runButton.disabled = true;
+  try {
+    await followJob(jobId);
+    localStorage.removeItem(jobStorageKey);
+  } catch (error) {
+    if (!error.resumable) localStorage.removeItem(jobStorageKey);
+    finishProgress('Run failed');
+    showError(error.message || 'Unexpected error while running JobTailor.');
+  } finally {
+    runButton.textContent = 'Tailor Again';
+    runButton.disabled = false;
+    isRunning = false;
+  }
+}
+
+async function resumeJob() {
+  const jobId = localStorage.getItem(jobStorageKey);
+  if (!jobId) return;
+  const response = await fetch(`/api/jobs/${jobId}`);
+  if (!response.ok) {
+    localStorage.removeItem(jobStorageKey);
+    return;
+  }
+  const record = await response.json();
+  resetProgress();
+  if (record.status === 'done') {
+    localStorage.removeItem(jobStorageKey);
+    showResult(record.result);
+  } else if (record.status === 'error') {
+    localStorage.removeItem(jobStorageKey);
+    finishProgress('Run failed');
+    showError(record.message || 'Failed to run JobTailor.');
+  } else {
+    progressLabel.textContent = record.status === 'queued' ? 'Waiting in queue' : 'Resuming run';
+    await trackJob(jobId);
+  }
+}
+
 function showError(message) {
   errorBox.textContent = message;
   errorBox.hidden = false;
@@ -142,15 +305,17 @@ runButton.addEventListener('click', async () => {
     return;
   }
 
-  isRunning = true;
-  runButton.textContent = 'Tailoring...';
-  runButton.disabled = true;
   outputList.innerHTML = '';
   resetProgress();
-  startProgress();
+  progressLabel.textContent = 'Starting run';
 
   const data = new FormData();
-  data.append('cv_file', file);
+  const cvHash = await storedUploadHash(file);
+  if (cvHash) {
+    data.append('cv_hash', cvHash);
+  } else {
+    data.append('cv_file', file);
+  }
   data.append('job_source', jobSource);
   data.append('job_url', sourceInput.value.trim());
   data.append('job_text', sourceText.value.trim());
@@ -162,41 +327,21 @@ runButton.addEventListener('click', async () => {
   data.append('model', modelInput.value.trim());
   data.append('temperature', temperatureInput.value.trim());
 
+  isRunning = true;
+  runButton.disabled = true;
+  let jobId;
   try {
-    const response = await fetch('/api/run', {
-      method: 'POST',
-      body: data
-    });
-    const payload = await response.json();
-
-    if (!response.ok || payload.status !== 'ok') {
-      throw new Error(payload.message || 'Failed to run JobTailor.');
-    }
-
-    finishProgress('Tailor pack ready');
-    if (payload.preview) {
-      setPreview('cv', payload.preview.cv || previews.cv);
-      setPreview('cover', payload.preview.cover || previews.cover);
-      setPreview('audit', payload.preview.audit || previews.audit);
-    }
-
-    (payload.created_files || []).forEach((path) => {
-      const item = document.createElement('li');
-      const link = document.createElement('a');
-      link.href = `/${path}`;
-      link.textContent = path;
-      link.target = '_blank';
-      item.appendChild(link);
-      outputList.appendChild(item);
-    });
+    jobId = await submitJob(data);
   } catch (error) {
     finishProgress('Run failed');
     showError(error.message || 'Unexpected error while running JobTailor.');
-  } finally {
-    runButton.textContent = 'Tailor Again';
     runButton.disabled = false;
     isRunning = false;
+    return;
   }
+  localStorage.setItem(jobStorageKey, jobId);
+  progressLabel.textContent = 'Waiting in queue';
+  await trackJob(jobId);
 });
 
 tabs.forEach((tab) => {
@@ -206,3 +351,5 @@ tabs.forEach((tab) => {
     preview.textContent = previews[tab.dataset.tab];
   });
 });
+
+resumeJob();
@@ -0,0 +1 @@
+"""Offline benchmarks for job_tailor (run with ``python -m benchmarks.run``)."""
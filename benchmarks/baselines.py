@@ -0,0 +1,114 @@
+"""Earlier implementations kept as benchmark baselines."""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from fpdf import FPDF
+
+from job_tailor.core import (
+    build_ats_audit_prompt,
+    build_cover_letter_prompt,
+    build_cv_prompt,
+    build_mapping_prompt,
+)
+
+
+def legacy_build_stage_prompt(
+    stage: str, results: Dict[str, Any], temperature: Optional[float]
+) -> Tuple[str, Optional[float]]:
+    """``core.build_stage_prompt`` before per-stage projections: the whole
+    ``indent=2`` job and candidate JSON in every prompt (LLM stages only)."""
+    job_json_text = results["job"][1]
+    if stage == "mapping":
+        return build_mapping_prompt(job_json_text, results["candidate"][1]), temperature
+    if stage == "cv_draft":
+        prompt = build_cv_prompt(job_json_text, results["candidate"][1], results["mapping"])
+        return prompt, temperature
+    if stage == "cover_letter":
+        prompt = build_cover_letter_prompt(
+            job_json_text, results["candidate"][1], results["mapping"]
+        )
+        return prompt, temperature
+    if stage == "ats_audit":
+        return build_ats_audit_prompt(job_json_text, results["cv_draft"]), 0.0
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def legacy_markdown_to_pdf(markdown_text: str, output_path: Path) -> None:
+    """``core.markdown_to_pdf`` before PdfRenderer: one multi_cell per line."""
+    pdf = FPDF(unit="pt", format="A4")
+    pdf.set_auto_page_break(auto=True, margin=54)
+    pdf.add_page()
+
+    def normalize_text(text: str) -> str:
+        replacements = {
+            "–": "-",
+            "—": "--",
+            "•": "-",
+            "→": "->",
+            "←": "<-",
+            "“": '"',
+            "”": '"',
+            "‘": "'",
+            "’": "'",
+            "‑": "-",
+            "\u00a0": " ",
+        }
+        for src, dst in replacements.items():
+            text = text.replace(src, dst)
+        return text
+
+    def break_long_words(text: str, max_len: int = 60) -> str:
+        parts = []
+        for token in text.split(" "):
+            if len(token) <= max_len:
+                parts.append(token)
+                continue
+            chunks = [token[i : i + max_len] for i in range(0, len(token), max_len)]
+            parts.append(" ".join(chunks))
+        return " ".join(parts)
+
+    def write_line(text: str, size: int, bold: bool = False, indent: int = 0) -> None:
+        # Use enums when available to satisfy type-checkers; fall back to strings for older fpdf2 versions
+        try:
+            from fpdf.enums import WrapMode, XPos, YPos  # type: ignore
+
+            new_x_val = XPos.LMARGIN
+            new_y_val = YPos.NEXT
+            wrap_mode_val = WrapMode.CHAR
+        except Exception:
+            new_x_val = "LMARGIN"
+            new_y_val = "NEXT"
+            wrap_mode_val = "CHAR"
+
+        pdf.set_font("Helvetica", style="B" if bold else "", size=size)
+        if indent:
+            pdf.set_x(pdf.l_margin + indent)
+        safe_text = normalize_text(break_long_words(text))
+        pdf.multi_cell(
+            0,
+            size + 6,
+            safe_text,
+            new_x=new_x_val,
+            new_y=new_y_val,
+            wrapmode=wrap_mode_val,
+        )
+
+    lines = markdown_text.splitlines()
+    for line in lines:
+        if not line.strip():
+            pdf.ln(6)
+            continue
+        if line.startswith("# "):
+            write_line(line[2:].strip(), size=18, bold=True)
+        elif line.startswith("## "):
+            write_line(line[3:].strip(), size=14, bold=True)
+        elif line.startswith("### "):
+            write_line(line[4:].strip(), size=12, bold=True)
+        elif line.startswith("- "):
+            write_line(f"- {line[2:].strip()}", size=11, indent=10)
+        else:
+            write_line(line.strip(), size=11)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    pdf.output(str(output_path))
@@ -0,0 +1,223 @@
+"""Local stand-in for the OpenAI chat-completions API and job pages.
+
+Run standalone with ``python -m benchmarks.fake_openai --port 8900`` and
+point ``OPENAI_BASE_URL`` at ``http://127.0.0.1:8900/v1``.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import seeds
+
+Responder = Callable[[str], str]
+
+
+def default_responder(prompt: str) -> str:
+    """Canned replies keyed on the pipeline's prompt wording."""
+    if prompt.startswith("Extract candidate data"):
+        return json.dumps(seeds.candidate_json())
+    if prompt.startswith("Extract a structured job target"):
+        return seeds.fenced_json(seeds.job_json(seeds.job_ref(prompt)))
+    if prompt.startswith("Using job JSON and candidate JSON"):
+        return seeds.mapping_markdown()
+    if prompt.startswith("Create an ATS-optimised CV"):
+        return seeds.seed_cv_markdown()
+    if prompt.startswith("Audit the CV"):
+        return json.dumps(
+            {
+                "missing_keywords": ["systematic trading", "pandas"],
+                "formatting_risks": [],
+                "proposed_edits": ["Mention pandas alongside Python."],
+                "revised_cv": seeds.seed_cv_markdown(),
+            }
+        )
+    if prompt.startswith("Write a 250-350 word cover letter"):
+        return seeds.seed_cover_letter_markdown()
+    return "OK"
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server answering ``/v1/chat/completions`` and ``/jobs/<n>``.
+
+    Each completion waits ``latency`` seconds (plus up to ``jitter``) before
+    the first byte; streamed replies are split into ``stream_chunks`` deltas
+    ``chunk_delay`` seconds apart. Usage is reported at ~4 characters a token.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        stream_chunks: int = 20,
+        chunk_delay: float = 0.0,
+        responder: Responder = default_responder,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.stream_chunks = stream_chunks
+        self.chunk_delay = chunk_delay
+        self.responder = responder
+        self.requests = 0
+        self.page_requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/v1"
+
+    def job_url(self, ref: int) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/jobs/{ref}"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, content_type: str, data: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:  # noqa: N802
+                if not self.path.startswith("/jobs/"):
+                    self._send(404, "text/plain", b"not found")
+                    return
+                server._count("page_requests")
+                ref = int(self.path.rsplit("/", 1)[1] or 0)
+                self._send(200, "text/html; charset=utf-8", seeds.job_page_html(ref).encode())
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.endswith("/chat/completions"):
+                    self._send(404, "application/json", b'{"error": "not found"}')
+                    return
+                server._count("requests")
+
+                prompt = request.get("messages", [{}])[-1].get("content", "")
+                text = server.responder(prompt)
+                usage = {
+                    "prompt_tokens": sum(
+                        len(m.get("content", "")) for m in request.get("messages", [])
+                    )
+                    // 4,
+                    "completion_tokens": len(text) // 4,
+                    "prompt_tokens_details": {"cached_tokens": 0},
+                }
+                usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+                time.sleep(server.latency + random.uniform(0, server.jitter))
+
+                if request.get("stream"):
+                    self._stream(request.get("model", ""), text, usage)
+                    return
+                body = {
+                    "id": "chatcmpl-bench",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", ""),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+                self._send(200, "application/json", json.dumps(body).encode())
+
+            def _stream(self, model: str, text: str, usage: Dict[str, Any]) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def chunk(choices: List[Dict[str, Any]], **extra: Any) -> None:
+                    payload = {
+                        "id": "chatcmpl-bench",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": choices,
+                        **extra,
+                    }
+                    self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode())
+
+                size = max(1, -(-len(text) // max(server.stream_chunks, 1)))
+                for start in range(0, len(text), size):
+                    chunk([{"index": 0, "delta": {"content": text[start : start + size]}}])
+                    if server.chunk_delay:
+                        time.sleep(server.chunk_delay)
+                chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+                chunk([], usage=usage)
+                self._write_chunk(b"data: [DONE]\n\n")
+                self._write_chunk(b"")
+
+            def _write_chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake OpenAI chat-completions API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds before each reply")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, seconds")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(
+        latency=args.latency, jitter=args.jitter, host=args.host, port=args.port
+    )
+    print(f"Fake OpenAI API at {server.base_url} (job pages at {server.job_url(1)})")
+    try:
+        server.start()._thread.join()  # type: ignore[union-attr]
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""Run the offline benchmark suite and write the results as JSON.
+
+    python -m benchmarks.run                      # 1, 10 and 100 jobs + micro
+    python -m benchmarks.run --jobs 1 10 --skip-micro --latency 0.2
+
+End-to-end runs talk to a local FakeOpenAIServer, which also serves the job
+pages, so no network access or API key is needed.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pypdf import PdfReader
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from job_tailor import core  # noqa: E402
+from job_tailor.core import (  # noqa: E402
+    DEFAULT_MAX_CONCURRENCY,
+    STAGE_JSON_OMIT,
+    build_stage_prompt,
+    extract_job_text,
+    extract_text_from_html,
+    markdown_to_pdf,
+    parse_json_response,
+    tailor_documents,
+)
+from job_tailor.fetching import JobFetcher  # noqa: E402
+from job_tailor.job_text import estimate_tokens  # noqa: E402
+from job_tailor.manifest import MANIFEST_FILENAME  # noqa: E402
+from job_tailor.multipart import parse_multipart  # noqa: E402
+from job_tailor.pdf_renderer import PdfRenderer  # noqa: E402
+
+from . import seeds  # noqa: E402
+from .baselines import legacy_build_stage_prompt, legacy_markdown_to_pdf  # noqa: E402
+from .fake_openai import FakeOpenAIServer  # noqa: E402
+
+DEFAULT_JOB_COUNTS = (1, 10, 100)
+DEFAULT_ITERATIONS = 50
+DEFAULT_PDF_CVS = 100
+RESULTS_DIR = ROOT_DIR / "benchmarks" / "results"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summary_ms(samples: List[float]) -> Dict[str, float]:
+    ms = [s * 1000 for s in samples]
+    return {
+        "iterations": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "min_ms": round(min(ms), 3),
+        "p95_ms": round(_percentile(ms, 95), 3),
+    }
+
+
+def time_call(func: Callable[[], Any], iterations: int, warmup: int = 2) -> Dict[str, float]:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return _summary_ms(samples)
+
+
+def run_micro(iterations: int, work_dir: Path) -> Dict[str, Dict[str, Any]]:
+    cv_md = seeds.seed_cv_markdown()
+    page = seeds.job_page_html(1)
+    candidate_raw = seeds.fenced_json(seeds.candidate_json())
+    form = seeds.multipart_body()
+    upload_dir = work_dir / "uploads"
+    pdf_path = work_dir / "micro_cv.pdf"
+
+    def parse_form() -> None:
+        body = form["body"]
+        _, files = parse_multipart(io.BytesIO(body), form["content_type"], len(body), upload_dir)
+        for info in files.values():
+            info["path"].unlink()
+
+    results = {
+        "markdown_to_pdf": time_call(lambda: markdown_to_pdf(cv_md, pdf_path), iterations),
+        "extract_text_from_html": time_call(lambda: extract_text_from_html(page), iterations),
+        "extract_job_text": time_call(lambda: extract_job_text(page, "https://www.linkedin.com/jobs/view/1"), iterations),
+        "parse_json_response": time_call(lambda: parse_json_response(candidate_raw), iterations),
+        "parse_multipart": time_call(parse_form, iterations),
+    }
+    results["markdown_to_pdf"]["input_chars"] = len(cv_md)
+    results["extract_text_from_html"]["input_bytes"] = len(page)
+    results["extract_job_text"]["input_bytes"] = len(page)
+    results["parse_json_response"]["input_chars"] = len(candidate_raw)
+    results["parse_multipart"]["input_bytes"] = len(form["body"])
+    tracemalloc.start()
+    parse_form()
+    results["parse_multipart"]["peak_alloc_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return results
+
+
+def _page_contents(path: Path) -> List[bytes]:
+    return [page.get_contents().get_data() for page in PdfReader(str(path)).pages]
+
+
+def run_pdf_comparison(cv_count: int, work_dir: Path) -> Dict[str, Any]:
+    """Render ``cv_count`` CVs with the legacy function and one PdfRenderer.
+
+    Page content streams are compared too (file bytes differ by timestamp).
+    """
+    cvs = seeds.cv_variants(cv_count)
+    legacy_dir = work_dir / "pdf_legacy"
+    renderer_dir = work_dir / "pdf_renderer"
+
+    start = time.perf_counter()
+    for index, cv_md in enumerate(cvs):
+        legacy_markdown_to_pdf(cv_md, legacy_dir / f"{index}.pdf")
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    renderer = PdfRenderer()
+    for index, cv_md in enumerate(cvs):
+        renderer.render_to_file(cv_md, renderer_dir / f"{index}.pdf")
+    renderer_seconds = time.perf_counter() - start
+
+    mismatches = sum(
+        _page_contents(legacy_dir / f"{index}.pdf") != _page_contents(renderer_dir / f"{index}.pdf")
+        for index in range(cv_count)
+    )
+    return {
+        "cvs": cv_count,
+        "input_chars": sum(len(cv_md) for cv_md in cvs),
+        "legacy_seconds": round(legacy_seconds, 3),
+        "renderer_seconds": round(renderer_seconds, 3),
+        "speedup": round(legacy_seconds / renderer_seconds, 2),
+        "content_mismatches": mismatches,
+    }
+
+
+def run_prompt_comparison() -> Dict[str, Any]:
+    """Size of each LLM stage prompt before and after the per-stage JSON projections."""
+    candidate = seeds.candidate_json()
+    job = seeds.job_json("BENCH-0")
+    results = {
+        "candidate": (candidate, json.dumps(candidate, indent=2)),
+        "job": (job, json.dumps(job, indent=2)),
+        "mapping": seeds.mapping_markdown(),
+        "cv_draft": seeds.seed_cv_markdown(),
+    }
+    stages: Dict[str, Any] = {}
+    for stage in STAGE_JSON_OMIT:
+        legacy = legacy_build_stage_prompt(stage, results, 0.2)[0]
+        current = build_stage_prompt(stage, results, "", "", 0.2)[0]
+        legacy_tokens, tokens = estimate_tokens(legacy), estimate_tokens(current)
+        stages[stage] = {
+            "legacy_chars": len(legacy),
+            "chars": len(current),
+            "legacy_tokens": legacy_tokens,
+            "tokens": tokens,
+            "saved_pct": round(100 * (1 - tokens / legacy_tokens), 1),
+        }
+    legacy_total = sum(stage["legacy_tokens"] for stage in stages.values())
+    total = sum(stage["tokens"] for stage in stages.values())
+    return {
+        "stages": stages,
+        "legacy_tokens": legacy_total,
+        "tokens": total,
+        "saved_pct": round(100 * (1 - total / legacy_total), 1),
+    }
+
+
+def run_end_to_end(
+    server: FakeOpenAIServer,
+    job_count: int,
+    work_dir: Path,
+    max_concurrency: int,
+    make_pdf: bool,
+) -> Dict[str, Any]:
+    cv_path = work_dir / "cv.md"
+    cv_path.write_text(seeds.seed_cv_markdown(), encoding="utf-8")
+    out_dir = work_dir / f"e2e_{job_count}"
+    # Each run should pay for its own candidate parse.
+    core._candidate_cache.clear()
+    requests_before = server.requests
+
+    start = time.perf_counter()
+    created = tailor_documents(
+        cv_file=cv_path,
+        job_urls=[server.job_url(ref) for ref in range(1, job_count + 1)],
+        out_dir=out_dir,
+        model="bench-model",
+        make_pdf=make_pdf,
+        verbose=False,
+        max_concurrency=max_concurrency,
+        fetcher=JobFetcher(
+            max_concurrency=max_concurrency,
+            per_host_concurrency=max_concurrency,
+            per_host_delay=0.0,
+        ),
+    )
+    wall = time.perf_counter() - start
+
+    manifests = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in created
+        if path.name == MANIFEST_FILENAME
+    ]
+    latencies = [m["wall_seconds"] for m in manifests]
+    return {
+        "jobs": job_count,
+        "wall_seconds": round(wall, 3),
+        "jobs_per_second": round(job_count / wall, 3),
+        "job_latency_p50_seconds": round(_percentile(latencies, 50), 3),
+        "job_latency_p95_seconds": round(_percentile(latencies, 95), 3),
+        "job_latency_max_seconds": round(max(latencies), 3),
+        "llm_requests": server.requests - requests_before,
+        "prompt_tokens": sum(m["totals"]["prompt_tokens"] for m in manifests),
+        "completion_tokens": sum(m["totals"]["completion_tokens"] for m in manifests),
+        "files_created": len(created),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the offline job_tailor benchmarks.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_JOB_COUNTS),
+        help="Job counts for end-to-end runs (default: 1 10 100)",
+    )
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake API latency per call, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random fake API latency, seconds")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF rendering in end-to-end runs")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Microbenchmark iterations")
+    parser.add_argument("--skip-e2e", action="store_true")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument(
+        "--pdf-cvs",
+        type=int,
+        default=DEFAULT_PDF_CVS,
+        help="CVs rendered by the legacy vs PdfRenderer comparison (0 to skip)",
+    )
+    parser.add_argument(
+        "--output",
+        help="Results JSON path (default: benchmarks/results/<timestamp>.json)",
+    )
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "max_concurrency": args.max_concurrency,
+            "make_pdf": not args.no_pdf,
+            "iterations": args.iterations,
+            "pdf_cvs": args.pdf_cvs,
+        },
+    }
+
+    with tempfile.TemporaryDirectory(prefix="job_tailor_bench_") as tmp:
+        work_dir = Path(tmp)
+        if not args.skip_micro:
+            results["micro"] = run_micro(args.iterations, work_dir)
+            for name, stats in results["micro"].items():
+                print(f"[micro] {name}: median {stats['median_ms']} ms, p95 {stats['p95_ms']} ms")
+
+        prompts = results["prompt_tokens"] = run_prompt_comparison()
+        for stage, sizes in prompts["stages"].items():
+            print(
+                f"[prompt] {stage}: {sizes['legacy_tokens']} -> {sizes['tokens']} tokens "
+                f"(-{sizes['saved_pct']}%)"
+            )
+        print(
+            f"[prompt] all stages: {prompts['legacy_tokens']} -> {prompts['tokens']} tokens "
+            f"(-{prompts['saved_pct']}%)"
+        )
+
+        if args.pdf_cvs > 0:
+            pdf = results["pdf_renderer"] = run_pdf_comparison(args.pdf_cvs, work_dir)
+            print(
+                f"[pdf] {pdf['cvs']} CVs: legacy {pdf['legacy_seconds']} s, "
+                f"PdfRenderer {pdf['renderer_seconds']} s ({pdf['speedup']}x), "
+                f"{pdf['content_mismatches']} content mismatches"
+            )
+
+        if not args.skip_e2e:
+            results["end_to_end"] = []
+            with FakeOpenAIServer(latency=args.latency, jitter=args.jitter) as server:
+                os.environ["OPENAI_API_KEY"] = "benchmark"
+                os.environ["OPENAI_BASE_URL"] = server.base_url
+                for job_count in args.jobs:
+                    run = run_end_to_end(
+                        server, job_count, work_dir, args.max_concurrency, not args.no_pdf
+                    )
+                    results["end_to_end"].append(run)
+                    print(
+                        f"[e2e] {job_count} jobs: {run['wall_seconds']} s, "
+                        f"{run['jobs_per_second']} jobs/s, p95 job {run['job_latency_p95_seconds']} s"
+                    )
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{time.strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,238 @@
+"""Realistic benchmark inputs built from the sample files under ``outputs/``."""
+
+import html
+import json
+import re
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+OUTPUTS_DIR = ROOT_DIR / "outputs"
+CV_PDF = ROOT_DIR / "Rene_Jean-Marie_CV.pdf"
+
+FALLBACK_CV = """# Candidate Name
+London | candidate@example.com
+
+## Professional Summary
+Quantitative developer with experience building pricing models in Python and C++.
+
+## Experience
+- Built time-series models for risk-reward calibration.
+- Automated data pipelines and reporting.
+"""
+
+JOB_DESCRIPTION = """About the job
+Our client, a systematic trading firm, is hiring a Quantitative Analyst (reference {ref}).
+Responsibilities
+- Research, build and maintain systematic trading strategies across futures and FX.
+- Develop high-performance pricing and risk models in Python and C++.
+- Analyse large time-series datasets and automate the research workflow.
+- Work with traders and engineers to take models from prototype to production.
+Requirements
+- Degree in Mathematics, Physics, Computer Science or a related field.
+- Strong Python and C++ skills; experience with pandas and NumPy.
+- Solid grounding in statistics, stochastic processes and time-series analysis.
+- Clear communication with technical and non-technical stakeholders.
+Nice to have
+- Experience with market microstructure or execution research.
+- Familiarity with Git, CI and Linux environments.
+Benefits
+- Competitive base salary and performance bonus.
+- Hybrid working from the London office.
+"""
+
+
+def _read_first(pattern: str, fallback: str) -> str:
+    for path in sorted(OUTPUTS_DIR.glob(pattern)):
+        text = path.read_text(encoding="utf-8")
+        if text.strip():
+            return text
+    return fallback
+
+
+def seed_cv_markdown() -> str:
+    return _read_first("*/*_cv.md", FALLBACK_CV)
+
+
+def seed_cover_letter_markdown() -> str:
+    return _read_first("*/*_cover_letter.md", FALLBACK_CV)
+
+
+def cv_variants(count: int) -> List[str]:
+    """``count`` distinct CVs: the sample CVs and cover letters, re-ordered and trimmed.
+
+    Every third one also carries soft hyphens and non-breaking spaces.
+    """
+    sources = [
+        path.read_text(encoding="utf-8")
+        for pattern in ("*/*_cv.md", "*/*_cover_letter.md")
+        for path in sorted(OUTPUTS_DIR.glob(pattern))
+    ]
+    sources = [text for text in sources if text.strip()] or [FALLBACK_CV]
+    variants = []
+    for index in range(count):
+        lines = sources[index % len(sources)].splitlines()
+        bullets = [i for i, line in enumerate(lines) if line.startswith("- ")]
+        if bullets:
+            # Rotate the bullets and drop a few so no two CVs wrap identically.
+            rotated = bullets[index % len(bullets) :] + bullets[: index % len(bullets)]
+            keep = rotated[: max(1, len(rotated) - index % 4)]
+            lines = [line for i, line in enumerate(lines) if i not in bullets or i in keep]
+        text = "\n".join(lines + [f"Reference: BENCH-{index}"])
+        if index % 3 == 1:
+            # Soft hyphens in long words and non-breaking spaces, as text
+            # pasted from word processors carries.
+            text = re.sub(r"\b(\w{5})(\w{4,})", "\\1\u00ad\\2", text)
+            text = re.sub(r"(\d) (\w)", "\\1\u00a0\\2", text).replace(" | ", "\u00a0|\u00a0")
+        variants.append(text)
+    return variants
+
+
+def seed_page_chrome() -> List[str]:
+    """Navigation, cookie banner and sidebar lines from a captured job page."""
+    text = _read_first("*/*_analysis.md", "")
+    _, _, preview = text.partition("## Job posting preview")
+    lines = [line.strip() for line in preview.splitlines() if line.strip()]
+    return lines or ["Sign in", "Jobs", "People", "Learning", "Accept", "Reject"]
+
+
+def job_page_html(ref: int) -> str:
+    """A LinkedIn-style job page: chrome, description container, similar jobs."""
+    chrome = seed_page_chrome()
+    nav = "\n".join(f"<li><a href='#'>{html.escape(line)}</a></li>" for line in chrome)
+    description = JOB_DESCRIPTION.format(ref=f"BENCH-{ref}")
+    body = []
+    for line in description.splitlines():
+        if line.startswith("- "):
+            body.append(f"<li>{html.escape(line[2:])}</li>")
+        elif len(line.split()) <= 3:
+            body.append(f"<h3>{html.escape(line)}</h3>")
+        else:
+            body.append(f"<p>{html.escape(line)}</p>")
+    similar = "\n".join(
+        f"<li class='job-card'><a href='/jobs/{ref + i}'>Quantitative Analyst {i}</a>"
+        f"<span>London Area, United Kingdom</span><time>{i} days ago</time></li>"
+        for i in range(1, 40)
+    )
+    scripts = "\n".join(
+        f"<script>window.__tracking_{i} = {json.dumps({'event': 'view', 'slot': i} )};</script>"
+        for i in range(30)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><title>Quantitative Analyst | LinkedIn</title>
+<style>body {{ font-family: sans-serif; }} .nav li {{ display: inline; }}</style>
+{scripts}
+</head><body>
+<header><ul class="nav">{nav}</ul></header>
+<main>
+<h1 class="top-card-layout__title">Quantitative Analyst</h1>
+<a class="topcard__org-name-link" href="#">Bench Capital {ref}</a>
+<span class="topcard__flavor topcard__flavor--bullet">London Area, United Kingdom</span>
+<div class="description__text">
+<div class="show-more-less-html__markup">
+{"".join(body)}
+</div></div>
+<section><h2>Similar jobs</h2><ul>{similar}</ul></section>
+</main>
+<footer><ul>{nav}</ul><p>LinkedIn Corporation © 2025</p></footer>
+</body></html>"""
+
+
+def candidate_json() -> Dict[str, object]:
+    cv = seed_cv_markdown()
+    bullets = [line[2:].strip() for line in cv.splitlines() if line.startswith("- ")]
+    return {
+        "contact": {"name": "Rene Jean-Marie", "location": "London"},
+        "summary": next((ln.strip() for ln in cv.splitlines() if len(ln) > 120), ""),
+        "skills": {
+            "programming": ["Python", "C++", "Java"],
+            "quant": ["Stochastic Processes", "Markov Chains", "Time-Series Analysis"],
+            "data": ["Statistical Modelling", "Predictive Analytics"],
+            "tools": ["GitHub", "JIRA", "Confluence"],
+        },
+        "experience": [
+            {
+                "company": "RAWiGaming",
+                "title": "Quantitative Game Mathematician",
+                "dates": "May 2024 - Present",
+                "bullets": bullets[:6],
+            },
+            {
+                "company": "Push Gaming",
+                "title": "Junior Games Mathematician",
+                "dates": "May 2023 - Dec 2023",
+                "bullets": bullets[6:12],
+            },
+        ],
+        "education": ["BSc Mathematics, University of Warwick (First Class)"],
+        "leadership": [],
+    }
+
+
+def job_json(ref: str) -> Dict[str, object]:
+    return {
+        "title": "Quantitative Analyst",
+        "company": f"Bench Capital {ref}",
+        "location": "London Area, United Kingdom",
+        "responsibilities": [
+            line[2:] for line in JOB_DESCRIPTION.splitlines()[3:7]
+        ],
+        "must_have": ["Python", "C++", "statistics", "time-series analysis"],
+        "nice_to_have": ["market microstructure", "Git"],
+        "tools": ["Python", "C++", "pandas", "NumPy", "Git"],
+        "keywords_ranked": ["systematic trading", "Python", "C++", "time-series"],
+    }
+
+
+def mapping_markdown() -> str:
+    rows = [
+        ("Python", "Data-driven modelling in Python", "High"),
+        ("C++", "C++ mathematical models", "High"),
+        ("Time-series analysis", "Time-series analysis to optimise performance", "High"),
+        ("Systematic trading", "Quantitative reasoning, no direct trading", "Med"),
+    ]
+    lines = ["| Requirement | Evidence | Confidence |", "| --- | --- | --- |"]
+    lines.extend(f"| {a} | {b} | {c} |" for a, b, c in rows)
+    return "\n".join(lines)
+
+
+def fenced_json(data: Dict[str, object]) -> str:
+    return "```json\n" + json.dumps(data, indent=2) + "\n```"
+
+
+def multipart_body(boundary: str = "----benchmarkboundary") -> Dict[str, object]:
+    """The UI's run form: a CV upload plus the usual text fields."""
+    fields = {
+        "job_source": "text",
+        "job_url": "",
+        "job_text": JOB_DESCRIPTION.format(ref="BENCH-0"),
+        "include_cover_letter": "true",
+        "make_pdf": "true",
+        "debug_artifacts": "false",
+        "quiet": "false",
+        "dry_run": "false",
+        "model": "gpt-5-mini",
+        "temperature": "0.2",
+    }
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"{name}\"\r\n\r\n{value}\r\n".encode()
+        )
+    cv_bytes = CV_PDF.read_bytes() if CV_PDF.exists() else seed_cv_markdown().encode()
+    parts.append(
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"cv_file\"; "
+        f"filename=\"{CV_PDF.name}\"\r\nContent-Type: application/pdf\r\n\r\n".encode()
+        + cv_bytes
+        + b"\r\n"
+    )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return {
+        "content_type": f"multipart/form-data; boundary={boundary}",
+        "body": b"".join(parts),
+    }
+
+
+def job_ref(prompt: str) -> str:
+    match = re.search(r"BENCH-(\d+)", prompt)
+    return match.group(1) if match else "0"
@@ -1,5 +1,17 @@
 """Job Tailor package."""
 
-from .core import create_cv_only, tailor_documents
+from .core import (
+    aprocess_job,
+    atailor_documents,
+    create_cv_only,
+    parse_candidate_cv,
+    tailor_documents,
+)
 
-__all__ = ["create_cv_only", "tailor_documents"]
+__all__ = [
+    "aprocess_job",
+    "atailor_documents",
+    "create_cv_only",
+    "parse_candidate_cv",
+    "tailor_documents",
+]
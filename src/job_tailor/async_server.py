@@ -0,0 +1,309 @@
+"""Asyncio HTTP/1.1 front end for the UI server with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import signal
+import sys
+import traceback
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Callable, Coroutine
+
+DEFAULT_MAX_CONCURRENT = 32
+DEFAULT_KEEPALIVE_SECONDS = 15.0
+DEFAULT_DRAIN_SECONDS = 30.0
+BUSY_RETRY_AFTER = 2
+MAX_HEAD_BYTES = 64 * 1024
+# Unread request bodies up to this size are skipped so the connection can be reused.
+MAX_DISCARD_BYTES = 64 * 1024
+IO_TIMEOUT_SECONDS = 60.0
+# After a rejection, how long to read (and drop) the unread body before closing,
+# so the client sees the response rather than a connection reset.
+LINGER_SECONDS = 2.0
+
+HandlerFactory = Callable[[Any, Any, "_RequestReader", "_ResponseWriter"], BaseHTTPRequestHandler]
+
+
+def _call_in_loop(coro: Coroutine[Any, Any, Any], loop: asyncio.AbstractEventLoop) -> Any:
+    """Run ``coro`` on ``loop`` from a handler thread and wait for its result.
+
+    A handler still running after the drain timeout finds the loop closed
+    (or its call cancelled); both surface as a dropped connection.
+    """
+    try:
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+    except RuntimeError:
+        coro.close()
+        raise ConnectionResetError("The server has shut down.") from None
+    try:
+        return future.result(IO_TIMEOUT_SECONDS)
+    except concurrent.futures.CancelledError:
+        raise ConnectionResetError("The server has shut down.") from None
+
+
+class _RequestReader:
+    """Blocking file-like view of a connection for a handler thread.
+
+    The request head has already been read by the event loop; body reads
+    are forwarded to the connection's StreamReader. Only as many bytes as
+    the handler asks for are taken, so a pipelined next request stays
+    buffered for the connection.
+    """
+
+    def __init__(self, head: bytes, reader: asyncio.StreamReader, loop: asyncio.AbstractEventLoop) -> None:
+        self._head = head
+        self._pos = 0
+        self._reader = reader
+        self._loop = loop
+        self.body_read = 0
+
+    def readline(self, limit: int = -1) -> bytes:
+        end = self._head.find(b"\n", self._pos)
+        end = len(self._head) if end < 0 else end + 1
+        if limit >= 0:
+            end = min(end, self._pos + limit)
+        line = self._head[self._pos : end]
+        self._pos = end
+        return line
+
+    def read(self, size: int = -1) -> bytes:
+        if self._pos < len(self._head):
+            end = len(self._head) if size < 0 else self._pos + size
+            data = self._head[self._pos : end]
+            self._pos += len(data)
+            return data
+        if size == 0:
+            return b""
+        data = _call_in_loop(self._reader.read(size), self._loop)
+        self.body_read += len(data)
+        return data
+
+
+class _ResponseWriter:
+    """Blocking file-like writer that hands data to the event loop."""
+
+    def __init__(self, writer: asyncio.StreamWriter, loop: asyncio.AbstractEventLoop) -> None:
+        self._writer = writer
+        self._loop = loop
+
+    async def _send(self, data: bytes) -> None:
+        if self._writer.is_closing():
+            raise ConnectionResetError("Connection closed by the server.")
+        self._writer.write(data)
+        await self._writer.drain()
+
+    def write(self, data: bytes) -> int:
+        _call_in_loop(self._send(bytes(data)), self._loop)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _handle_request(handler: BaseHTTPRequestHandler, rfile: _RequestReader) -> bool:
+    """Run one request through ``handler``; True if the connection can take another."""
+    handler.close_connection = True
+    try:
+        handler.handle_one_request()
+    except (ConnectionError, TimeoutError):
+        return False
+    except Exception:  # noqa: BLE001
+        sys.stderr.write(f"Exception while handling a request from {handler.client_address}\n")
+        traceback.print_exc()
+        return False
+    if handler.close_connection or getattr(handler, "request_version", "") != "HTTP/1.1":
+        return False
+    headers = getattr(handler, "headers", None)
+    if headers is None or headers.get("Transfer-Encoding"):
+        return False
+    length = headers.get("Content-Length", "0")
+    if not length.isdigit():
+        return False
+    unread = int(length) - rfile.body_read
+    if unread > MAX_DISCARD_BYTES:
+        return False
+    while unread > 0:
+        chunk = rfile.read(unread)
+        if not chunk:
+            return False
+        unread -= len(chunk)
+    return True
+
+
+class AsyncHttpServer:
+    """Serve a BaseHTTPRequestHandler's routes from an asyncio event loop.
+
+    Connections are read by the event loop, so idle keep-alive connections
+    cost no thread. Requests run on a pool of ``max_concurrent`` handler
+    threads; a request beyond that gets 429 with Retry-After straight from
+    the loop. ``handler_factory`` builds a
+    handler for one request from ``(server, client_address, rfile, wfile)``,
+    where ``server`` is the object handlers read their settings from.
+
+    On SIGINT or SIGTERM the listener is closed, idle connections are
+    dropped, and in-flight requests get up to ``drain_timeout`` seconds to
+    finish. Requests arriving meanwhile on open connections get 503. The
+    pool is then shut down; a handler still running after the timeout sees
+    its connection as closed on its next read or write.
+    """
+
+    def __init__(
+        self,
+        handler_factory: HandlerFactory,
+        server: Any,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_SECONDS,
+        drain_timeout: float = DEFAULT_DRAIN_SECONDS,
+    ) -> None:
+        self.handler_factory = handler_factory
+        self.server = server
+        self.max_concurrent = max(1, max_concurrent)
+        self.keepalive_timeout = keepalive_timeout
+        self.drain_timeout = drain_timeout
+        self.active = 0
+        self.draining = False
+        self._idle: set[asyncio.StreamWriter] = set()
+        self._finished: asyncio.Event | None = None
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    async def serve(self, host: str, port: int, on_ready: Callable[[], None] | None = None) -> None:
+        """Serve until SIGINT/SIGTERM, then drain in-flight requests."""
+        loop = asyncio.get_running_loop()
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="ui-request"
+        )
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        listener = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_HEAD_BYTES)
+        if on_ready is not None:
+            on_ready()
+        try:
+            await stop.wait()
+        finally:
+            listener.close()
+            await self.drain()
+
+    async def drain(self) -> bool:
+        """Stop taking requests and wait for in-flight ones; False on timeout."""
+        self.draining = True
+        for writer in list(self._idle):
+            writer.close()
+        if self.active:
+            print(f"Waiting up to {self.drain_timeout:g}s for {self.active} in-flight request(s)...")
+        assert self._finished is not None and self._executor is not None
+        try:
+            await asyncio.wait_for(self._finished.wait(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            print(f"Stopped with {self.active} request(s) still running.")
+            return False
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        return True
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client_address = writer.get_extra_info("peername") or ("", 0)
+        try:
+            while not self.draining:
+                self._idle.add(writer)
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+                except asyncio.LimitOverrunError:
+                    await self._reject(
+                        reader, writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request head is too large."
+                    )
+                    return
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                finally:
+                    self._idle.discard(writer)
+
+                if self.draining:
+                    await self._reject(
+                        reader, writer, HTTPStatus.SERVICE_UNAVAILABLE, "The server is shutting down."
+                    )
+                    return
+                if self.active >= self.max_concurrent:
+                    await self._reject(
+                        reader,
+                        writer,
+                        HTTPStatus.TOO_MANY_REQUESTS,
+                        "The server is busy; try again shortly.",
+                        retry_after=BUSY_RETRY_AFTER,
+                    )
+                    return
+                if not await self._dispatch(head, reader, writer, client_address):
+                    return
+        except asyncio.CancelledError:
+            # Connections still busy when the drain times out are cancelled
+            # by asyncio.run; end them quietly rather than as failed tasks.
+            if not self.draining:
+                raise
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _dispatch(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        client_address: Any,
+    ) -> bool:
+        """Run one request on a handler thread; True if the connection stays open."""
+        loop = asyncio.get_running_loop()
+        rfile = _RequestReader(head, reader, loop)
+        handler = self.handler_factory(self.server, client_address, rfile, _ResponseWriter(writer, loop))
+
+        self.active += 1
+        assert self._finished is not None
+        self._finished.clear()
+        try:
+            return await loop.run_in_executor(self._executor, _handle_request, handler, rfile)
+        finally:
+            self.active -= 1
+            if not self.active:
+                self._finished.set()
+
+    async def _reject(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        message: str,
+        retry_after: int | None = None,
+    ) -> None:
+        """Answer from the loop without reading the body, then close the connection."""
+        body = json.dumps({"status": "error", "message": message}).encode("utf-8")
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            "Connection: close",
+        ]
+        if retry_after is not None:
+            lines.append(f"Retry-After: {retry_after}")
+        try:
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+            await asyncio.wait_for(self._discard(reader), LINGER_SECONDS)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+
+    @staticmethod
+    async def _discard(reader: asyncio.StreamReader) -> None:
+        while await reader.read(MAX_DISCARD_BYTES):
+            pass
@@ -0,0 +1,375 @@
+"""Two-phase batch mode built on the OpenAI Batch API file format.
+
+Phase one (``prepare_batch``) writes every LLM request that can run now into
+``wave_<n>.jsonl``. After the batch has run, phase two (``ingest_batch``)
+stores each result as a stage checkpoint, writes the outputs of jobs whose
+stages are all done and emits the next wave for the rest. Each wave holds
+the stages whose dependencies finished in earlier waves:
+
+    1. candidate parse (shared by all jobs) and job parses
+    2. mapping tables
+    3. CV drafts and cover letters
+    4. ATS audits
+
+``execute_batch`` sends a batch file's requests to the chat-completions API
+directly and writes a results file in the Batch API's output format, as a
+local stand-in for testing (point ``OPENAI_BASE_URL`` at a
+fake server to run fully offline).
+
+    python -m job_tailor --cv-file cv.md --job-url ... --batch-prepare
+    python -m job_tailor.batch execute outputs/batch/wave_1.jsonl results_1.jsonl
+    python -m job_tailor --batch-ingest results_1.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .checkpoints import CheckpointStore, checkpoint_dir
+from .clients import get_async_openai_client
+from .core import (
+    DEFAULT_MAX_CONCURRENCY,
+    JSON_STAGES,
+    STAGE_DEPS,
+    aload_cv_text,
+    aload_job_texts,
+    aprocess_job,
+    build_chat_request,
+    build_stage_prompt,
+    gather_or_cancel,
+    job_stage_keys,
+    parse_json_response,
+    prepare_job_texts,
+    run_sync,
+    slugify,
+)
+from .cv_text import CvTextCache
+from .fetching import JobFetcher
+from .http_cache import HttpCache
+from .json_repair import repair_json
+from .pdf_pool import DEFAULT_PDF_WORKERS, get_pdf_executor
+
+BATCH_STATE_FILENAME = "batch_state.json"
+BATCH_ENDPOINT = "/v1/chat/completions"
+# The candidate parse is shared by every job, so it gets one request.
+CANDIDATE_ID = "candidate"
+
+
+def _load_state(batch_dir: Path) -> Dict[str, Any]:
+    path = batch_dir / BATCH_STATE_FILENAME
+    if not path.exists():
+        raise FileNotFoundError(f"No batch state in {batch_dir}; run --batch-prepare first")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_state(batch_dir: Path, state: Dict[str, Any]) -> None:
+    (batch_dir / BATCH_STATE_FILENAME).write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+
+def _stages(state: Dict[str, Any]) -> List[str]:
+    return [
+        name
+        for name in STAGE_DEPS
+        if state["include_cover_letter"] or name != "cover_letter"
+    ]
+
+
+def _job_store(state: Dict[str, Any], job: Dict[str, Any]) -> CheckpointStore:
+    return CheckpointStore(
+        checkpoint_dir(state["out_dir"], job["slug"], _job_keys(state, job)["job"])
+    )
+
+
+def _job_keys(state: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, str]:
+    return job_stage_keys(
+        state["cv_text"],
+        job["job_text"],
+        state["model"],
+        state["temperature"],
+        state["include_cover_letter"],
+    )
+
+
+def _completed(state: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
+    store = _job_store(state, job)
+    keys = _job_keys(state, job)
+    results = {}
+    for stage in _stages(state):
+        result = store.load(stage, keys[stage])
+        if result is not None:
+            results[stage] = result
+    return results
+
+
+def _request_line(
+    state: Dict[str, Any], custom_id: str, stage: str, results: Dict[str, Any], job_text: str
+) -> Dict[str, Any]:
+    prompt, temperature = build_stage_prompt(
+        stage, results, state["cv_text"], job_text, state["temperature"]
+    )
+    body = build_chat_request(state["model"], prompt, temperature, stage in JSON_STAGES)
+    return {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def write_next_wave(batch_dir: str | Path) -> Optional[Path]:
+    """Write requests for every stage whose dependencies are done.
+
+    Returns the wave file, or None when no unfinished job has a stage left
+    to request.
+    """
+    batch_dir = Path(batch_dir)
+    state = _load_state(batch_dir)
+    lines = []
+    candidate_requested = False
+    for job in state["jobs"]:
+        if job["finished"]:
+            continue
+        results = _completed(state, job)
+        for stage in _stages(state):
+            if stage in results or any(dep not in results for dep in STAGE_DEPS[stage]):
+                continue
+            if stage == "candidate":
+                if not candidate_requested:
+                    lines.append(_request_line(state, CANDIDATE_ID, stage, results, ""))
+                    candidate_requested = True
+                continue
+            custom_id = f"{job['slug']}|{stage}"
+            lines.append(_request_line(state, custom_id, stage, results, job["job_text"]))
+
+    if not lines:
+        return None
+    state["wave"] += 1
+    path = batch_dir / f"wave_{state['wave']}.jsonl"
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    _save_state(batch_dir, state)
+    return path
+
+
+async def aprepare_batch(
+    cv_file: str | Path,
+    batch_dir: str | Path,
+    job_urls: Optional[Iterable[str]] = None,
+    job_text_file: str | Path | Sequence[str | Path] | None = None,
+    out_dir: str | Path = "outputs",
+    model: str = "gpt-5-mini",
+    temperature: float = 0.2,
+    include_cover_letter: bool = True,
+    job_token_budget: Optional[int] = None,
+    fetcher: Optional[JobFetcher] = None,
+    http_cache: Optional[HttpCache] = None,
+    cv_text_cache: Optional[CvTextCache] = None,
+    offline: bool = False,
+    verbose: bool = True,
+) -> Optional[Path]:
+    """Load the CV and jobs, record the batch state and write the first wave.
+
+    Stages already checkpointed under ``out_dir`` are not requested again;
+    None is returned if nothing is left to request.
+    """
+    if not job_urls and not job_text_file:
+        raise ValueError("Provide job_urls or job_text_file")
+    batch_dir = Path(batch_dir)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    cv_text = await aload_cv_text(cv_file, cv_text_cache, verbose=verbose)
+    jobs = await aload_job_texts(job_urls or [], job_text_file, fetcher, http_cache, offline)
+    jobs = await asyncio.to_thread(prepare_job_texts, jobs, job_token_budget, verbose)
+
+    state = {
+        "model": model,
+        "temperature": temperature,
+        "include_cover_letter": include_cover_letter,
+        "out_dir": str(Path(out_dir).resolve()),
+        "cv_text": cv_text,
+        "wave": 0,
+        "jobs": [
+            {"slug": slugify(source), "source": source, "job_text": job_text, "finished": False}
+            for source, job_text in jobs
+        ],
+    }
+    _save_state(batch_dir, state)
+    return write_next_wave(batch_dir)
+
+
+def prepare_batch(*args: Any, **kwargs: Any) -> Optional[Path]:
+    """Blocking wrapper around aprepare_batch."""
+    return run_sync(aprepare_batch(*args, **kwargs))
+
+
+def _reply_content(record: Dict[str, Any]) -> Optional[str]:
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        return None
+    choices = (response.get("body") or {}).get("choices") or []
+    if not choices:
+        return None
+    return (choices[0].get("message") or {}).get("content")
+
+
+def _stage_result(stage: str, content: str) -> Any:
+    if stage not in JSON_STAGES:
+        return content
+    try:
+        parsed = parse_json_response(content)
+    except ValueError:
+        parsed = parse_json_response(repair_json(content))
+    if stage == "ats_audit":
+        return parsed
+    return [parsed, json.dumps(parsed, indent=2)]
+
+
+async def aingest_batch(
+    batch_dir: str | Path,
+    results_file: str | Path | None,
+    make_pdf: bool = True,
+    verbose: bool = True,
+    debug_artifacts: bool = True,
+    pdf_workers: int = DEFAULT_PDF_WORKERS,
+) -> Tuple[List[Path], Optional[Path]]:
+    """Store a results file's replies and advance every job.
+
+    Returns the outputs of jobs that finished and the next wave file (None
+    once every job is done). Failed or unparseable replies are requested
+    again in the next wave. With no ``results_file`` jobs are only advanced.
+    Jobs finishing together render their PDFs on ``pdf_workers`` processes.
+    """
+    batch_dir = Path(batch_dir)
+    state = _load_state(batch_dir)
+    jobs = {job["slug"]: job for job in state["jobs"]}
+    stored = failed = 0
+
+    def save(job: Dict[str, Any], stage: str, result: Any) -> None:
+        _job_store(state, job).save(stage, _job_keys(state, job)[stage], result)
+
+    lines = Path(results_file).read_text(encoding="utf-8").splitlines() if results_file else []
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record.get("custom_id", "")
+        if custom_id == CANDIDATE_ID:
+            stage, targets = "candidate", list(jobs.values())
+        else:
+            slug, _, stage = custom_id.partition("|")
+            targets = [jobs[slug]] if slug in jobs and stage in STAGE_DEPS else []
+        content = _reply_content(record)
+        if not targets or content is None:
+            failed += 1
+            continue
+        try:
+            result = _stage_result(stage, content)
+        except ValueError:
+            failed += 1
+            continue
+        for job in targets:
+            save(job, stage, result)
+        stored += 1
+
+    if verbose:
+        print(f"[batch] Stored {stored} results, {failed} failed or unusable")
+
+    ready = [
+        job
+        for job in state["jobs"]
+        if not job["finished"] and len(_completed(state, job)) == len(_stages(state))
+    ]
+    pdf_executor = get_pdf_executor(pdf_workers) if make_pdf and len(ready) > 1 else None
+    # Every stage is checkpointed, so this only writes the outputs.
+    job_paths = await gather_or_cancel(
+        aprocess_job(
+            cv_text=state["cv_text"],
+            job_text=job["job_text"],
+            out_dir=Path(state["out_dir"]),
+            slug=job["slug"],
+            model=state["model"],
+            temperature=state["temperature"],
+            dry_run=False,
+            make_pdf=make_pdf,
+            verbose=verbose,
+            debug_artifacts=debug_artifacts,
+            include_cover_letter=state["include_cover_letter"],
+            checkpoints=_job_store(state, job),
+            resume=True,
+            pdf_executor=pdf_executor,
+        )
+        for job in ready
+    )
+    created_paths = [path for paths in job_paths for path in paths]
+    for job in ready:
+        job["finished"] = True
+    _save_state(batch_dir, state)
+    return created_paths, write_next_wave(batch_dir)
+
+
+def ingest_batch(*args: Any, **kwargs: Any) -> Tuple[List[Path], Optional[Path]]:
+    """Blocking wrapper around aingest_batch."""
+    return run_sync(aingest_batch(*args, **kwargs))
+
+
+async def aexecute_batch(
+    input_file: str | Path,
+    output_file: str | Path,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> int:
+    """Run each request of a batch file and write Batch-API-style results.
+
+    Returns the number of failed requests.
+    """
+    requests = [
+        json.loads(line)
+        for line in Path(input_file).read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    client = get_async_openai_client()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(index: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "id": f"batch_req_{index}",
+            "custom_id": request["custom_id"],
+            "response": None,
+            "error": None,
+        }
+        try:
+            async with semaphore:
+                resp = await client.chat.completions.create(**request["body"])
+        except Exception as exc:  # noqa: BLE001
+            record["error"] = {"code": type(exc).__name__, "message": str(exc)}
+        else:
+            record["response"] = {
+                "status_code": 200,
+                "request_id": getattr(resp, "_request_id", None) or "",
+                "body": resp.model_dump(),
+            }
+        return record
+
+    records = await asyncio.gather(*(run(i, req) for i, req in enumerate(requests)))
+    Path(output_file).write_text(
+        "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8"
+    )
+    return sum(1 for record in records if record["error"])
+
+
+def main() -> int:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Run a batch request file locally (stand-in for the OpenAI Batch API)."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    execute = subparsers.add_parser("execute", help="Execute a batch file request by request")
+    execute.add_argument("input", help="Batch request JSONL (a wave_<n>.jsonl file)")
+    execute.add_argument("output", help="Where to write the results JSONL")
+    execute.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    failed = run_sync(aexecute_batch(args.input, args.output, args.max_concurrency))
+    print(f"Results: {args.output} ({failed} failed)", file=sys.stderr if failed else sys.stdout)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
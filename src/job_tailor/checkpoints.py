@@ -0,0 +1,130 @@
+"""Per-stage checkpoints so an interrupted job can resume where it stopped."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+CHECKPOINT_DIRNAME = ".checkpoints"
+# Bump when stage prompts or result shapes change so old checkpoints are ignored.
+CHECKPOINT_VERSION = 1
+
+
+def stage_input_keys(
+    graph: Dict[str, Sequence[str]], inputs: Dict[str, Any]
+) -> Dict[str, str]:
+    """Hash each stage's own inputs together with the keys of its dependencies.
+
+    ``graph`` maps a stage name to its dependencies and ``inputs`` holds the
+    JSON-serialisable values a stage reads besides its dependencies' results
+    (CV text, job text, model settings). A change to any input changes the
+    key of that stage and of every stage downstream of it.
+    """
+    keys: Dict[str, str] = {}
+
+    def key(stage: str) -> str:
+        if stage not in keys:
+            payload = json.dumps(
+                [
+                    CHECKPOINT_VERSION,
+                    stage,
+                    inputs.get(stage),
+                    [key(dep) for dep in graph[stage]],
+                ],
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+            keys[stage] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return keys[stage]
+
+    for stage in graph:
+        key(stage)
+    return keys
+
+
+DIGEST_CHARS = 16
+
+
+def checkpoint_dir(out_dir: str | Path, slug: str, job_key: str) -> Path:
+    """Checkpoint directory of one job: ``out_dir/.checkpoints/<slug>-<job key>``.
+
+    Only the job stage's key (job text and model) names the directory, so
+    different postings that share an output directory and slug keep apart,
+    while a CV edit finds the job's checkpoints again. Which stages are
+    still valid is left to the per-stage keys checked by ``load``.
+    """
+    return Path(out_dir) / CHECKPOINT_DIRNAME / f"{slug}-{job_key[:DIGEST_CHARS]}"
+
+
+class CheckpointStore:
+    """Stage results of one job, one JSON file per stage.
+
+    Each file records the stage's input key; ``load`` only returns a result
+    whose key matches, so edited inputs are never served stale results.
+    Files are written atomically through uniquely named temporary files,
+    so a crash mid-write leaves the previous checkpoint (or none) rather
+    than a truncated one, and concurrent writers never share a temp file.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, stage: str) -> Path:
+        return self.directory / f"{stage}.json"
+
+    def load(self, stage: str, key: str) -> Optional[Any]:
+        try:
+            record = json.loads(self._path(stage).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if record.get("inputs") != key:
+            return None
+        return record.get("result")
+
+    def save(self, stage: str, key: str, result: Any) -> None:
+        record = {"stage": stage, "inputs": key, "saved_at": time.time(), "result": result}
+        data = json.dumps(record)
+        # A concurrent run with the same inputs may clear the directory
+        # between mkdir and the write; recreate it once and retry.
+        for attempt in range(2):
+            try:
+                self._write(stage, data)
+                return
+            except FileNotFoundError:
+                if attempt:
+                    raise
+
+    def _write(self, stage: str, data: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f"{stage}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(data)
+            os.replace(tmp_name, self._path(stage))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def prune_superseded(self) -> None:
+        """Delete checkpoint directories of earlier versions of this job's text."""
+        slug, sep, digest = self.directory.name.rpartition("-")
+        if not sep or len(digest) != DIGEST_CHARS:
+            return
+        pattern = re.compile(re.escape(slug) + f"-[0-9a-f]{{{DIGEST_CHARS}}}")
+        try:
+            siblings = list(self.directory.parent.iterdir())
+        except OSError:
+            return
+        for path in siblings:
+            if path != self.directory and pattern.fullmatch(path.name):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Delete this job's checkpoints, including superseded directories."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.prune_superseded()
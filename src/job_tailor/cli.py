@@ -2,10 +2,30 @@
 """Command-line interface for job_tailor."""
 
 import argparse
+from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .core import tailor_documents
+from .batch import ingest_batch, prepare_batch
+from .clients import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+    configure_openai_client,
+)
+from .core import DEFAULT_MAX_CONCURRENCY, tailor_documents
+from .cv_text import CvTextCache
+from .fetching import (
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FETCH_RETRIES,
+    DEFAULT_PER_HOST_CONCURRENCY,
+    DEFAULT_PER_HOST_DELAY,
+    JobFetcher,
+)
+from .http_cache import DEFAULT_HTTP_CACHE_TTL, HttpCache
+from .job_text import DEFAULT_JOB_TOKEN_BUDGET
+from .llm_cache import DEFAULT_CACHE_DIR, LlmCache
+from .pdf_pool import DEFAULT_PDF_WORKERS
+from .watch import DEFAULT_WATCH_INTERVAL, watch
 
 
 def main() -> int:
@@ -19,6 +39,7 @@ def main() -> int:
             "  python -m job_tailor --cv-file /path/to/base_cv.md --job-url https://... --job-url https://...\\n"
             "  python -m job_tailor --cv-file /path/to/base_cv.md --job-text-file /path/to/job.txt\\n"
             "  python -m job_tailor --cv-file /path/to/base_cv.md --job-url https://... --cv-only\\n"
+            "  python -m job_tailor --cv-file base_cv.md --job-text-file a.txt --job-text-file b.txt --watch\\n"
         ),
     )
     parser.add_argument(
@@ -34,13 +55,45 @@ def main() -> int:
     )
     parser.add_argument(
         "--job-text-file",
-        help="Optional job posting text file (skip URL fetch)",
+        action="append",
+        help="Job posting text file (repeatable; skips URL fetch)",
     )
     parser.add_argument(
         "--out-dir",
         default="outputs",
         help="Output directory for generated files",
     )
+    parser.add_argument(
+        "--resume",
+        metavar="OUT_DIR",
+        help="Resume an interrupted run in OUT_DIR, reusing its completed stage checkpoints",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-tailor when the CV or job text files change, "
+        "recomputing only the stages whose inputs changed",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help="Seconds between checks for changed files in --watch mode",
+    )
+    parser.add_argument(
+        "--batch-prepare",
+        action="store_true",
+        help="Write the first wave of LLM requests as OpenAI Batch API JSONL instead of calling the API",
+    )
+    parser.add_argument(
+        "--batch-ingest",
+        metavar="RESULTS_JSONL",
+        help="Ingest a Batch API results file, write finished outputs and the next wave",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        help="Directory for batch request files and state (default: <out-dir>/batch)",
+    )
     parser.add_argument("--model", default="gpt-5-mini", help="OpenAI model")
     parser.add_argument("--temperature", type=float, default=0.2)
     parser.add_argument(
@@ -53,6 +106,12 @@ def main() -> int:
         action="store_true",
         help="Skip PDF generation (write Markdown outputs only)",
     )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=DEFAULT_PDF_WORKERS,
+        help="Processes rendering PDFs when tailoring several jobs (0 renders on threads)",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -68,14 +127,142 @@ def main() -> int:
         action="store_true",
         help="Generate only the CV (skip cover letter outputs)",
     )
+    parser.add_argument(
+        "--candidate-json",
+        type=Path,
+        help="Precomputed candidate JSON file (skip parsing the base CV)",
+    )
+    parser.add_argument(
+        "--llm-cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory for the on-disk LLM response cache",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Bypass the LLM response cache (always call the API)",
+    )
+    parser.add_argument(
+        "--clear-llm-cache",
+        action="store_true",
+        help="Delete all cached LLM responses before running",
+    )
+
+    parser.add_argument(
+        "--openai-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Per-request OpenAI timeout in seconds",
+    )
+    parser.add_argument(
+        "--openai-max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help="Maximum pooled HTTP connections to the OpenAI API",
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of LLM calls in flight across all jobs",
+    )
+    parser.add_argument(
+        "--job-token-budget",
+        type=int,
+        default=DEFAULT_JOB_TOKEN_BUDGET,
+        help=(
+            "Cap job text at this many estimated tokens after stripping boilerplate "
+            f"(default: {DEFAULT_JOB_TOKEN_BUDGET}; 0 for no cap)"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage time and token usage table at the end of the run",
+    )
+
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=DEFAULT_FETCH_CONCURRENCY,
+        help="Maximum number of job URLs fetched at once",
+    )
+    parser.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=DEFAULT_PER_HOST_CONCURRENCY,
+        help="Maximum concurrent fetches against the same host",
+    )
+    parser.add_argument(
+        "--per-host-delay",
+        type=float,
+        default=DEFAULT_PER_HOST_DELAY,
+        help="Minimum seconds between requests to the same host",
+    )
+    parser.add_argument(
+        "--fetch-retries",
+        type=int,
+        default=DEFAULT_FETCH_RETRIES,
+        help="Retries per job URL on transient failures",
+    )
+
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Always download job pages (skip the job page cache)",
+    )
+    parser.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=DEFAULT_HTTP_CACHE_TTL,
+        help="Seconds a cached job page is served without revalidation",
+    )
+    parser.add_argument(
+        "--no-cv-cache",
+        action="store_true",
+        help="Always extract PDF CV text (skip the CV text cache)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve job URLs from the job page cache only (no network)",
+    )
 
     args = parser.parse_args()
 
-    created_paths = tailor_documents(
+    if args.offline and args.no_http_cache:
+        parser.error("--offline requires the job page cache")
+    if args.watch and args.resume:
+        parser.error("--watch and --resume cannot be combined")
+    if args.batch_prepare and args.batch_ingest:
+        parser.error("--batch-prepare and --batch-ingest are separate phases")
+    batch_dir = Path(args.batch_dir or Path(args.out_dir) / "batch")
+    job_text_file = args.job_text_file
+    if job_text_file and len(job_text_file) == 1:
+        job_text_file = job_text_file[0]
+
+    configure_openai_client(
+        max_connections=args.openai_max_connections,
+        timeout=args.openai_timeout,
+    )
+
+    llm_cache = None
+    if args.clear_llm_cache:
+        removed = LlmCache(args.llm_cache_dir).clear()
+        print(f"Cleared {removed} cached LLM responses")
+    if not args.no_llm_cache:
+        llm_cache = LlmCache(args.llm_cache_dir)
+    http_cache = None
+    if not args.no_http_cache:
+        http_cache = HttpCache(ttl_seconds=args.http_cache_ttl)
+    cv_text_cache = None if args.no_cv_cache else CvTextCache()
+
+    tailor_kwargs = dict(
         cv_file=args.cv_file,
         job_urls=args.job_url or [],
-        job_text_file=args.job_text_file,
-        out_dir=args.out_dir,
+        job_text_file=job_text_file,
+        out_dir=args.resume or args.out_dir,
         model=args.model,
         temperature=args.temperature,
         dry_run=args.dry_run,
@@ -83,11 +270,77 @@ def main() -> int:
         verbose=not args.quiet,
         debug_artifacts=not args.no_debug_artifacts,
         include_cover_letter=not args.cv_only,
+        candidate_json=args.candidate_json,
+        llm_cache=llm_cache,
+        max_concurrency=args.max_concurrency,
+        fetcher=JobFetcher(
+            max_concurrency=args.fetch_concurrency,
+            per_host_concurrency=args.per_host_concurrency,
+            per_host_delay=args.per_host_delay,
+            retries=args.fetch_retries,
+        ),
+        http_cache=http_cache,
+        cv_text_cache=cv_text_cache,
+        offline=args.offline,
+        job_token_budget=args.job_token_budget or None,
+        profile=args.profile,
+        resume=bool(args.resume),
+        pdf_workers=args.pdf_workers,
     )
 
-    for path in created_paths:
-        print(f"Created: {path}")
+    def ingest(results_file: str | None) -> int:
+        created_paths, next_wave = ingest_batch(
+            batch_dir,
+            results_file,
+            make_pdf=not args.no_pdf,
+            verbose=not args.quiet,
+            debug_artifacts=not args.no_debug_artifacts,
+            pdf_workers=args.pdf_workers,
+        )
+        for path in created_paths:
+            print(f"Created: {path}")
+        if next_wave is not None:
+            print(f"Next batch wave: {next_wave}")
+        return 0
+
+    if args.batch_ingest:
+        return ingest(args.batch_ingest)
+
+    if args.batch_prepare:
+        wave = prepare_batch(
+            cv_file=args.cv_file,
+            batch_dir=batch_dir,
+            job_urls=args.job_url or [],
+            job_text_file=job_text_file,
+            out_dir=args.out_dir,
+            model=args.model,
+            temperature=args.temperature,
+            include_cover_letter=not args.cv_only,
+            job_token_budget=args.job_token_budget or None,
+            fetcher=tailor_kwargs["fetcher"],
+            http_cache=http_cache,
+            cv_text_cache=cv_text_cache,
+            offline=args.offline,
+            verbose=not args.quiet,
+        )
+        if wave is None:
+            print("All stages are already checkpointed; writing outputs")
+            return ingest(None)
+        print(f"Batch wave: {wave}")
+        return 0
+
+    def run(incremental: bool = False) -> None:
+        for path in tailor_documents(**tailor_kwargs, incremental=incremental):
+            print(f"Created: {path}")
+
+    if args.watch:
+        watched = [args.cv_file, *(args.job_text_file or [])]
+        if args.candidate_json:
+            watched.append(args.candidate_json)
+        watch(watched, lambda: run(incremental=True), interval=args.watch_interval)
+        return 0
 
+    run()
     return 0
 
 
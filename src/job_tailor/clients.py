@@ -0,0 +1,149 @@
+"""Process-wide registry of pooled OpenAI clients."""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from .manifest import acount_request, count_request
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_TIMEOUT = 300.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+_settings = {
+    "max_connections": DEFAULT_MAX_CONNECTIONS,
+    "max_keepalive_connections": DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    "keepalive_expiry": DEFAULT_KEEPALIVE_EXPIRY,
+    "timeout": DEFAULT_TIMEOUT,
+    "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+}
+_ClientKey = Tuple[Optional[str], Optional[str]]
+
+_clients: Dict[_ClientKey, OpenAI] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def configure_openai_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+) -> None:
+    """Update pool limits and timeouts; call before starting any API work.
+
+    Existing clients are closed and rebuilt lazily with the new settings.
+    """
+    updates = {
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+        "timeout": timeout,
+        "connect_timeout": connect_timeout,
+    }
+    with _lock:
+        _settings.update({k: v for k, v in updates.items() if v is not None})
+        _close_all_locked()
+
+
+def _pool_settings() -> Tuple[httpx.Limits, httpx.Timeout]:
+    limits = httpx.Limits(
+        max_connections=_settings["max_connections"],
+        max_keepalive_connections=_settings["max_keepalive_connections"],
+        keepalive_expiry=_settings["keepalive_expiry"],
+    )
+    timeout = httpx.Timeout(
+        _settings["timeout"], connect=_settings["connect_timeout"]
+    )
+    return limits, timeout
+
+
+def _client_key() -> _ClientKey:
+    return os.environ.get("OPENAI_API_KEY"), os.environ.get("OPENAI_BASE_URL")
+
+
+def _build_client() -> OpenAI:
+    limits, timeout = _pool_settings()
+    return OpenAI(
+        timeout=timeout,
+        http_client=DefaultHttpxClient(
+            limits=limits, timeout=timeout, event_hooks={"request": [count_request]}
+        ),
+    )
+
+
+def _build_async_client() -> AsyncOpenAI:
+    limits, timeout = _pool_settings()
+    return AsyncOpenAI(
+        timeout=timeout,
+        http_client=DefaultAsyncHttpxClient(
+            limits=limits, timeout=timeout, event_hooks={"request": [acount_request]}
+        ),
+    )
+
+
+def get_openai_client() -> OpenAI:
+    """Return the shared OpenAI client for the current API key and base URL.
+
+    The underlying httpx client keeps connections alive between calls and is
+    safe to share across threads, such as the UI server's request threads.
+    """
+    key = _client_key()
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _build_client()
+            _clients[key] = client
+        return client
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for the running event loop.
+
+    Async connection pools are bound to the loop that created them, so one
+    client is kept per loop (and per API key and base URL).
+    """
+    loop = asyncio.get_running_loop()
+    key = _client_key()
+    with _lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            client = _build_async_client()
+            loop_clients[key] = client
+        return client
+
+
+def _close_all_locked() -> None:
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+    # Async clients can only be closed from their own loop; drop them so the
+    # next call rebuilds them with the current settings.
+    _async_clients.clear()
+
+
+def close_openai_clients() -> None:
+    with _lock:
+        _close_all_locked()
+
+
+async def aclose_openai_clients() -> None:
+    """Close the async clients owned by the running event loop."""
+    with _lock:
+        loop_clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in loop_clients.values():
+        await client.close()
@@ -1,17 +1,43 @@
 """Core library functions for job_tailor."""
 
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import json
 import re
 import sys
 import textwrap
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
 
-import requests
-from bs4 import BeautifulSoup
-from fpdf import FPDF
-from openai import OpenAI
-from pypdf import PdfReader
+from .checkpoints import CheckpointStore, checkpoint_dir, stage_input_keys
+from .clients import get_async_openai_client, get_openai_client
+from .cv_text import CvTextCache, read_cv_text
+from .extractors import extract_document_text, page_text, parse_html
+from .fetching import JobFetcher
+from .http_cache import HttpCache
+from .job_text import prepare_job_text
+from .json_repair import repair_json
+from .llm_cache import LlmCache
+from .manifest import MANIFEST_FILENAME, StageStats, format_profile, write_run_manifest
+from .pdf_pool import DEFAULT_PDF_WORKERS, arender_pdf, get_pdf_executor, render_pdf
 
 SYSTEM_PROMPT = (
     "You are an expert CV/cover-letter writer for quantitative finance roles. "
@@ -20,6 +46,18 @@ SYSTEM_PROMPT = (
     "conservative wording choices."
 )
 
+CANDIDATE_CACHE_SIZE = 32
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+_candidate_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+_candidate_cache_lock = threading.Lock()
+_candidate_inflight: Dict[Tuple[int, str, str], asyncio.Task] = {}
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
 
 def slugify(value: str) -> str:
     value = value.lower()
@@ -43,36 +81,55 @@ def build_output_dir_name(company: str, role: str) -> str:
 
 
 def find_unique_output_dir(base_dir: Path, base_name: str) -> Path:
-    """Find a unique directory name by appending incremental digits if needed."""
-    output_dir = base_dir / base_name
-    if not output_dir.exists():
-        return output_dir
+    """Create a unique directory, appending incremental digits if needed.
 
-    counter = 1
+    The directory is created atomically so concurrent jobs targeting the same
+    company and role never share an output directory.
+    """
+    base_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = base_dir / base_name
+    counter = 0
     while True:
-        output_dir = base_dir / f"{base_name}_{counter}"
-        if not output_dir.exists():
+        try:
+            output_dir.mkdir()
             return output_dir
-        counter += 1
+        except FileExistsError:
+            counter += 1
+            output_dir = base_dir / f"{base_name}_{counter}"
 
 
-def fetch_url_text(url: str, timeout: int = 20) -> str:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-    return extract_text_from_html(resp.text)
+def fetch_url_text(
+    url: str,
+    timeout: int = 20,
+    http_cache: Optional[HttpCache] = None,
+    offline: bool = False,
+) -> str:
+    async def fetch() -> str:
+        async with JobFetcher(timeout=timeout) as fetcher:
+            return await afetch_url_text(url, fetcher, http_cache, offline)
+
+    return run_sync(fetch())
 
 
 def extract_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript", "svg", "img"]):
-        tag.decompose()
-    text = soup.get_text("\n", strip=True)
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    return "\n".join(lines)
+    doc = parse_html(html)
+    return page_text(doc) if doc is not None else ""
+
+
+def extract_job_text(html: str, url: str = "") -> str:
+    """Extract the job description from a page, preferring site extractors.
+
+    JSON-LD ``JobPosting`` data and known description containers yield just
+    the posting; other pages fall back to the whole page's text. The page is
+    parsed once for both.
+    """
+    doc = parse_html(html)
+    if doc is None:
+        return ""
+    structured = extract_document_text(doc, url)
+    if structured is not None:
+        return structured[1]
+    return page_text(doc)
 
 
 def build_job_parse_prompt(job_text: str) -> str:
@@ -201,12 +258,140 @@ def build_cover_letter_prompt(
     ).strip()
 
 
-def generate_with_openai(model: str, prompt: str, temperature: Optional[float]) -> str:
-    client = OpenAI()
+def build_json_fix_prompt(raw: str, error: str) -> str:
+    return textwrap.dedent(
+        """
+        The text below was meant to be a single JSON object but it does not parse ({error}).
+        Return the same content as one valid JSON object. Do not add, drop or reword any values.
+        Output JSON only.
+
+        Text:
+        {raw}
+        """
+    ).strip().format(error=error, raw=raw)
+
+
+# Dependencies between the LLM stages of one job (see aprocess_job).
+STAGE_DEPS: Dict[str, Tuple[str, ...]] = {
+    "candidate": (),
+    "job": (),
+    "mapping": ("job", "candidate"),
+    "cv_draft": ("mapping",),
+    "ats_audit": ("cv_draft",),
+    "cover_letter": ("mapping",),
+}
+JSON_STAGES = frozenset({"candidate", "job", "ats_audit"})
+
+# Top-level job/candidate JSON fields each prompt leaves out. Fields not
+# listed, including any the model adds, are kept.
+STAGE_JSON_OMIT: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "mapping": {"job": ("location", "nice_to_have"), "candidate": ("contact",)},
+    "cv_draft": {"job": ("location",), "candidate": ()},
+    "cover_letter": {
+        "job": ("nice_to_have", "tools", "keywords_ranked"),
+        "candidate": ("skills", "leadership"),
+    },
+    "ats_audit": {"job": ("company", "location")},
+}
+
+
+def compact_json(data: Any) -> str:
+    """JSON without indentation or spaces after separators, for prompts."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def project_json(data: Any, omit: Sequence[str] = ()) -> Any:
+    """``data`` without the ``omit`` fields and fields with empty values."""
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: value
+        for key, value in data.items()
+        if key not in omit and value not in (None, "", [], {})
+    }
+
+
+def stage_json(stage: str, source: str, data: Any) -> str:
+    """The ``source`` ("job" or "candidate") JSON as ``stage``'s prompt shows it."""
+    omit = STAGE_JSON_OMIT.get(stage, {}).get(source, ())
+    return compact_json(project_json(data, omit))
+
+
+def build_stage_prompt(
+    stage: str,
+    results: Dict[str, Any],
+    cv_text: str,
+    job_text: str,
+    temperature: Optional[float],
+) -> Tuple[str, Optional[float]]:
+    """Return the prompt and temperature for ``stage``.
+
+    ``results`` holds the results of the stage's dependencies; the candidate
+    and job stages produce ``(parsed, json_text)`` pairs. Prompts embed the
+    parsed JSON compactly, without the fields the stage does not use (see
+    STAGE_JSON_OMIT).
+    """
+    if stage == "candidate":
+        return build_candidate_parse_prompt(cv_text), 0.0
+    if stage == "job":
+        return build_job_parse_prompt(job_text), 0.0
+    job_json_text = stage_json(stage, "job", results["job"][0])
+    if stage == "ats_audit":
+        return build_ats_audit_prompt(job_json_text, results["cv_draft"]), 0.0
+    candidate_json_text = stage_json(stage, "candidate", results["candidate"][0])
+    if stage == "mapping":
+        return build_mapping_prompt(job_json_text, candidate_json_text), temperature
+    if stage == "cv_draft":
+        prompt = build_cv_prompt(job_json_text, candidate_json_text, results["mapping"])
+        return prompt, temperature
+    if stage == "cover_letter":
+        prompt = build_cover_letter_prompt(
+            job_json_text, candidate_json_text, results["mapping"]
+        )
+        return prompt, temperature
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def job_stage_keys(
+    cv_text: str,
+    job_text: str,
+    model: str,
+    temperature: float,
+    include_cover_letter: bool,
+    candidate_json: Optional[dict] = None,
+) -> Dict[str, str]:
+    """Checkpoint keys for each stage of one job (see stage_input_keys)."""
+    graph = {
+        name: deps
+        for name, deps in STAGE_DEPS.items()
+        if include_cover_letter or name != "cover_letter"
+    }
+    return stage_input_keys(
+        graph,
+        {
+            "candidate": [model, candidate_json if candidate_json is not None else cv_text],
+            "job": [model, job_text],
+            "mapping": [model, temperature],
+            "cv_draft": [model, temperature],
+            "ats_audit": [model],
+            "cover_letter": [model, temperature],
+        },
+    )
+
+
+def _job_checkpoints(out_dir: Path, slug: str, keys: Dict[str, str]) -> CheckpointStore:
+    """Checkpoints of one job, in a directory keyed by its job text and model."""
+    return CheckpointStore(checkpoint_dir(out_dir, slug, keys["job"]))
+
+
+def build_chat_request(
+    model: str, prompt: str, temperature: Optional[float], json_mode: bool = False
+) -> Dict[str, Any]:
+    """Chat-completions request body for one stage prompt (also used for batch files)."""
     if temperature is not None and (temperature < 0 or temperature > 2):
         raise ValueError(f"temperature must be between 0 and 2, got {temperature}")
 
-    request_kwargs = {
+    request_kwargs: Dict[str, Any] = {
         "model": model,
         "messages": [
             {"role": "system", "content": SYSTEM_PROMPT},
@@ -216,19 +401,44 @@ def generate_with_openai(model: str, prompt: str, temperature: Optional[float])
 
     if temperature is not None and not model.startswith("gpt-5"):
         request_kwargs["temperature"] = temperature
-    try:
-        resp = client.chat.completions.create(**request_kwargs)
-    except Exception as e:
-        msg = str(e)
-        if "temperature" in msg and "Only the default (1) value is supported" in msg:
-            request_kwargs.pop("temperature", None)
-            try:
-                resp = client.chat.completions.create(**request_kwargs)
-            except Exception as retry_err:
-                raise RuntimeError(f"OpenAI API call failed: {retry_err}") from retry_err
-        else:
-            raise RuntimeError(f"OpenAI API call failed: {e}") from e
+    if json_mode:
+        request_kwargs["response_format"] = {"type": "json_object"}
+    return request_kwargs
+
+
+def _is_unsupported_temperature_error(exc: Exception) -> bool:
+    msg = str(exc)
+    return "temperature" in msg and "Only the default (1) value is supported" in msg
+
+
+def _drop_unsupported_param(exc: Exception, request_kwargs: Dict[str, Any]) -> bool:
+    """Remove the request parameter ``exc`` complains about; False if none."""
+    if _is_unsupported_temperature_error(exc) and "temperature" in request_kwargs:
+        request_kwargs.pop("temperature")
+        return True
+    if "response_format" in str(exc) and "response_format" in request_kwargs:
+        request_kwargs.pop("response_format")
+        return True
+    return False
+
 
+def _response_format(request_kwargs: Dict[str, Any]) -> Optional[str]:
+    response_format = request_kwargs.get("response_format")
+    return response_format["type"] if response_format else None
+
+
+def _deterministic_cache(
+    llm_cache: Optional[LlmCache], temperature: Optional[float]
+) -> Optional[LlmCache]:
+    """``llm_cache`` for temperature-0 calls, else None.
+
+    Replies sampled at a higher temperature are not reused, so a re-run of
+    the drafting stages produces a new draft rather than a frozen one.
+    """
+    return llm_cache if temperature == 0 else None
+
+
+def _extract_chat_content(resp: Any) -> str:
     # Safely extract textual content; handle potential None content
     content = ""
     choices = getattr(resp, "choices", []) or []
@@ -249,6 +459,165 @@ def generate_with_openai(model: str, prompt: str, temperature: Optional[float])
     return content.strip()
 
 
+def _extract_chunk_delta(chunk: Any) -> str:
+    choices = getattr(chunk, "choices", []) or []
+    if not choices:
+        return ""
+    delta = getattr(choices[0], "delta", None)
+    content = getattr(delta, "content", None)
+    return content if isinstance(content, str) else ""
+
+
+def _complete_chat(
+    client: Any,
+    request_kwargs: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]],
+) -> Tuple[str, Any]:
+    """Return the reply text and the response's token usage (may be None)."""
+    if on_token is None:
+        resp = client.chat.completions.create(**request_kwargs)
+        return _extract_chat_content(resp), getattr(resp, "usage", None)
+
+    parts = []
+    usage = None
+    for chunk in client.chat.completions.create(
+        **request_kwargs, stream=True, stream_options={"include_usage": True}
+    ):
+        usage = getattr(chunk, "usage", None) or usage
+        delta = _extract_chunk_delta(chunk)
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+    return "".join(parts).strip(), usage
+
+
+async def _acomplete_chat(
+    client: Any,
+    request_kwargs: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]],
+) -> Tuple[str, Any]:
+    if on_token is None:
+        resp = await client.chat.completions.create(**request_kwargs)
+        return _extract_chat_content(resp), getattr(resp, "usage", None)
+
+    parts = []
+    usage = None
+    stream = await client.chat.completions.create(
+        **request_kwargs, stream=True, stream_options={"include_usage": True}
+    )
+    async for chunk in stream:
+        usage = getattr(chunk, "usage", None) or usage
+        delta = _extract_chunk_delta(chunk)
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+    return "".join(parts).strip(), usage
+
+
+def generate_with_openai(
+    model: str,
+    prompt: str,
+    temperature: Optional[float],
+    llm_cache: Optional[LlmCache] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    stats: Optional[StageStats] = None,
+    json_mode: bool = False,
+) -> str:
+    """Return the model's reply to ``prompt``.
+
+    With ``on_token`` the reply is streamed and each text delta is passed to
+    the callback as it arrives (a cached reply is passed as a single delta).
+    ``stats`` accumulates the call's token usage, retries and cache hits.
+    ``json_mode`` asks for a JSON object reply where the model supports it.
+    """
+    request_kwargs = build_chat_request(model, prompt, temperature, json_mode)
+
+    llm_cache = _deterministic_cache(llm_cache, temperature)
+    if llm_cache is not None:
+        cached = llm_cache.get(
+            model, SYSTEM_PROMPT, prompt, temperature, _response_format(request_kwargs)
+        )
+        if cached is not None:
+            if stats is not None:
+                stats.cache_hits += 1
+            if on_token is not None:
+                on_token(cached)
+            return cached
+
+    client = get_openai_client()
+    with stats.api_call() if stats is not None else contextlib.nullcontext():
+        while True:
+            try:
+                content, usage = _complete_chat(client, request_kwargs, on_token)
+                break
+            except Exception as e:
+                if not _drop_unsupported_param(e, request_kwargs):
+                    raise RuntimeError(f"OpenAI API call failed: {e}") from e
+    if stats is not None:
+        stats.record_usage(usage)
+
+    if llm_cache is not None and content:
+        # Keyed by the format actually sent: a plain-text fallback reply
+        # must not answer a later JSON-mode request.
+        llm_cache.put(
+            model, SYSTEM_PROMPT, prompt, temperature, content, _response_format(request_kwargs)
+        )
+    return content
+
+
+async def agenerate_with_openai(
+    model: str,
+    prompt: str,
+    temperature: Optional[float],
+    llm_cache: Optional[LlmCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    stats: Optional[StageStats] = None,
+    json_mode: bool = False,
+) -> str:
+    """Async variant of generate_with_openai.
+
+    ``semaphore`` bounds the number of in-flight API calls; cache hits do not
+    take a slot.
+    """
+    request_kwargs = build_chat_request(model, prompt, temperature, json_mode)
+
+    llm_cache = _deterministic_cache(llm_cache, temperature)
+    if llm_cache is not None:
+        cached = llm_cache.get(
+            model, SYSTEM_PROMPT, prompt, temperature, _response_format(request_kwargs)
+        )
+        if cached is not None:
+            if stats is not None:
+                stats.cache_hits += 1
+            if on_token is not None:
+                on_token(cached)
+            return cached
+
+    client = get_async_openai_client()
+    async with semaphore or contextlib.nullcontext():
+        with stats.api_call() if stats is not None else contextlib.nullcontext():
+            while True:
+                try:
+                    content, usage = await _acomplete_chat(
+                        client, request_kwargs, on_token
+                    )
+                    break
+                except Exception as e:
+                    if not _drop_unsupported_param(e, request_kwargs):
+                        raise RuntimeError(f"OpenAI API call failed: {e}") from e
+    if stats is not None:
+        stats.record_usage(usage)
+
+    if llm_cache is not None and content:
+        # Keyed by the format actually sent: a plain-text fallback reply
+        # must not answer a later JSON-mode request.
+        llm_cache.put(
+            model, SYSTEM_PROMPT, prompt, temperature, content, _response_format(request_kwargs)
+        )
+    return content
+
+
 def generate_dry_run(cv_text: str, job_text: str) -> str:
     preview_cv = "\n".join(cv_text.splitlines()[:40]).strip()
     preview_job = "\n".join(job_text.splitlines()[:40]).strip()
@@ -299,86 +668,234 @@ def parse_json_response(raw: str) -> dict:
     return parsed
 
 
+def cv_content_hash(cv_text: str) -> str:
+    return hashlib.sha256(cv_text.encode("utf-8")).hexdigest()
+
+
+async def aparse_json_reply(
+    raw: str,
+    model: str,
+    llm_cache: Optional[LlmCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    stats: Optional[StageStats] = None,
+) -> dict:
+    """Parse a JSON reply, repairing it locally before asking the model again.
+
+    Malformed replies go through repair_json first; only if that still fails
+    is the model asked to fix its own output. ``stats`` counts both events.
+    """
+    try:
+        return parse_json_response(raw)
+    except ValueError:
+        pass
+    try:
+        parsed = parse_json_response(repair_json(raw))
+    except ValueError as exc:
+        error = str(exc)
+    else:
+        if stats is not None:
+            stats.json_repairs += 1
+        return parsed
+
+    if stats is not None:
+        stats.json_rerequests += 1
+    fixed = await agenerate_with_openai(
+        model,
+        build_json_fix_prompt(raw, error),
+        temperature=0.0,
+        llm_cache=llm_cache,
+        semaphore=semaphore,
+        stats=stats,
+        json_mode=True,
+    )
+    return parse_json_response(repair_json(fixed))
+
+
+def parse_candidate_cv(
+    cv_text: str, model: str, llm_cache: Optional[LlmCache] = None
+) -> dict:
+    return run_sync(aparse_candidate_cv(cv_text, model, llm_cache))
+
+
+async def aparse_candidate_cv(
+    cv_text: str,
+    model: str,
+    llm_cache: Optional[LlmCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    stats: Optional[StageStats] = None,
+) -> dict:
+    raw = await agenerate_with_openai(
+        model,
+        build_candidate_parse_prompt(cv_text),
+        temperature=0.0,
+        llm_cache=llm_cache,
+        semaphore=semaphore,
+        stats=stats,
+        json_mode=True,
+    )
+    return await aparse_json_reply(raw, model, llm_cache, semaphore, stats)
+
+
+def _finish_candidate_parse(
+    key: Tuple[str, str], inflight_key: Tuple[int, str, str], task: asyncio.Task
+) -> None:
+    with _candidate_cache_lock:
+        _candidate_inflight.pop(inflight_key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        _candidate_cache[key] = task.result()
+        while len(_candidate_cache) > CANDIDATE_CACHE_SIZE:
+            _candidate_cache.popitem(last=False)
+
+
+async def aget_candidate_json(
+    cv_text: str,
+    model: str,
+    llm_cache: Optional[LlmCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    stats: Optional[StageStats] = None,
+) -> Tuple[dict, bool]:
+    """Return the parsed candidate JSON for a CV, parsing each distinct CV once.
+
+    Results are shared process-wide, keyed by model and CV content hash, so
+    every job in a batch (and repeated UI runs) reuse the same parse, and
+    concurrent jobs await a single in-flight parse. The second tuple item is
+    True when the result was reused; ``stats`` is only charged for the call
+    that actually parses.
+    """
+    key = (model, cv_content_hash(cv_text))
+    loop = asyncio.get_running_loop()
+    inflight_key = (id(loop), *key)
+    with _candidate_cache_lock:
+        if key in _candidate_cache:
+            _candidate_cache.move_to_end(key)
+            return _candidate_cache[key], True
+        task = _candidate_inflight.get(inflight_key)
+        reused = task is not None
+        if task is None:
+            task = loop.create_task(
+                aparse_candidate_cv(cv_text, model, llm_cache, semaphore, stats)
+            )
+            task.add_done_callback(
+                functools.partial(_finish_candidate_parse, key, inflight_key)
+            )
+            _candidate_inflight[inflight_key] = task
+    return await asyncio.shield(task), reused
+
+
+def load_candidate_json(source: dict | str | Path) -> dict:
+    """Load a precomputed candidate JSON from a dict, an inline JSON string or a file.
+
+    Only a ``Path`` is read from disk. Strings are always parsed as JSON, so
+    untrusted input (such as a UI form field) cannot name a server file.
+    """
+    if isinstance(source, dict):
+        return source
+    if isinstance(source, Path):
+        return parse_json_response(source.read_text(encoding="utf-8"))
+    try:
+        return parse_json_response(source)
+    except ValueError as exc:
+        raise ValueError(f"Candidate JSON must be a JSON object: {exc}") from exc
+
+
 def markdown_to_pdf(markdown_text: str, output_path: Path) -> None:
-    pdf = FPDF(unit="pt", format="A4")
-    pdf.set_auto_page_break(auto=True, margin=54)
-    pdf.add_page()
-
-    def normalize_text(text: str) -> str:
-        replacements = {
-            "–": "-",
-            "—": "--",
-            "•": "-",
-            "→": "->",
-            "←": "<-",
-            "“": '"',
-            "”": '"',
-            "‘": "'",
-            "’": "'",
-            "‑": "-",
-            "\u00a0": " ",
-        }
-        for src, dst in replacements.items():
-            text = text.replace(src, dst)
-        return text
-
-    def break_long_words(text: str, max_len: int = 60) -> str:
-        parts = []
-        for token in text.split(" "):
-            if len(token) <= max_len:
-                parts.append(token)
-                continue
-            chunks = [token[i : i + max_len] for i in range(0, len(token), max_len)]
-            parts.append(" ".join(chunks))
-        return " ".join(parts)
+    render_pdf(markdown_text, output_path)
+
+
+def run_in_background(coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the shared background event loop.
+
+    Sync entry points share one loop so that concurrent callers (such as the
+    UI server's request threads) also share one pooled async OpenAI client.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="job-tailor-loop",
+                daemon=True,
+            ).start()
+        loop = _background_loop
 
-    def write_line(text: str, size: int, bold: bool = False, indent: int = 0) -> None:
-        # Use enums when available to satisfy type-checkers; fall back to strings for older fpdf2 versions
-        try:
-            from fpdf.enums import WrapMode, XPos, YPos  # type: ignore
-
-            new_x_val = XPos.LMARGIN
-            new_y_val = YPos.NEXT
-            wrap_mode_val = WrapMode.CHAR
-        except Exception:
-            new_x_val = "LMARGIN"
-            new_y_val = "NEXT"
-            wrap_mode_val = "CHAR"
-
-        pdf.set_font("Helvetica", style="B" if bold else "", size=size)
-        if indent:
-            pdf.set_x(pdf.l_margin + indent)
-        safe_text = normalize_text(break_long_words(text))
-        pdf.multi_cell(
-            0,
-            size + 6,
-            safe_text,
-            new_x=new_x_val,
-            new_y=new_y_val,
-            wrapmode=wrap_mode_val,
-        )
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("Cannot call a sync job_tailor API from its own event loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop)
 
-    lines = markdown_text.splitlines()
-    for line in lines:
-        if not line.strip():
-            pdf.ln(6)
-            continue
-        if line.startswith("# "):
-            write_line(line[2:].strip(), size=18, bold=True)
-        elif line.startswith("## "):
-            write_line(line[3:].strip(), size=14, bold=True)
-        elif line.startswith("### "):
-            write_line(line[4:].strip(), size=12, bold=True)
-        elif line.startswith("- "):
-            write_line(f"- {line[2:].strip()}", size=11, indent=10)
-        else:
-            write_line(line.strip(), size=11)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    pdf.output(str(output_path))
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared background event loop and wait for it."""
+    future = run_in_background(coro)
+    try:
+        return future.result()
+    except KeyboardInterrupt:
+        future.cancel()
+        raise
 
 
-def process_job(
+async def gather_or_cancel(aws: Iterable[Awaitable[T]]) -> List[T]:
+    """Like asyncio.gather, but cancel the other awaitables on the first failure."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _check_stage_graph(stages: Dict[str, Tuple[Sequence[str], Any]]) -> None:
+    remaining = {}
+    for name, (deps, _) in stages.items():
+        unknown = [dep for dep in deps if dep not in stages]
+        if unknown:
+            raise ValueError(f"Stage {name!r} depends on unknown stages: {unknown}")
+        remaining[name] = set(deps)
+
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Stage graph has a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+async def arun_stage_graph(
+    stages: Dict[str, Tuple[Sequence[str], Callable[[Dict[str, Any]], Awaitable[Any]]]],
+) -> Dict[str, Any]:
+    """Run named stages concurrently, starting each once its dependencies finish.
+
+    ``stages`` maps a stage name to ``(dependencies, func)``; ``func`` receives
+    the results gathered so far and returns an awaitable of the stage result.
+    The first stage failure cancels the remaining stages and is re-raised.
+    """
+    _check_stage_graph(stages)
+
+    results: Dict[str, Any] = {}
+    tasks: Dict[str, asyncio.Future] = {}
+
+    async def run(name: str) -> None:
+        deps, func = stages[name]
+        for dep in deps:
+            await tasks[dep]
+        results[name] = await func(dict(results))
+
+    for name in stages:
+        tasks[name] = asyncio.ensure_future(run(name))
+    await gather_or_cancel(tasks.values())
+    return results
+
+
+async def aprocess_job(
     cv_text: str,
     job_text: str,
     out_dir: Path,
@@ -390,11 +907,104 @@ def process_job(
     verbose: bool,
     debug_artifacts: bool,
     include_cover_letter: bool,
+    candidate_json: Optional[dict] = None,
+    llm_cache: Optional[LlmCache] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    run_stats: Optional[List[StageStats]] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    pdf_executor: Optional[concurrent.futures.Executor] = None,
 ) -> List[Path]:
+    """Tailor one job. ``on_event`` receives progress events as dicts.
+
+    Events have a ``type`` of ``stage_start``, ``stage_finish`` or ``token``
+    (streamed CV draft and cover letter text), plus ``job`` and ``stage``.
+    Per-stage timings and token usage are written to ``run_manifest.json``
+    in the job's output directory and appended to ``run_stats`` if given.
+    Each stage's result is saved to ``checkpoints`` as soon as it finishes;
+    with ``resume``, stages whose inputs match a saved checkpoint are loaded
+    instead of run. Checkpoints are removed once the outputs are written,
+    unless ``incremental`` is set: then they are kept, resume is implied and
+    outputs overwrite the same directory, so a later run with edited inputs
+    recomputes only the stages downstream of the edit. PDFs are rendered on
+    ``pdf_executor`` if given, otherwise on a thread.
+    """
+    resume = resume or incremental
+    started_at = time.time()
+    run_start = time.perf_counter()
+    stage_stats: Dict[str, StageStats] = {}
+    stage_keys: Dict[str, str] = {}
+
     def log(step: str) -> None:
         if verbose:
             print(f"[job:{slug}] {step}")
 
+    def emit(event_type: str, **data: Any) -> None:
+        if on_event is not None:
+            on_event({"type": event_type, "job": slug, **data})
+
+    def tracked(
+        name: str, func: Callable[[Dict[str, Any]], Awaitable[Any]]
+    ) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
+        async def run(results: Dict[str, Any]) -> Any:
+            stats = stage_stats[name] = StageStats(slug, name, model)
+            stats.input_hash = stage_keys[name]
+            emit("stage_start", stage=name)
+            saved = None
+            if checkpoints is not None and resume:
+                saved = await asyncio.to_thread(checkpoints.load, name, stage_keys[name])
+            if saved is not None:
+                stats.reused = True
+                log(f"Reused {name} from checkpoint (inputs unchanged)")
+                emit("stage_finish", stage=name)
+                return saved
+            with stats.timed():
+                value = await func(results)
+            if checkpoints is not None:
+                await asyncio.to_thread(checkpoints.save, name, stage_keys[name], value)
+            if stats.json_repairs or stats.json_rerequests:
+                log(
+                    f"Fixed malformed JSON in {name}: {stats.json_repairs} repaired "
+                    f"locally, {stats.json_rerequests} re-requested"
+                )
+            emit("stage_finish", stage=name)
+            return value
+
+        return run
+
+    async def generate(
+        stage: str,
+        prompt: str,
+        stage_temperature: Optional[float],
+        stream: bool = False,
+        json_mode: bool = False,
+    ) -> str:
+        def stream_token(text: str) -> None:
+            emit("token", stage=stage, text=text)
+
+        on_token = stream_token if on_event and stream else None
+        return await agenerate_with_openai(
+            model,
+            prompt,
+            stage_temperature,
+            llm_cache=llm_cache,
+            semaphore=semaphore,
+            on_token=on_token,
+            stats=stage_stats[stage],
+            json_mode=json_mode,
+        )
+
+    async def generate_json(stage: str, prompt: str) -> dict:
+        raw = await generate(stage, prompt, 0.0, json_mode=True)
+        return await aparse_json_reply(
+            raw, model, llm_cache, semaphore, stage_stats[stage]
+        )
+
+    def stage_prompt(stage: str, results: Dict[str, Any]) -> Tuple[str, Optional[float]]:
+        return build_stage_prompt(stage, results, cv_text, job_text, temperature)
+
     output_dir = out_dir
     base_name = ""
     if dry_run:
@@ -402,54 +1012,82 @@ def process_job(
         output_md = generate_dry_run(cv_text, job_text)
         base_name = build_output_dir_name("unknown-company", "unknown-role")
     else:
-        log("Parse candidate CV")
-        candidate_json_raw = generate_with_openai(
-            model, build_candidate_parse_prompt(cv_text), temperature=0.0
-        )
-        candidate_json = parse_json_response(candidate_json_raw)
-        candidate_json_text = json.dumps(candidate_json, indent=2)
 
-        log("Parse job description")
-        job_json_raw = generate_with_openai(
-            model, build_job_parse_prompt(job_text), temperature=0.0
-        )
-        job_json = parse_json_response(job_json_raw)
-        job_json_text = json.dumps(job_json, indent=2)
+        async def parse_candidate(results: Dict[str, Any]) -> Tuple[dict, str]:
+            if candidate_json is not None:
+                log("Use precomputed candidate JSON")
+                parsed = candidate_json
+            else:
+                log("Parse candidate CV")
+                parsed, reused = await aget_candidate_json(
+                    cv_text, model, llm_cache, semaphore, stage_stats["candidate"]
+                )
+                if reused:
+                    log("Reused candidate parse for identical CV")
+            return parsed, json.dumps(parsed, indent=2)
+
+        async def parse_job(results: Dict[str, Any]) -> Tuple[dict, str]:
+            log("Parse job description")
+            parsed = await generate_json("job", stage_prompt("job", results)[0])
+            return parsed, json.dumps(parsed, indent=2)
+
+        async def build_mapping(results: Dict[str, Any]) -> str:
+            log("Build mapping table")
+            return await generate("mapping", *stage_prompt("mapping", results))
+
+        async def draft_cv(results: Dict[str, Any]) -> str:
+            log("Draft CV")
+            return await generate("cv_draft", *stage_prompt("cv_draft", results), stream=True)
+
+        async def audit_cv(results: Dict[str, Any]) -> dict:
+            log("ATS audit")
+            return await generate_json("ats_audit", stage_prompt("ats_audit", results)[0])
+
+        async def draft_cover_letter(results: Dict[str, Any]) -> str:
+            log("Draft cover letter")
+            return await generate(
+                "cover_letter", *stage_prompt("cover_letter", results), stream=True
+            )
+
+        stage_funcs: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+            "candidate": parse_candidate,
+            "job": parse_job,
+            "mapping": build_mapping,
+            "cv_draft": draft_cv,
+            "ats_audit": audit_cv,
+        }
+        if include_cover_letter:
+            stage_funcs["cover_letter"] = draft_cover_letter
 
-        log("Build mapping table")
-        mapping_md = generate_with_openai(
-            model, build_mapping_prompt(job_json_text, candidate_json_text), temperature
+        stage_keys.update(
+            job_stage_keys(
+                cv_text, job_text, model, temperature, include_cover_letter, candidate_json
+            )
+        )
+        results = await arun_stage_graph(
+            {
+                name: (STAGE_DEPS[name], tracked(name, func))
+                for name, func in stage_funcs.items()
+            }
         )
 
+        candidate_json_text = results["candidate"][1]
+        job_json, job_json_text = results["job"]
+        mapping_md = results["mapping"]
+        cv_draft = results["cv_draft"]
+        ats_audit = results["ats_audit"]
+        final_cv = ats_audit.get("revised_cv", cv_draft)
+        cover_letter = results.get("cover_letter", "")
+
         company_name = job_json.get("company") or "unknown-company"
         role_name = job_json.get("title") or "unknown-role"
         base_name = build_output_dir_name(str(company_name), str(role_name))
-        output_dir = find_unique_output_dir(out_dir, base_name)
+        if incremental:
+            output_dir = out_dir / base_name
+        else:
+            output_dir = find_unique_output_dir(out_dir, base_name)
         base_name = output_dir.name
 
-        log("Draft CV")
-        cv_draft = generate_with_openai(
-            model,
-            build_cv_prompt(job_json_text, candidate_json_text, mapping_md),
-            temperature,
-        )
-
-        log("ATS audit")
-        ats_audit_raw = generate_with_openai(
-            model, build_ats_audit_prompt(job_json_text, cv_draft), temperature=0.0
-        )
-        ats_audit = parse_json_response(ats_audit_raw)
-        final_cv = ats_audit.get("revised_cv", cv_draft)
-
-        cover_letter = ""
-        if include_cover_letter:
-            log("Draft cover letter")
-            cover_letter = generate_with_openai(
-                model,
-                build_cover_letter_prompt(job_json_text, candidate_json_text, mapping_md),
-                temperature,
-            )
-
         output_md = ""
 
     log("Write outputs")
@@ -491,48 +1129,261 @@ def process_job(
 
     if make_pdf:
         log("Render PDFs")
-        markdown_to_pdf(cv_md_path.read_text(encoding="utf-8"), cv_pdf_path)
-        created_paths.append(cv_pdf_path)
-        if include_cover_letter:
-            markdown_to_pdf(cover_md_path.read_text(encoding="utf-8"), cover_pdf_path)
-            created_paths.append(cover_pdf_path)
+        pdf_stats = stage_stats["pdf"] = StageStats(slug, "pdf")
+        emit("stage_start", stage="pdf")
+        with pdf_stats.timed():
+            renders = [(cv_md_path, cv_pdf_path)]
+            if include_cover_letter:
+                renders.append((cover_md_path, cover_pdf_path))
+            await asyncio.gather(
+                *(
+                    arender_pdf(md_path.read_text(encoding="utf-8"), pdf_path, pdf_executor)
+                    for md_path, pdf_path in renders
+                )
+            )
+            created_paths.extend(pdf_path for _, pdf_path in renders)
+        emit("stage_finish", stage="pdf")
+
+    if checkpoints is not None:
+        # Incremental runs keep this job's checkpoints but drop those left
+        # behind by earlier versions of its text.
+        await asyncio.to_thread(
+            checkpoints.prune_superseded if incremental else checkpoints.clear
+        )
 
+    stats = list(stage_stats.values())
+    created_paths.append(
+        write_run_manifest(
+            output_dir / MANIFEST_FILENAME,
+            job=slug,
+            model=model,
+            started_at=started_at,
+            wall_seconds=time.perf_counter() - run_start,
+            stats=stats,
+        )
+    )
+    if run_stats is not None:
+        run_stats.extend(stats)
     return created_paths
 
 
-def load_job_texts(
-    urls: Iterable[str], job_text_file: Path | None
+def process_job(
+    cv_text: str,
+    job_text: str,
+    out_dir: Path,
+    slug: str,
+    model: str,
+    temperature: float,
+    dry_run: bool,
+    make_pdf: bool,
+    verbose: bool,
+    debug_artifacts: bool,
+    include_cover_letter: bool,
+    candidate_json: Optional[dict] = None,
+    llm_cache: Optional[LlmCache] = None,
+) -> List[Path]:
+    return run_sync(
+        aprocess_job(
+            cv_text=cv_text,
+            job_text=job_text,
+            out_dir=out_dir,
+            slug=slug,
+            model=model,
+            temperature=temperature,
+            dry_run=dry_run,
+            make_pdf=make_pdf,
+            verbose=verbose,
+            debug_artifacts=debug_artifacts,
+            include_cover_letter=include_cover_letter,
+            candidate_json=candidate_json,
+            llm_cache=llm_cache,
+        )
+    )
+
+
+def _clean_job_url(url: str) -> str:
+    cleaned_url = "".join(url.split())
+    if cleaned_url != url:
+        print(
+            "Warning: job URL contained whitespace; cleaned it before fetching.",
+            file=sys.stderr,
+        )
+    return cleaned_url
+
+
+async def afetch_url_text(
+    url: str,
+    fetcher: JobFetcher,
+    http_cache: Optional[HttpCache] = None,
+    offline: bool = False,
+) -> str:
+    """Fetch a job page and return its text, using ``http_cache`` if given.
+
+    Fresh cache entries (and 304 revalidations) skip HTML parsing entirely.
+    In ``offline`` mode only cached text is returned. Cache lookups and writes
+    (SQLite) run on a worker thread so concurrent fetches do not block the loop.
+    """
+    cached = await asyncio.to_thread(http_cache.get, url) if http_cache is not None else None
+    if cached is not None and (offline or http_cache.is_fresh(cached)):
+        return cached.text
+    if offline:
+        raise LookupError("not in the job page cache (offline mode)")
+
+    headers = http_cache.conditional_headers(cached) if cached is not None else None
+    resp = await fetcher.fetch_response(url, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        await asyncio.to_thread(http_cache.touch, url)
+        return cached.text
+    if resp.status_code == 304:
+        resp = await fetcher.fetch_response(url)
+
+    text = await asyncio.to_thread(extract_job_text, resp.text, url)
+    if http_cache is not None:
+        await asyncio.to_thread(
+            http_cache.put,
+            url,
+            text,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+    return text
+
+
+async def aload_job_texts(
+    urls: Iterable[str],
+    job_text_file: str | Path | Sequence[str | Path] | None,
+    fetcher: Optional[JobFetcher] = None,
+    http_cache: Optional[HttpCache] = None,
+    offline: bool = False,
 ) -> List[Tuple[str, str]]:
+    """Load job texts from files or fetch them concurrently from URLs.
+
+    ``job_text_file`` may be one path (the job is named "job") or a list of
+    paths (each job is named after its file). URLs that fail to fetch are
+    reported on stderr and skipped; an error is raised only when none of
+    them could be fetched.
+    """
     if job_text_file:
-        text = job_text_file.read_text(encoding="utf-8")
-        return [("job", text)]
+        paths = _job_text_paths(job_text_file)
+        texts = [
+            await asyncio.to_thread(path.read_text, encoding="utf-8") for path in paths
+        ]
+        if isinstance(job_text_file, (str, Path)):
+            return [("job", texts[0])]
+        return [(str(path), text) for path, text in zip(paths, texts)]
+
+    cleaned_urls = [_clean_job_url(url) for url in urls]
+
+    async def fetch_one(url: str) -> Tuple[str, Optional[str], Optional[Exception]]:
+        try:
+            text = await afetch_url_text(url, fetcher, http_cache, offline)
+            return url, text, None
+        except Exception as exc:  # noqa: BLE001
+            return url, None, exc
+
+    async with contextlib.AsyncExitStack() as stack:
+        if fetcher is None:
+            fetcher = await stack.enter_async_context(JobFetcher())
+        results = await asyncio.gather(*(fetch_one(url) for url in cleaned_urls))
 
     jobs = []
-    for url in urls:
-        cleaned_url = "".join(url.split())
-        if cleaned_url != url:
-            print(
-                "Warning: job URL contained whitespace; cleaned it before fetching.",
-                file=sys.stderr,
-            )
-            url = cleaned_url
-        text = fetch_url_text(url)
-        jobs.append((url, text))
+    failures = []
+    for url, text, error in results:
+        if error is not None:
+            reason = (str(error).splitlines() or [type(error).__name__])[0]
+            print(f"Warning: failed to fetch {url}: {reason}", file=sys.stderr)
+            failures.append(f"{url}: {reason}")
+        else:
+            jobs.append((url, text))
+
+    if failures and not jobs:
+        raise RuntimeError("Failed to fetch job postings: " + "; ".join(failures))
     return jobs
 
 
-def load_cv_text(path: Path) -> str:
-    if path.suffix.lower() == ".pdf":
-        reader = PdfReader(str(path))
-        pages = [(page.extract_text() or "") for page in reader.pages]
-        return "\n".join(pages).strip()
-    return path.read_text(encoding="utf-8")
+def _job_text_paths(job_text_file: str | Path | Sequence[str | Path]) -> List[Path]:
+    if isinstance(job_text_file, (str, Path)):
+        return [Path(job_text_file)]
+    return [Path(path) for path in job_text_file]
 
 
-def tailor_documents(
+def load_job_texts(
+    urls: Iterable[str],
+    job_text_file: str | Path | Sequence[str | Path] | None,
+    fetcher: Optional[JobFetcher] = None,
+    http_cache: Optional[HttpCache] = None,
+    offline: bool = False,
+) -> List[Tuple[str, str]]:
+    return run_sync(
+        aload_job_texts(urls, job_text_file, fetcher, http_cache, offline)
+    )
+
+
+def load_cv_text(path: Path, cache: Optional[CvTextCache] = None) -> str:
+    return read_cv_text(path, cache).text
+
+
+async def aload_cv_text(
+    cv_file: str | Path,
+    cache: Optional[CvTextCache] = None,
+    pdf_workers: int = DEFAULT_PDF_WORKERS,
+    verbose: bool = True,
+    run_stats: Optional[List[StageStats]] = None,
+) -> str:
+    """Load the base CV, logging how long text extraction took.
+
+    The time is recorded as the ``load_cv`` stage in ``run_stats``.
+    """
+    path = Path(cv_file)
+    stats = StageStats(None, "load_cv")
+    with stats.timed():
+        result = await asyncio.to_thread(read_cv_text, path, cache, pdf_workers)
+    if result.cached:
+        stats.cache_hits += 1
+    if run_stats is not None:
+        run_stats.append(stats)
+    if verbose:
+        if result.cached:
+            detail = "text served from cache"
+        elif result.pages:
+            detail = f"extracted {result.pages} page{'s' if result.pages != 1 else ''}"
+        else:
+            detail = "read text"
+        print(f"[cv] {path.name}: {detail} in {result.seconds:.3f}s")
+    return result.text
+
+
+def prepare_job_texts(
+    jobs: List[Tuple[str, str]], token_budget: Optional[int], verbose: bool
+) -> List[Tuple[str, str]]:
+    """Run prepare_job_text over ``(source, text)`` pairs, logging the token savings."""
+    prepared = []
+    tokens_before = tokens_after = 0
+    for source, job_text in jobs:
+        result = prepare_job_text(job_text, token_budget)
+        tokens_before += result.tokens_before
+        tokens_after += result.tokens_after
+        if verbose:
+            dropped = f" (dropped: {', '.join(result.dropped_sections)})" if result.dropped_sections else ""
+            truncated = f", truncated to the {token_budget}-token budget" if result.truncated else ""
+            print(
+                f"[job-text] {slugify(source)}: {result.tokens_before} -> "
+                f"{result.tokens_after} estimated tokens{truncated}{dropped}"
+            )
+        prepared.append((source, result.text))
+    if verbose and len(jobs) > 1 and tokens_before:
+        saved = 100 * (tokens_before - tokens_after) / tokens_before
+        print(
+            f"[job-text] total: {tokens_before} -> {tokens_after} estimated tokens "
+            f"({saved:.0f}% saved)"
+        )
+    return prepared
+
+
+async def atailor_documents(
     cv_file: str | Path,
     job_urls: Optional[Iterable[str]] = None,
-    job_text_file: str | Path | None = None,
+    job_text_file: str | Path | Sequence[str | Path] | None = None,
     out_dir: str | Path = "outputs",
     model: str = "gpt-5-mini",
     temperature: float = 0.2,
@@ -541,43 +1392,180 @@ def tailor_documents(
     verbose: bool = True,
     debug_artifacts: bool = True,
     include_cover_letter: bool = True,
+    candidate_json: dict | str | Path | None = None,
+    llm_cache: Optional[LlmCache] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    fetcher: Optional[JobFetcher] = None,
+    http_cache: Optional[HttpCache] = None,
+    cv_text_cache: Optional[CvTextCache] = None,
+    offline: bool = False,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    job_token_budget: Optional[int] = None,
+    profile: bool = False,
+    resume: bool = False,
+    incremental: bool = False,
+    pdf_workers: int = DEFAULT_PDF_WORKERS,
 ) -> List[Path]:
-    """Generate tailored CV and cover letter outputs from file/URL inputs."""
+    """Generate tailored CV and cover letter outputs from file/URL inputs.
+
+    Jobs are tailored concurrently on the running event loop, with at most
+    ``max_concurrency`` LLM calls in flight across all of them. The base CV is
+    parsed once and shared across all jobs. Pass ``candidate_json`` (a dict,
+    inline JSON string or Path to a JSON file) to skip the candidate parse
+    entirely, and ``llm_cache`` to serve repeated temperature-0 prompts (the
+    parse and audit stages) from the on-disk response cache.
+    ``fetcher`` controls concurrency, politeness and retries for job URLs;
+    ``http_cache`` stores their extracted text, and ``offline`` serves job
+    URLs from that cache only. ``cv_text_cache`` keeps the extracted text of
+    PDF CVs by file content. ``on_event`` receives progress events (see
+    aprocess_job); job loading is reported as the ``load_jobs`` stage.
+    Job text is stripped of boilerplate and cut to ``job_token_budget``
+    estimated tokens (None for no limit) before it reaches the prompts.
+    ``profile`` prints a per-stage time and token table when the run ends.
+    Stage results are checkpointed under ``out_dir/.checkpoints`` while a
+    job runs; ``resume`` reuses them to finish an interrupted run, and
+    ``incremental`` keeps them between runs (see aprocess_job).
+    When several jobs are tailored, their PDFs are rendered by a pool of
+    ``pdf_workers`` processes (0 to render on threads), so rendering one
+    job's PDFs overlaps with the other jobs' LLM calls.
+    """
     if not job_urls and not job_text_file:
         raise ValueError("Provide job_urls or job_text_file")
+    run_start = time.perf_counter()
+    run_stats: List[StageStats] = []
 
-    cv_text = load_cv_text(Path(cv_file))
+    cv_text = await aload_cv_text(cv_file, cv_text_cache, pdf_workers, verbose, run_stats)
+    candidate = load_candidate_json(candidate_json) if candidate_json else None
     out_dir_path = Path(out_dir)
-    job_text_path = Path(job_text_file) if job_text_file else None
-
-    jobs = load_job_texts(job_urls or [], job_text_path)
 
-    created_paths: List[Path] = []
-    for source, job_text in jobs:
-        slug = slugify(source)
-        created_paths.extend(
-            process_job(
-                cv_text=cv_text,
-                job_text=job_text,
-                out_dir=out_dir_path,
-                slug=slug,
-                model=model,
-                temperature=temperature,
-                dry_run=dry_run,
-                make_pdf=make_pdf,
-                verbose=verbose,
-                debug_artifacts=debug_artifacts,
-                include_cover_letter=include_cover_letter,
-            )
+    if on_event is not None:
+        on_event({"type": "stage_start", "job": None, "stage": "load_jobs"})
+    load_stats = StageStats(None, "load_jobs")
+    with load_stats.timed():
+        jobs = await aload_job_texts(
+            job_urls or [], job_text_file, fetcher, http_cache, offline
         )
+        jobs = await asyncio.to_thread(prepare_job_texts, jobs, job_token_budget, verbose)
+    run_stats.append(load_stats)
+    if on_event is not None:
+        on_event({"type": "stage_finish", "job": None, "stage": "load_jobs"})
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Starting worker processes is not worth it for a single job.
+    pdf_executor = get_pdf_executor(pdf_workers) if make_pdf and len(jobs) > 1 else None
+    job_paths = await gather_or_cancel(
+        aprocess_job(
+            cv_text=cv_text,
+            job_text=job_text,
+            out_dir=out_dir_path,
+            slug=slugify(source),
+            model=model,
+            temperature=temperature,
+            dry_run=dry_run,
+            make_pdf=make_pdf,
+            verbose=verbose,
+            debug_artifacts=debug_artifacts,
+            include_cover_letter=include_cover_letter,
+            candidate_json=candidate,
+            llm_cache=llm_cache,
+            semaphore=semaphore,
+            on_event=on_event,
+            run_stats=run_stats,
+            checkpoints=(
+                None
+                if dry_run
+                else _job_checkpoints(
+                    out_dir_path,
+                    slugify(source),
+                    job_stage_keys(
+                        cv_text, job_text, model, temperature, include_cover_letter, candidate
+                    ),
+                )
+            ),
+            resume=resume,
+            incremental=incremental,
+            pdf_executor=pdf_executor,
+        )
+        for source, job_text in jobs
+    )
+    created_paths = [path for paths in job_paths for path in paths]
+
+    if llm_cache is not None and verbose:
+        print(f"[llm-cache] {llm_cache.hits} hits, {llm_cache.misses} misses")
+    repairs = sum(stats.json_repairs for stats in run_stats)
+    rerequests = sum(stats.json_rerequests for stats in run_stats)
+    if verbose and (repairs or rerequests):
+        print(f"[json] {repairs} replies repaired locally, {rerequests} re-requested")
+    if profile:
+        print(format_profile(run_stats, time.perf_counter() - run_start))
 
     return created_paths
 
 
+def tailor_documents(
+    cv_file: str | Path,
+    job_urls: Optional[Iterable[str]] = None,
+    job_text_file: str | Path | Sequence[str | Path] | None = None,
+    out_dir: str | Path = "outputs",
+    model: str = "gpt-5-mini",
+    temperature: float = 0.2,
+    dry_run: bool = False,
+    make_pdf: bool = True,
+    verbose: bool = True,
+    debug_artifacts: bool = True,
+    include_cover_letter: bool = True,
+    candidate_json: dict | str | Path | None = None,
+    llm_cache: Optional[LlmCache] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    fetcher: Optional[JobFetcher] = None,
+    http_cache: Optional[HttpCache] = None,
+    cv_text_cache: Optional[CvTextCache] = None,
+    offline: bool = False,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    job_token_budget: Optional[int] = None,
+    profile: bool = False,
+    resume: bool = False,
+    incremental: bool = False,
+    pdf_workers: int = DEFAULT_PDF_WORKERS,
+) -> List[Path]:
+    """Blocking wrapper around atailor_documents.
+
+    ``on_event`` is called from the background event loop's thread.
+    """
+    return run_sync(
+        atailor_documents(
+            cv_file=cv_file,
+            job_urls=job_urls,
+            job_text_file=job_text_file,
+            out_dir=out_dir,
+            model=model,
+            temperature=temperature,
+            dry_run=dry_run,
+            make_pdf=make_pdf,
+            verbose=verbose,
+            debug_artifacts=debug_artifacts,
+            include_cover_letter=include_cover_letter,
+            candidate_json=candidate_json,
+            llm_cache=llm_cache,
+            max_concurrency=max_concurrency,
+            fetcher=fetcher,
+            http_cache=http_cache,
+            cv_text_cache=cv_text_cache,
+            offline=offline,
+            on_event=on_event,
+            job_token_budget=job_token_budget,
+            profile=profile,
+            resume=resume,
+            incremental=incremental,
+            pdf_workers=pdf_workers,
+        )
+    )
+
+
 def create_cv_only(
     cv_file: str | Path,
     job_urls: Optional[Iterable[str]] = None,
-    job_text_file: str | Path | None = None,
+    job_text_file: str | Path | Sequence[str | Path] | None = None,
     out_dir: str | Path = "outputs",
     model: str = "gpt-5-mini",
     temperature: float = 0.2,
@@ -585,6 +1573,8 @@ def create_cv_only(
     make_pdf: bool = True,
     verbose: bool = True,
     debug_artifacts: bool = True,
+    candidate_json: dict | str | Path | None = None,
+    llm_cache: Optional[LlmCache] = None,
 ) -> List[Path]:
     """Generate only the tailored CV outputs from file/URL inputs."""
     return tailor_documents(
@@ -599,4 +1589,6 @@ def create_cv_only(
         verbose=verbose,
         debug_artifacts=debug_artifacts,
         include_cover_letter=False,
+        candidate_json=candidate_json,
+        llm_cache=llm_cache,
     )
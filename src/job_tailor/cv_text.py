@@ -0,0 +1,156 @@
+"""CV text extraction with an on-disk cache keyed by file content."""
+
+import hashlib
+import io
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional
+
+import pypdf
+from pypdf import PdfReader
+
+from .llm_cache import DEFAULT_CACHE_DIR
+from .pdf_pool import DEFAULT_PDF_WORKERS, get_pdf_executor
+
+DEFAULT_MAX_ENTRIES = 256
+# Below this many pages, starting worker processes costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+
+class CvText(NamedTuple):
+    text: str
+    pages: int
+    cached: bool
+    seconds: float
+
+
+def cv_content_key(data: bytes) -> str:
+    """Hash of a CV file's bytes and the pypdf version that extracts it."""
+    digest = hashlib.sha256(pypdf.__version__.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class CvTextCache:
+    """SQLite store of extracted CV text keyed by content hash.
+
+    The same PDF saved under a new name (as the UI does for every upload)
+    hits the same entry. The least recently used entries beyond
+    ``max_entries`` are evicted.
+    """
+
+    def __init__(
+        self, cache_dir: str | Path = DEFAULT_CACHE_DIR, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self.path = Path(cache_dir) / "cv_text_cache.sqlite3"
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cv_texts (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    pages INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[CvText]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT text, pages FROM cv_texts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE cv_texts SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        self.hits += 1
+        return CvText(row[0], row[1], True, 0.0)
+
+    def put(self, key: str, text: str, pages: int) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cv_texts (key, text, pages, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, pages, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM cv_texts WHERE key NOT IN "
+                "(SELECT key FROM cv_texts ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> int:
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM cv_texts").rowcount
+
+
+def extract_pdf_pages(data: bytes, start: int, stop: int) -> List[str]:
+    """Text of pages ``start`` to ``stop - 1``; runs in pool workers too."""
+    reader = PdfReader(io.BytesIO(data))
+    return [(reader.pages[index].extract_text() or "") for index in range(start, stop)]
+
+
+def extract_pdf_text(data: bytes, workers: int = DEFAULT_PDF_WORKERS) -> CvText:
+    """Extract a PDF's text, splitting long documents across the PDF process pool."""
+    start_time = time.perf_counter()
+    reader = PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+    executor = None
+    if page_count >= PARALLEL_MIN_PAGES and workers > 1:
+        executor = get_pdf_executor(workers)
+    if executor is None:
+        pages = [(page.extract_text() or "") for page in reader.pages]
+    else:
+        # Each worker parses the file itself and extracts a contiguous range.
+        step = -(-page_count // workers)
+        futures = [
+            executor.submit(extract_pdf_pages, data, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        pages = [text for future in futures for text in future.result()]
+    text = "\n".join(pages).strip()
+    return CvText(text, page_count, False, time.perf_counter() - start_time)
+
+
+def read_cv_text(
+    path: Path,
+    cache: Optional[CvTextCache] = None,
+    workers: int = DEFAULT_PDF_WORKERS,
+) -> CvText:
+    """Load a Markdown/text CV, or extract a PDF CV's text via ``cache``."""
+    start_time = time.perf_counter()
+    if path.suffix.lower() != ".pdf":
+        text = path.read_text(encoding="utf-8")
+        return CvText(text, 0, False, time.perf_counter() - start_time)
+
+    data = path.read_bytes()
+    key = cv_content_key(data)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        return cached._replace(seconds=time.perf_counter() - start_time)
+    result = extract_pdf_text(data, workers)
+    if cache is not None:
+        cache.put(key, result.text, result.pages)
+    return result._replace(seconds=time.perf_counter() - start_time)
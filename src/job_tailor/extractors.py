@@ -0,0 +1,276 @@
+"""Site-specific extraction of job descriptions from HTML pages."""
+
+import html as html_lib
+import json
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import lxml.html
+from lxml import etree
+
+# Bump when extractor output changes so cached page text is re-extracted.
+EXTRACTOR_VERSION = 1
+
+# Shorter descriptions are usually teasers; let the next extractor try.
+MIN_DESCRIPTION_CHARS = 200
+
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "table", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "footer", "blockquote",
+}
+# Elements whose content is never visible text.
+SKIPPED_TAGS = {"script", "style", "noscript", "svg"}
+
+ExtractorFunc = Callable[[lxml.html.HtmlElement], Optional[str]]
+
+
+class Extractor(NamedTuple):
+    name: str
+    hosts: Tuple[str, ...]
+    func: ExtractorFunc
+
+
+_extractors: List[Extractor] = []
+
+
+def register_extractor(
+    name: str, hosts: Tuple[str, ...] = ()
+) -> Callable[[ExtractorFunc], ExtractorFunc]:
+    """Register an extractor, tried in registration order.
+
+    ``hosts`` restricts it to URLs whose host ends with one of the entries
+    (``"efinancialcareers."`` style prefixes match anywhere in the host);
+    an empty tuple applies it to every page.
+    """
+
+    def decorator(func: ExtractorFunc) -> ExtractorFunc:
+        _extractors.append(Extractor(name, hosts, func))
+        return func
+
+    return decorator
+
+
+def _host_matches(host: str, hosts: Tuple[str, ...]) -> bool:
+    if not hosts:
+        return True
+    for pattern in hosts:
+        if pattern.endswith("."):
+            if pattern in host:
+                return True
+        elif host == pattern or host.endswith("." + pattern):
+            return True
+    return False
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _text_pieces(element: lxml.html.HtmlElement, blocks: bool) -> Iterator[str]:
+    """Yield the text of ``element`` in document order, skipping SKIPPED_TAGS.
+
+    With ``blocks``, list items are prefixed with "- " and a newline follows
+    each block element. The tree is only read, so extractors can share it.
+    """
+    skipping = 0
+    for event, node in etree.iterwalk(element, events=("start", "end")):
+        tag = node.tag if isinstance(node.tag, str) else None
+        if event == "start":
+            if skipping or tag in SKIPPED_TAGS:
+                skipping += 1
+            else:
+                if blocks and tag == "li":
+                    yield "- "
+                if tag is not None and node.text:
+                    yield node.text
+            continue
+        if skipping:
+            skipping -= 1
+            if skipping:
+                continue
+        elif blocks and tag in BLOCK_TAGS and node is not element:
+            yield "\n"
+        if node is not element and node.tail:
+            yield node.tail
+
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    """Return the visible text of ``element`` with one line per block."""
+    lines = [ln.strip() for ln in "".join(_text_pieces(element, blocks=True)).splitlines()]
+    return "\n".join(ln for ln in lines if ln and ln != "-")
+
+
+def page_text(doc: lxml.html.HtmlElement) -> str:
+    """Return every visible text node of a page, one per line (generic fallback)."""
+    pieces = (piece.strip() for piece in _text_pieces(doc, blocks=False))
+    lines = [ln.strip() for ln in "\n".join(p for p in pieces if p).splitlines()]
+    return "\n".join(ln for ln in lines if ln)
+
+
+def html_fragment_text(fragment: str) -> str:
+    if "&lt;" in fragment:
+        fragment = html_lib.unescape(fragment)
+    if "<" not in fragment:
+        return fragment.strip()
+    return element_text(lxml.html.fragment_fromstring(fragment, create_parent="div"))
+
+
+def _first_text(doc: lxml.html.HtmlElement, xpath: str) -> str:
+    for element in doc.xpath(xpath):
+        text = " ".join(element.text_content().split())
+        if text:
+            return text
+    return ""
+
+
+def _compose(header: List[Tuple[str, Any]], description: str) -> Optional[str]:
+    if len(description) < MIN_DESCRIPTION_CHARS:
+        return None
+    lines = [f"{label}: {value}" for label, value in header if value]
+    return "\n".join(lines + ["", description]).strip()
+
+
+def _iter_json_ld(data: Any) -> Iterator[dict]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld(data["@graph"])
+
+
+def _is_job_posting(item: dict) -> bool:
+    kind = item.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return "JobPosting" in kinds
+
+
+def _name(value: Any) -> str:
+    if isinstance(value, dict):
+        return str(value.get("name") or "")
+    if isinstance(value, list):
+        return ", ".join(filter(None, (_name(item) for item in value)))
+    return str(value or "")
+
+
+def _location(value: Any) -> str:
+    if isinstance(value, list):
+        return "; ".join(filter(None, (_location(item) for item in value)))
+    if not isinstance(value, dict):
+        return str(value or "")
+    address = value.get("address", value)
+    if not isinstance(address, dict):
+        return str(address or "")
+    parts = [
+        address.get("addressLocality"),
+        address.get("addressRegion"),
+        _name(address.get("addressCountry")),
+    ]
+    return ", ".join(str(part) for part in parts if part)
+
+
+@register_extractor("json-ld")
+def extract_json_ld(doc: lxml.html.HtmlElement) -> Optional[str]:
+    for script in doc.xpath("//script[@type='application/ld+json']"):
+        try:
+            data = json.loads(script.text or "", strict=False)
+        except ValueError:
+            continue
+        for item in _iter_json_ld(data):
+            if not _is_job_posting(item):
+                continue
+            text = _compose(
+                [
+                    ("Title", item.get("title")),
+                    ("Company", _name(item.get("hiringOrganization"))),
+                    ("Location", _location(item.get("jobLocation"))),
+                    ("Employment type", _name(item.get("employmentType"))),
+                ],
+                html_fragment_text(str(item.get("description") or "")),
+            )
+            if text:
+                return text
+    return None
+
+
+def _container_extractor(
+    title_xpath: str, company_xpath: str, location_xpath: str, description_xpaths: Tuple[str, ...]
+) -> ExtractorFunc:
+    def extract(doc: lxml.html.HtmlElement) -> Optional[str]:
+        for xpath in description_xpaths:
+            containers = doc.xpath(xpath)
+            if not containers:
+                continue
+            text = _compose(
+                [
+                    ("Title", _first_text(doc, title_xpath)),
+                    ("Company", _first_text(doc, company_xpath)),
+                    ("Location", _first_text(doc, location_xpath)),
+                ],
+                element_text(containers[0]),
+            )
+            if text:
+                return text
+        return None
+
+    return extract
+
+
+register_extractor("linkedin", hosts=("linkedin.com",))(
+    _container_extractor(
+        title_xpath=_class_xpath("h1", "top-card-layout__title") + " | //h1",
+        company_xpath=_class_xpath("a", "topcard__org-name-link"),
+        location_xpath=_class_xpath("span", "topcard__flavor--bullet"),
+        description_xpaths=(
+            _class_xpath("div", "show-more-less-html__markup"),
+            _class_xpath("div", "description__text"),
+            _class_xpath("div", "jobs-description__content"),
+        ),
+    )
+)
+
+register_extractor("efinancialcareers", hosts=("efinancialcareers.",))(
+    _container_extractor(
+        title_xpath="//h1",
+        company_xpath=_class_xpath("*", "company-name") + " | " + _class_xpath("*", "job-company"),
+        location_xpath=_class_xpath("*", "job-location") + " | " + _class_xpath("*", "location"),
+        description_xpaths=(
+            "//efc-job-description",
+            _class_xpath("*", "job-description"),
+            _class_xpath("*", "jobDescription"),
+        ),
+    )
+)
+
+
+def parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse a page once for the extractors and ``page_text``; None if it is empty or unparseable."""
+    if not html.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def extract_structured_text(html: str, url: str = "") -> Optional[Tuple[str, str]]:
+    """Return ``(extractor name, text)`` from the first matching extractor.
+
+    Returns None when no registered extractor recognises the page, so the
+    caller can fall back to generic whole-page extraction.
+    """
+    doc = parse_html(html)
+    return None if doc is None else extract_document_text(doc, url)
+
+
+def extract_document_text(doc: lxml.html.HtmlElement, url: str = "") -> Optional[Tuple[str, str]]:
+    """extract_structured_text for a page already parsed with ``parse_html``."""
+    host = urlsplit(url).netloc.lower()
+    for extractor in _extractors:
+        if not _host_matches(host, extractor.hosts):
+            continue
+        text = extractor.func(doc)
+        if text:
+            return extractor.name, text
+    return None
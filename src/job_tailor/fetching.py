@@ -0,0 +1,146 @@
+"""Concurrent, polite fetching of job posting pages."""
+
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+}
+
+DEFAULT_FETCH_CONCURRENCY = 8
+DEFAULT_PER_HOST_CONCURRENCY = 2
+DEFAULT_PER_HOST_DELAY = 1.0
+DEFAULT_FETCH_RETRIES = 3
+DEFAULT_FETCH_BACKOFF = 1.0
+DEFAULT_FETCH_TIMEOUT = 20.0
+MAX_RETRY_AFTER = 60.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _retry_after_seconds(resp: httpx.Response) -> float:
+    value = resp.headers.get("Retry-After", "")
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except ValueError:
+        return 0.0
+
+
+class JobFetcher:
+    """Fetch job pages over one pooled connection with per-host politeness.
+
+    At most ``max_concurrency`` requests run at once, and at most
+    ``per_host_concurrency`` of them target the same host, spaced at least
+    ``per_host_delay`` seconds apart. Transport errors, 429s and 5xx responses
+    are retried with jittered exponential backoff (honouring Retry-After).
+
+    A fetcher binds its connection pool to the event loop that first uses it;
+    use it from a single loop and close it with ``aclose`` (or ``async with``).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        per_host_delay: float = DEFAULT_PER_HOST_DELAY,
+        retries: int = DEFAULT_FETCH_RETRIES,
+        backoff: float = DEFAULT_FETCH_BACKOFF,
+        timeout: float = DEFAULT_FETCH_TIMEOUT,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_delay = per_host_delay
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._next_request_at: Dict[str, float] = {}
+
+    async def __aenter__(self) -> "JobFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=FETCH_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+
+    def _backoff_delay(self, attempt: int) -> float:
+        base = self.backoff * (2**attempt)
+        return base / 2 + random.uniform(0, base / 2)
+
+    async def _wait_for_host_slot(self, host: str) -> None:
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._next_request_at.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at[host] = time.monotonic() + self.per_host_delay
+
+    async def fetch(self, url: str) -> str:
+        """Return the page body for ``url``, retrying transient failures."""
+        resp = await self.fetch_response(url)
+        return resp.text
+
+    async def fetch_response(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Return the response for ``url``, retrying transient failures.
+
+        A 304 Not Modified is returned as-is so conditional requests can be
+        answered from a cache; other non-2xx responses raise.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        host = urlsplit(url).netloc.lower()
+        host_semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.per_host_concurrency)
+        )
+        client = self._get_client()
+
+        # The global slot is held only for the request itself, so tasks
+        # queued behind a busy host (or its politeness delay) never keep
+        # fetches to other hosts waiting.
+        async with host_semaphore:
+            attempt = 0
+            while True:
+                await self._wait_for_host_slot(host)
+                try:
+                    async with self._semaphore:
+                        resp = await client.get(url, headers=headers)
+                except httpx.TransportError:
+                    if attempt >= self.retries:
+                        raise
+                    delay = self._backoff_delay(attempt)
+                else:
+                    if resp.status_code == 304:
+                        return resp
+                    if resp.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                        resp.raise_for_status()
+                        return resp
+                    delay = max(self._backoff_delay(attempt), _retry_after_seconds(resp))
+                attempt += 1
+                await asyncio.sleep(delay)
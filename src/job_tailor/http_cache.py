@@ -0,0 +1,114 @@
+"""On-disk cache of extracted job page text with HTTP validators."""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from .extractors import EXTRACTOR_VERSION
+from .llm_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_HTTP_CACHE_TTL = 24 * 60 * 60
+
+
+class CachedPage(NamedTuple):
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class HttpCache:
+    """SQLite store of extracted page text keyed by URL.
+
+    Entries younger than ``ttl_seconds`` are served without touching the
+    network; older ones are revalidated with If-None-Match/If-Modified-Since
+    so an unchanged page costs a 304 and no HTML parsing. Entries written by
+    an older extractor version are ignored so the page is extracted afresh.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_HTTP_CACHE_TTL,
+    ) -> None:
+        self.path = Path(cache_dir) / "http_cache.sqlite3"
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    extractor_version INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(pages)")}
+            if "extractor_version" not in columns:
+                conn.execute(
+                    "ALTER TABLE pages ADD COLUMN extractor_version INTEGER NOT NULL DEFAULT 0"
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT text, etag, last_modified, fetched_at FROM pages "
+                "WHERE url = ? AND extractor_version = ?",
+                (url, EXTRACTOR_VERSION),
+            ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.ttl_seconds
+
+    def conditional_headers(self, page: CachedPage) -> Dict[str, str]:
+        headers = {}
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, text, etag, last_modified, fetched_at, extractor_version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, text, etag, last_modified, time.time(), EXTRACTOR_VERSION),
+            )
+
+    def touch(self, url: str) -> None:
+        """Mark a revalidated (304) entry as fresh again."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+
+    def clear(self) -> int:
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM pages").rowcount
@@ -0,0 +1,280 @@
+"""Boilerplate stripping and token budgeting of job posting text."""
+
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+# The CLI's --job-token-budget default; library calls do not cap job text
+# unless given a budget.
+DEFAULT_JOB_TOKEN_BUDGET = 3000
+
+# Short page-chrome lines dropped when they make up the whole line.
+BOILERPLATE_LINES = re.compile(
+    r"^(?:"
+    r"apply(?: now| for this job)?|easy apply|save(?: job)?|share(?: this job)?|"
+    r"report this job|sign in|join now|log in|register|show more|show less|"
+    r"see more|see less|skip to main content|back to (?:search|results)|"
+    r"copy link|follow|posted \d+ \w+ ago|\d+ applicants?|"
+    r"(?:be an )?early applicant|promoted|actively recruiting|"
+    r"(?:accept|reject|manage)(?: all)? cookies|cookie settings|"
+    r"privacy policy|terms of (?:use|service)|user agreement|"
+    r"(?:©|\(c\)|copyright).*|all rights reserved\.?"
+    r")$",
+    re.IGNORECASE,
+)
+
+# Cookie and browser banner sentences: a line is dropped when it starts with
+# one of these or mentions a cookie notice, but only if it is short and not a
+# bullet, so requirement lines that happen to contain the words are kept.
+BOILERPLATE_SENTENCES = re.compile(
+    r"^(?:we use cookies|this (?:web)?site uses cookies|by clicking|by continuing|"
+    r"(?:please )?enable javascript|javascript is (?:disabled|required)|"
+    r"your browser (?:is|does)|(?:please )?(?:update|upgrade) your browser)"
+    r"|accept all cookies|use of cookies|cookie policy|all rights reserved",
+    re.IGNORECASE,
+)
+MAX_BANNER_CHARS = 240
+
+# Section heading keywords, matched as whole words (stems take an -s, -y or
+# -ies ending), and the value of the text that follows them. The keyword that
+# appears first in a heading decides, so "privacy and data experience" is a
+# privacy section. Value 0 sections are never kept; lower values are dropped
+# first when the text is over budget, and value 3 sections are only ever
+# truncated.
+SECTION_VALUES: Tuple[Tuple[int, Tuple[str, ...]], ...] = (
+    (
+        0,
+        (
+            "similar jobs",
+            "people also viewed",
+            "related jobs",
+            "more jobs",
+            "recommended jobs",
+            "jobs you may",
+            "other jobs",
+            "similar searches",
+        ),
+    ),
+    (
+        3,
+        (
+            "responsibilit",
+            "requirement",
+            "qualification",
+            "skills",
+            "experience",
+            "what you will do",
+            "what you'll do",
+            "what you’ll do",
+            "the role",
+            "about the job",
+            "duties",
+            "must have",
+            "nice to have",
+            "you have",
+            "you will",
+            "tech stack",
+            "tools",
+        ),
+    ),
+    (
+        1,
+        (
+            "about us",
+            "about the company",
+            "company overview",
+            "who we are",
+            "our culture",
+            "benefits",
+            "perks",
+            "what we offer",
+            "why join",
+            "equal opportunit",
+            "diversity",
+            "how to apply",
+            "application process",
+            "privacy",
+            "disclaimer",
+        ),
+    ),
+    (
+        2,
+        (
+            "about you",
+            "who you are",
+            "the team",
+            "overview",
+            "description",
+            "compensation",
+            "salary",
+            "location",
+        ),
+    ),
+)
+
+_HEADING_KEYWORDS = [
+    (re.compile(r"\b" + re.escape(keyword) + r"(?:s|y|ies)?\b"), value)
+    for value, keywords in SECTION_VALUES
+    for keyword in keywords
+]
+
+MAX_HEADING_CHARS = 60
+MAX_HEADING_WORDS = 6
+BULLET_CHARS = "-*•·–—▪●"
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class PreparedJobText(NamedTuple):
+    text: str
+    tokens_before: int
+    tokens_after: int
+    dropped_lines: int
+    dropped_sections: List[str]
+    truncated: bool
+
+
+class _Section(NamedTuple):
+    heading: str
+    value: int
+    lines: List[str]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the tokenizer's count without calling it.
+
+    Words cost one token per four characters (rounded up) and punctuation one
+    each, which tracks BPE tokenizers to within ~10% on English job posts.
+    """
+    return sum((len(piece) + 3) // 4 for piece in _TOKEN_RE.findall(text))
+
+
+def _normalize(line: str) -> str:
+    return " ".join(line.casefold().split())
+
+
+def _is_boilerplate(line: str) -> bool:
+    normalized = _normalize(line)
+    if len(normalized) <= MAX_HEADING_CHARS and BOILERPLATE_LINES.match(normalized):
+        return True
+    if len(normalized) > MAX_BANNER_CHARS or normalized[:1] in BULLET_CHARS:
+        return False
+    return BOILERPLATE_SENTENCES.search(normalized) is not None
+
+
+def _heading_value(line: str) -> Optional[int]:
+    normalized = _normalize(line).rstrip(":")
+    if (
+        len(normalized) > MAX_HEADING_CHARS
+        or len(normalized.split()) > MAX_HEADING_WORDS
+        or normalized.endswith(".")
+        or normalized[:1] in BULLET_CHARS
+    ):
+        return None
+    best: Optional[Tuple[int, int, int]] = None
+    for pattern, value in _HEADING_KEYWORDS:
+        match = pattern.search(normalized)
+        # Earliest match wins, then the longest keyword at that position.
+        if match is not None and (best is None or (match.start(), -len(match.group())) < best[:2]):
+            best = (match.start(), -len(match.group()), value)
+    return None if best is None else best[2]
+
+
+def _split_sections(lines: List[str]) -> List[_Section]:
+    # Text before the first heading usually carries the title and company.
+    sections = [_Section("", 3, [])]
+    for line in lines:
+        value = _heading_value(line)
+        if value is None:
+            sections[-1].lines.append(line)
+        else:
+            sections.append(_Section(line, value, [line]))
+    return sections
+
+
+def _clip(line: str, budget: int) -> str:
+    used = 0
+    for match in _TOKEN_RE.finditer(line):
+        used += (len(match.group()) + 3) // 4
+        if used > budget:
+            return line[: match.start()].rstrip()
+    return line
+
+
+def _truncate(lines: List[str], budget: int) -> List[str]:
+    kept: List[str] = []
+    used = 0
+    for line in lines:
+        cost = estimate_tokens(line)
+        if used + cost > budget:
+            # A single over-long first line is clipped rather than dropped,
+            # so the prompt always carries some job text.
+            if not kept:
+                kept.append(_clip(line, budget))
+            break
+        kept.append(line)
+        used += cost
+    return kept
+
+
+def prepare_job_text(text: str, token_budget: Optional[int] = None) -> PreparedJobText:
+    """Strip boilerplate and repeats from ``text`` and fit it to a budget.
+
+    Repeated lines (three or more words) are kept once, page chrome and cookie
+    banners are removed, and "similar jobs" style sections are dropped. If the
+    result still exceeds ``token_budget`` estimated tokens, whole sections are
+    dropped lowest value first (company blurbs and benefits before
+    responsibilities and requirements), then the remainder is truncated.
+    With the default ``token_budget=None`` nothing is cut for length.
+    """
+    tokens_before = estimate_tokens(text)
+    raw_lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+
+    seen = set()
+    lines: List[str] = []
+    for line in raw_lines:
+        if _is_boilerplate(line):
+            continue
+        key = _normalize(line)
+        if len(key.split()) >= 3:
+            if key in seen:
+                continue
+            seen.add(key)
+        lines.append(line)
+
+    sections = _split_sections(lines)
+    dropped_sections = [section.heading for section in sections if section.value == 0]
+    sections = [section for section in sections if section.value > 0]
+
+    costs = [estimate_tokens("\n".join(section.lines)) for section in sections]
+    if token_budget is not None and sum(costs) > token_budget:
+        # Lowest value first, and later sections before earlier ones.
+        order = sorted(
+            (index for index, section in enumerate(sections) if section.value < 3),
+            key=lambda index: (sections[index].value, -index),
+        )
+        removed = set()
+        total = sum(costs)
+        for index in order:
+            if total <= token_budget:
+                break
+            removed.add(index)
+            total -= costs[index]
+            dropped_sections.append(sections[index].heading)
+        sections = [section for index, section in enumerate(sections) if index not in removed]
+
+    kept_lines = [line for section in sections for line in section.lines]
+    truncated = False
+    if token_budget is not None:
+        budgeted = _truncate(kept_lines, token_budget)
+        truncated = budgeted != kept_lines
+        kept_lines = budgeted
+
+    result = "\n".join(kept_lines)
+    return PreparedJobText(
+        text=result,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(result),
+        dropped_lines=len(raw_lines) - len(kept_lines),
+        dropped_sections=[heading for heading in dropped_sections if heading],
+        truncated=truncated,
+    )
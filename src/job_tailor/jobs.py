@@ -0,0 +1,247 @@
+"""Bounded background job queue for the UI server."""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 20
+DEFAULT_MAX_RETAINED = 200
+# Raw events kept per running job for followers reading it live.
+MAX_LIVE_EVENTS = 1000
+
+JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+Runner = Callable[[dict[str, Any], Callable[[dict[str, Any]], None]], dict[str, Any]]
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class Job:
+    def __init__(self, job_id: str, run_kwargs: dict[str, Any]) -> None:
+        self.id = job_id
+        self.run_kwargs: dict[str, Any] | None = run_kwargs
+        self.status = "queued"
+        self.stage: str | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.result: dict[str, Any] | None = None
+        self.message: str | None = None
+        # Recent raw events, the total recorded (followers' cursor), and
+        # every event with streamed tokens merged per job and stage.
+        self.events: deque[dict[str, Any]] = deque(maxlen=MAX_LIVE_EVENTS)
+        self.event_count = 0
+        self.history: list[tuple[dict[str, Any], list[str]]] = []
+        self._token_entries: dict[tuple[Any, Any], int] = {}
+        self.changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"done", "error"}
+
+    def record(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+        self.event_count += 1
+        if event.get("type") != "token":
+            self.history.append((event, []))
+            return
+        key = (event.get("job"), event.get("stage"))
+        index = self._token_entries.get(key)
+        if index is None:
+            index = self._token_entries[key] = len(self.history)
+            self.history.append((event, []))
+        self.history[index][1].append(event.get("text", ""))
+
+    def replay(self) -> list[dict[str, Any]]:
+        return [{**event, "text": "".join(parts)} if parts else event for event, parts in self.history]
+
+    def forget_events(self) -> None:
+        self.events.clear()
+        self.history = []
+        self._token_entries = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "message": self.message,
+        }
+
+
+class JobQueue:
+    """Run submitted jobs on a fixed pool of worker threads.
+
+    At most ``max_queue`` jobs may wait for a worker; further submissions
+    raise QueueFullError. Job state is written to ``state_dir`` on every
+    status change so finished results outlive the browser session (and the
+    server process). Progress events are kept in memory while a job runs,
+    with its streamed tokens merged per stage for replay, and dropped once
+    its result is persisted.
+    """
+
+    def __init__(
+        self,
+        runner: Runner,
+        state_dir: Path,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_retained: int = DEFAULT_MAX_RETAINED,
+    ) -> None:
+        self.runner = runner
+        self.state_dir = state_dir
+        self.max_retained = max_retained
+        self._pending: queue.Queue[Job] = queue.Queue(maxsize=max_queue)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._mark_interrupted()
+        for index in range(workers):
+            threading.Thread(
+                target=self._work, name=f"job-worker-{index}", daemon=True
+            ).start()
+
+    def _state_path(self, job_id: str) -> Path:
+        return self.state_dir / f"{job_id}.json"
+
+    def _persist(self, job: Job) -> None:
+        path = self._state_path(job.id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(job.to_dict()), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _mark_interrupted(self) -> None:
+        for path in self.state_dir.glob("*.json"):
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if record.get("status") in {"queued", "running"}:
+                record["status"] = "error"
+                record["message"] = "Interrupted by a server restart."
+                path.write_text(json.dumps(record), encoding="utf-8")
+
+    def submit(self, run_kwargs: dict[str, Any]) -> Job:
+        job = Job(uuid.uuid4().hex, run_kwargs)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._pending.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job.id, None)
+            raise QueueFullError("The job queue is full; try again shortly.")
+        with job.changed:
+            self._persist(job)
+        return job
+
+    def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for queued and running jobs; False if some remain."""
+        deadline = time.monotonic() + timeout
+        with self._pending.all_tasks_done:
+            while self._pending.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._pending.all_tasks_done.wait(remaining)
+        return True
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        if not JOB_ID_RE.match(job_id):
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            with job.changed:
+                return job.to_dict()
+        path = self._state_path(job_id)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def wait_for_events(
+        self, job_id: str, start: int, timeout: float
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """Return events after cursor ``start``, the next cursor and whether the job has finished.
+
+        A ``start`` of 0 replays the run so far, with streamed tokens merged
+        into one event per stage. Blocks for up to ``timeout`` seconds while
+        the job is running and has no new events. Finished jobs and jobs no
+        longer held in memory report no events.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return [], start, True
+        with job.changed:
+            if job.event_count <= start and not job.finished:
+                job.changed.wait(timeout)
+            if start == 0:
+                return job.replay(), job.event_count, job.finished
+            # A follower more than MAX_LIVE_EVENTS behind skips the oldest ones.
+            skip = max(0, start - (job.event_count - len(job.events)))
+            return list(job.events)[skip:], job.event_count, job.finished
+
+    def _record_event(self, job: Job, event: dict[str, Any]) -> None:
+        with job.changed:
+            job.record(event)
+            if event.get("type") == "stage_start":
+                job.stage = event.get("stage")
+                self._persist(job)
+            job.changed.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            job = self._pending.get()
+            try:
+                self._run(job)
+            finally:
+                self._pending.task_done()
+
+    def _run(self, job: Job) -> None:
+        with job.changed:
+            job.status = "running"
+            job.started_at = time.time()
+            self._persist(job)
+
+        run_kwargs = job.run_kwargs or {}
+        job.run_kwargs = None
+        try:
+            result = self.runner(run_kwargs, lambda event: self._record_event(job, event))
+        except Exception as exc:  # noqa: BLE001
+            status, result, message = "error", None, str(exc)
+        else:
+            status, message = "done", None
+
+        with job.changed:
+            job.status = status
+            job.result = result
+            job.message = message
+            job.finished_at = time.time()
+            self._persist(job)
+            job.forget_events()
+            job.changed.notify_all()
+        self._trim()
+
+    def _trim(self) -> None:
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[: max(0, len(finished) - self.max_retained)]:
+                del self._jobs[job_id]
@@ -0,0 +1,104 @@
+"""Local repair of almost-valid JSON emitted by language models."""
+
+from typing import List
+
+_CLOSERS = {"{": "}", "[": "]"}
+_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+def repair_json(text: str) -> str:
+    """Return ``text`` with common LLM JSON mistakes fixed.
+
+    Handles prose or code fences around the value, trailing commas, raw
+    newlines and tabs inside strings, and output truncated mid-value
+    (unterminated strings, dangling keys and unbalanced brackets). Anything
+    after the first complete top-level value is dropped. The result is not
+    guaranteed to parse; callers should still handle ``json.loads`` errors.
+    """
+    starts = [pos for pos in (text.find("{"), text.find("[")) if pos != -1]
+    if not starts:
+        return text
+    text = text[min(starts) :]
+
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char in _ESCAPES:
+                out.append(_ESCAPES[char])
+                continue
+            elif ord(char) < 0x20:
+                out.append(f"\\u{ord(char):04x}")
+                continue
+            out.append(char)
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+        elif char in "}]":
+            _strip_trailing_comma(out)
+            if not stack:
+                break
+            # Close whatever is open up to the matching bracket.
+            while stack and stack[-1] != char:
+                out.append(stack.pop())
+            if stack:
+                stack.pop()
+            out.append(char)
+            if not stack:
+                break
+            continue
+        out.append(char)
+
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    _strip_trailing_comma(out)
+    if _last_significant(out) == ":":
+        out.append(" null")
+    elif stack and stack[-1] == "}" and _ends_with_bare_key(out):
+        out.append(": null")
+    while stack:
+        out.append(stack.pop())
+    return "".join(out)
+
+
+def _last_significant(out: List[str]) -> str:
+    for chunk in reversed(out):
+        stripped = chunk.strip()
+        if stripped:
+            return stripped[-1]
+    return ""
+
+
+def _strip_trailing_comma(out: List[str]) -> None:
+    while out and not out[-1].strip():
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
+def _ends_with_bare_key(out: List[str]) -> bool:
+    """True when the object ends in ``{"key"`` or ``, "key"`` (no colon yet)."""
+    text = "".join(out).rstrip()
+    if not text.endswith('"'):
+        return False
+    index = len(text) - 2
+    while index >= 0:
+        if text[index] == '"' and (index == 0 or text[index - 1] != "\\"):
+            break
+        index -= 1
+    before = text[:index].rstrip()
+    return before.endswith(("{", ","))
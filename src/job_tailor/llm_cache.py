@@ -0,0 +1,161 @@
+"""Persistent, content-addressed cache for LLM responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("JOB_TAILOR_CACHE_DIR", Path.home() / ".cache" / "job_tailor")
+)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+def llm_cache_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    temperature: Optional[float],
+    response_format: Optional[str] = None,
+) -> str:
+    parts: list = [model, system_prompt, prompt, temperature]
+    if response_format is not None:
+        # Appended only when set, so plain-text entries keep their keys.
+        parts.append(response_format)
+    payload = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LlmCache:
+    """SQLite-backed response cache with size- and age-based LRU eviction.
+
+    Entries are keyed by model, system prompt, user prompt, temperature and
+    the response format the reply was produced with (``"json_object"`` for
+    JSON mode, None for plain text).
+    Each instance keeps its own hit/miss counters, so create one per run to
+    report per-run statistics while sharing the same database file.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.path = Path(cache_dir) / "llm_cache.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(
+        self,
+        model: str,
+        system_prompt: str,
+        prompt: str,
+        temperature: Optional[float],
+        response_format: Optional[str] = None,
+    ) -> Optional[str]:
+        key = llm_cache_key(model, system_prompt, prompt, temperature, response_format)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.max_age_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def put(
+        self,
+        model: str,
+        system_prompt: str,
+        prompt: str,
+        temperature: Optional[float],
+        response: str,
+        response_format: Optional[str] = None,
+    ) -> None:
+        key = llm_cache_key(model, system_prompt, prompt, temperature, response_format)
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(
+            "DELETE FROM responses WHERE created_at < ?",
+            (now - self.max_age_seconds,),
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self) -> int:
+        """Delete every cached response and return how many were removed."""
+        with self._lock, self._connect() as conn:
+            removed = conn.execute("DELETE FROM responses").rowcount
+        with self._connect() as conn:
+            conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
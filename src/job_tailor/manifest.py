@@ -0,0 +1,191 @@
+"""Per-stage latency and token usage for tailoring runs."""
+
+import contextlib
+import contextvars
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+MANIFEST_FILENAME = "run_manifest.json"
+
+# Stats of the API call in progress in the current task, for the httpx hook.
+_active_stats: contextvars.ContextVar[Optional["StageStats"]] = contextvars.ContextVar(
+    "job_tailor_active_stats", default=None
+)
+
+
+class StageStats:
+    """Counters for one stage of one job.
+
+    ``calls`` counts API calls made (cache hits are counted separately) and
+    ``retries`` counts HTTP attempts beyond the first for those calls,
+    including retries made inside the OpenAI client. ``json_repairs`` and
+    ``json_rerequests`` count malformed JSON replies fixed locally and by
+    asking the model again. ``input_hash`` identifies the stage's inputs
+    (see checkpoints.stage_input_keys) and ``reused`` marks a result loaded
+    from a checkpoint instead of computed.
+    """
+
+    def __init__(self, job: Optional[str], stage: str, model: Optional[str] = None) -> None:
+        self.job = job
+        self.stage = stage
+        self.model = model
+        self.wall_seconds = 0.0
+        self.calls = 0
+        self.cache_hits = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.retries = 0
+        self.json_repairs = 0
+        self.json_rerequests = 0
+        self.input_hash: Optional[str] = None
+        self.reused = False
+        self._attempts = 0
+
+    def record_usage(self, usage: Any) -> None:
+        if usage is None:
+            return
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.cached_tokens += getattr(details, "cached_tokens", 0) or 0
+
+    @contextlib.contextmanager
+    def api_call(self) -> Iterator[None]:
+        """Count one API call and the HTTP attempts made while it runs."""
+        self._attempts = 0
+        token = _active_stats.set(self)
+        try:
+            yield
+        finally:
+            _active_stats.reset(token)
+            self.calls += 1
+            self.retries += max(self._attempts - 1, 0)
+
+    @contextlib.contextmanager
+    def timed(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wall_seconds += time.perf_counter() - start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "model": self.model,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "retries": self.retries,
+            "json_repairs": self.json_repairs,
+            "json_rerequests": self.json_rerequests,
+            "input_hash": self.input_hash,
+            "reused": self.reused,
+        }
+
+
+def _count_attempt() -> None:
+    stats = _active_stats.get()
+    if stats is not None:
+        stats._attempts += 1
+
+
+def count_request(request: httpx.Request) -> None:
+    """httpx request hook attributing each attempt to the active stage."""
+    _count_attempt()
+
+
+async def acount_request(request: httpx.Request) -> None:
+    _count_attempt()
+
+
+def _totals(stats: List[StageStats]) -> Dict[str, Any]:
+    return {
+        "calls": sum(s.calls for s in stats),
+        "cache_hits": sum(s.cache_hits for s in stats),
+        "prompt_tokens": sum(s.prompt_tokens for s in stats),
+        "completion_tokens": sum(s.completion_tokens for s in stats),
+        "cached_tokens": sum(s.cached_tokens for s in stats),
+        "retries": sum(s.retries for s in stats),
+        "json_repairs": sum(s.json_repairs for s in stats),
+        "json_rerequests": sum(s.json_rerequests for s in stats),
+    }
+
+
+def write_run_manifest(
+    path: Path,
+    job: str,
+    model: str,
+    started_at: float,
+    wall_seconds: float,
+    stats: List[StageStats],
+) -> Path:
+    manifest = {
+        "job": job,
+        "model": model,
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(started_at)),
+        "wall_seconds": round(wall_seconds, 3),
+        "stages": [s.to_dict() for s in stats],
+        "totals": _totals(stats),
+    }
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return path
+
+
+def format_profile(stats: List[StageStats], wall_seconds: float) -> str:
+    """Render a per-stage table summed over all jobs of a run."""
+    by_stage: Dict[str, List[StageStats]] = {}
+    for s in stats:
+        by_stage.setdefault(s.stage, []).append(s)
+
+    header = (
+        "stage",
+        "wall s",
+        "calls",
+        "hits",
+        "prompt",
+        "compl",
+        "cached",
+        "retries",
+        "repairs",
+        "reasks",
+    )
+    rows = []
+    for stage, group in list(by_stage.items()) + [("total", stats)]:
+        totals = _totals(group)
+        rows.append(
+            (
+                stage,
+                f"{sum(s.wall_seconds for s in group):.2f}",
+                str(totals["calls"]),
+                str(totals["cache_hits"]),
+                str(totals["prompt_tokens"]),
+                str(totals["completion_tokens"]),
+                str(totals["cached_tokens"]),
+                str(totals["retries"]),
+                str(totals["json_repairs"]),
+                str(totals["json_rerequests"]),
+            )
+        )
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+
+    def fmt(row: tuple) -> str:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+        return "  ".join(cells)
+
+    lines = [fmt(header), "  ".join("-" * w for w in widths)]
+    lines.extend(fmt(row) for row in rows[:-1])
+    lines.append("  ".join("-" * w for w in widths))
+    lines.append(fmt(rows[-1]))
+    lines.append(f"Run wall time: {wall_seconds:.2f}s (stage times overlap across concurrent stages and jobs)")
+    return "\n".join(lines)
@@ -0,0 +1,245 @@
+"""Streaming multipart/form-data parser for UI uploads."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+CHUNK_SIZE = 64 * 1024
+MAX_HEADER_BYTES = 16 * 1024
+DEFAULT_MAX_FIELD_BYTES = 1024 * 1024
+DEFAULT_MAX_FILE_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 25 * 1024 * 1024
+
+
+class MultipartError(ValueError):
+    """The request body is not valid multipart/form-data."""
+
+
+class PayloadTooLargeError(MultipartError):
+    """A part or the whole body exceeds its size limit."""
+
+
+class MultipartLimits(NamedTuple):
+    max_field_bytes: int = DEFAULT_MAX_FIELD_BYTES
+    max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+
+
+def _format_size(size: int) -> str:
+    for unit, scale in (("MB", 1024 * 1024), ("KB", 1024)):
+        if size >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size} bytes"
+
+
+def parse_boundary(content_type: str) -> bytes | None:
+    boundary_token = "boundary="
+    if boundary_token not in content_type:
+        return None
+    boundary = content_type.split(boundary_token, 1)[1].split(";", 1)[0].strip()
+    if boundary.startswith('"') and boundary.endswith('"'):
+        boundary = boundary[1:-1]
+    return boundary.encode("utf-8") or None
+
+
+def _parse_part_headers(blob: bytes) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for line in blob.split(b"\r\n"):
+        if b":" not in line:
+            continue
+        name, value = line.split(b":", 1)
+        headers[name.decode("utf-8", errors="replace").lower()] = value.decode(
+            "utf-8", errors="replace"
+        ).strip()
+    return headers
+
+
+def _disposition_params(disposition: str) -> dict[str, str]:
+    disp_parts = [part.strip() for part in disposition.split(";") if part.strip()]
+    params: dict[str, str] = {}
+    for part in disp_parts[1:]:
+        if "=" not in part:
+            continue
+        key, value = part.split("=", 1)
+        value = value.strip()
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        params[key.strip()] = value
+    return params
+
+
+class _BodyReader:
+    """Buffered reads of at most ``length`` bytes from ``stream``."""
+
+    def __init__(self, stream: BinaryIO, length: int, chunk_size: int) -> None:
+        self.stream = stream
+        self.remaining = length
+        self.chunk_size = chunk_size
+        self.buffer = b""
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer; False at the end of the body."""
+        if self.remaining <= 0:
+            return False
+        chunk = self.stream.read(min(self.chunk_size, self.remaining))
+        if not chunk:
+            raise MultipartError("Request body ended early.")
+        self.remaining -= len(chunk)
+        self.buffer += chunk
+        return True
+
+    def find(self, marker: bytes, max_bytes: int) -> int:
+        """Index of ``marker`` in the buffer, reading until found or ``max_bytes`` buffered."""
+        while True:
+            index = self.buffer.find(marker)
+            if index >= 0:
+                return index
+            if len(self.buffer) > max_bytes or not self.fill():
+                return -1
+
+
+def parse_multipart(
+    stream: BinaryIO,
+    content_type: str,
+    content_length: int,
+    upload_dir: Path,
+    limits: MultipartLimits = MultipartLimits(),
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[dict[str, str], dict[str, dict[str, Any]]]:
+    """Read a form body of ``content_length`` bytes from ``stream`` in chunks.
+
+    Returns ``(fields, files)``. Parts with a filename are written straight
+    to a temporary file in ``upload_dir``; ``files`` maps the field name to
+    its ``filename``, ``content_type``, ``path``, ``size`` and ``sha256``, and the caller
+    owns (and should move or delete) the file. At most about one chunk is
+    held in memory. Raises PayloadTooLargeError as soon as a field, a file
+    or the body passes its limit, and MultipartError for malformed bodies;
+    files written so far are removed in both cases.
+    """
+    boundary = parse_boundary(content_type)
+    if boundary is None:
+        raise MultipartError("Missing multipart boundary.")
+    if content_length > limits.max_total_bytes:
+        raise PayloadTooLargeError(
+            f"Upload is larger than {_format_size(limits.max_total_bytes)}."
+        )
+
+    reader = _BodyReader(stream, content_length, chunk_size)
+    delimiter = b"\r\n--" + boundary
+    fields: dict[str, str] = {}
+    files: dict[str, dict[str, Any]] = {}
+
+    try:
+        # The first delimiter has no leading CRLF; prefix one so every
+        # delimiter has the same shape.
+        reader.buffer = b"\r\n"
+        if reader.find(delimiter, MAX_HEADER_BYTES) < 0:
+            raise MultipartError("Missing multipart boundary in body.")
+        while True:
+            reader.buffer = reader.buffer[reader.buffer.index(delimiter) + len(delimiter) :]
+            while len(reader.buffer) < 2 and reader.fill():
+                pass
+            if reader.buffer.startswith(b"--"):
+                break
+            if not reader.buffer.startswith(b"\r\n"):
+                raise MultipartError("Malformed multipart delimiter.")
+            header_end = reader.find(b"\r\n\r\n", MAX_HEADER_BYTES)
+            if header_end < 0:
+                raise MultipartError("Malformed multipart part headers.")
+            headers = _parse_part_headers(reader.buffer[2:header_end])
+            reader.buffer = reader.buffer[header_end + 4 :]
+
+            params = _disposition_params(headers.get("content-disposition", ""))
+            name = params.get("name")
+            filename = params.get("filename")
+            if not name:
+                _read_part(reader, delimiter, lambda data: None)
+            elif filename:
+                _read_file_part(reader, delimiter, name, filename, headers, files, upload_dir, limits)
+            else:
+                fields[name] = _read_field_part(reader, delimiter, name, limits)
+        # Discard the epilogue so the connection can be reused.
+        while reader.fill():
+            reader.buffer = b""
+    except BaseException:
+        for info in files.values():
+            info["path"].unlink(missing_ok=True)
+        raise
+    return fields, files
+
+
+def _read_part(reader: _BodyReader, delimiter: bytes, sink: Any) -> None:
+    """Pass a part's data to ``sink`` chunk by chunk, up to the next delimiter."""
+    keep = len(delimiter) - 1
+    while True:
+        index = reader.buffer.find(delimiter)
+        if index >= 0:
+            sink(reader.buffer[:index])
+            reader.buffer = reader.buffer[index:]
+            return
+        # Hold back a possible partial delimiter at the end of the buffer.
+        if len(reader.buffer) > keep:
+            sink(reader.buffer[:-keep])
+            reader.buffer = reader.buffer[-keep:]
+        if not reader.fill():
+            raise MultipartError("Multipart body is missing its closing boundary.")
+
+
+def _read_field_part(
+    reader: _BodyReader, delimiter: bytes, name: str, limits: MultipartLimits
+) -> str:
+    value = bytearray()
+
+    def sink(data: bytes) -> None:
+        if len(value) + len(data) > limits.max_field_bytes:
+            raise PayloadTooLargeError(
+                f"Field {name!r} is larger than {_format_size(limits.max_field_bytes)}."
+            )
+        value.extend(data)
+
+    _read_part(reader, delimiter, sink)
+    return value.decode("utf-8", errors="replace").strip()
+
+
+def _read_file_part(
+    reader: _BodyReader,
+    delimiter: bytes,
+    name: str,
+    filename: str,
+    headers: dict[str, str],
+    files: dict[str, dict[str, Any]],
+    upload_dir: Path,
+    limits: MultipartLimits,
+) -> None:
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    info = {
+        "filename": filename,
+        "content_type": headers.get("content-type"),
+        "path": Path(tmp_name),
+        "size": 0,
+    }
+    # Registered first so the file is cleaned up if reading fails.
+    previous = files.get(name)
+    files[name] = info
+    if previous is not None:
+        previous["path"].unlink(missing_ok=True)
+
+    digest = hashlib.sha256()
+    with os.fdopen(fd, "wb") as handle:
+
+        def sink(data: bytes) -> None:
+            if info["size"] + len(data) > limits.max_file_bytes:
+                raise PayloadTooLargeError(
+                    f"File {filename!r} is larger than {_format_size(limits.max_file_bytes)}."
+                )
+            handle.write(data)
+            digest.update(data)
+            info["size"] += len(data)
+
+        _read_part(reader, delimiter, sink)
+    info["sha256"] = digest.hexdigest()
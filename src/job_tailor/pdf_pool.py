@@ -0,0 +1,83 @@
+"""Process-wide pool of worker processes for PDF rendering."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .pdf_renderer import PdfRenderer
+
+# Leave one core for the event loop; single-core machines render on threads.
+DEFAULT_PDF_WORKERS = max(0, min(2, (os.cpu_count() or 1) - 1))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_lock = threading.Lock()
+
+# One renderer per process: the pool's workers and the calling process.
+_renderer: Optional[PdfRenderer] = None
+
+
+def _get_renderer() -> PdfRenderer:
+    global _renderer
+    if _renderer is None:
+        _renderer = PdfRenderer()
+    return _renderer
+
+
+def render_pdf(markdown_text: str, output_path: Path) -> None:
+    """Render with this process's PdfRenderer (created on first use)."""
+    _get_renderer().render_to_file(markdown_text, output_path)
+
+
+def _start_worker() -> None:
+    _get_renderer()
+
+
+def get_pdf_executor(workers: int = DEFAULT_PDF_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """Return the shared pool with ``workers`` processes, or None if ``workers`` is 0.
+
+    The pool is started on first use and kept for later runs; asking for a
+    different size replaces it. Workers are spawned rather than forked, as
+    the calling process runs the pipeline's event loop in a thread, so a
+    script using the pool needs an ``if __name__ == "__main__":`` guard.
+    All workers start at once and set up their renderer while the first
+    LLM stages run.
+    """
+    global _executor, _executor_workers
+    if workers <= 0:
+        return None
+    with _lock:
+        if _executor is not None and _executor_workers != workers:
+            _executor.shutdown(wait=True)
+            _executor = None
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _executor_workers = workers
+            for _ in range(workers):
+                _executor.submit(_start_worker)
+        return _executor
+
+
+def shutdown_pdf_pool() -> None:
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+async def arender_pdf(
+    markdown_text: str, output_path: Path, executor: Optional[Executor] = None
+) -> None:
+    """Render on ``executor``, or on a thread of the running loop if None."""
+    if executor is None:
+        await asyncio.to_thread(render_pdf, markdown_text, output_path)
+        return
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, render_pdf, markdown_text, output_path)
@@ -0,0 +1,121 @@
+"""Reusable Markdown-to-PDF renderer for CVs and cover letters."""
+
+from pathlib import Path
+from typing import List, NamedTuple, Tuple
+
+from fpdf import FPDF
+from fpdf.enums import WrapMode, XPos, YPos
+
+FONT_FAMILY = "Helvetica"
+PAGE_BREAK_MARGIN = 54
+BLANK_LINE_HEIGHT = 6
+LINE_GAP = 6
+MAX_WORD_CHARS = 60
+
+# Characters outside the core fonts' Latin-1 range that models like to emit.
+TEXT_TRANSLATION = str.maketrans(
+    {
+        "–": "-",
+        "—": "--",
+        "•": "-",
+        "→": "->",
+        "←": "<-",
+        "“": '"',
+        "”": '"',
+        "‘": "'",
+        "’": "'",
+        "\u2011": "-",
+        "\u00a0": " ",
+        # multi_cell drops soft hyphens in CHAR wrap mode; keep them out of
+        # the text layer so extracted words stay whole.
+        "\u00ad": "",
+    }
+)
+
+
+class LineStyle(NamedTuple):
+    marker: str
+    size: int
+    bold: bool
+    indent: int
+    prefix: str
+
+
+# Checked in order; the last entry matches any other line.
+LINE_STYLES = (
+    LineStyle("# ", 18, True, 0, ""),
+    LineStyle("## ", 14, True, 0, ""),
+    LineStyle("### ", 12, True, 0, ""),
+    LineStyle("- ", 11, False, 10, "- "),
+    LineStyle("", 11, False, 0, ""),
+)
+
+
+def break_long_words(text: str, max_len: int = MAX_WORD_CHARS) -> str:
+    parts = []
+    for token in text.split(" "):
+        if len(token) <= max_len:
+            parts.append(token)
+            continue
+        chunks = [token[i : i + max_len] for i in range(0, len(token), max_len)]
+        parts.append(" ".join(chunks))
+    return " ".join(parts)
+
+
+class PdfRenderer:
+    """Render Markdown documents to PDF, reusing setup across documents.
+
+    Line styles and the character translation table are prepared once, and
+    the font is only switched when the line style changes. Lines that fit
+    the page width are drawn with ``cell``, skipping ``multi_cell``'s
+    line breaking; longer ones still go through ``multi_cell``. A renderer
+    holds no per-document state, so one instance can be shared between
+    threads.
+    """
+
+    def _new_document(self) -> FPDF:
+        pdf = FPDF(unit="pt", format="A4")
+        pdf.set_auto_page_break(auto=True, margin=PAGE_BREAK_MARGIN)
+        pdf.add_page()
+        return pdf
+
+    def _write_line(
+        self,
+        pdf: FPDF,
+        font: List[Tuple[bool, int]],
+        text: str,
+        style: LineStyle,
+    ) -> None:
+        if font[0] != (style.bold, style.size):
+            pdf.set_font(FONT_FAMILY, style="B" if style.bold else "", size=style.size)
+            font[0] = (style.bold, style.size)
+        if style.indent:
+            pdf.set_x(pdf.l_margin + style.indent)
+        text = break_long_words(text).translate(TEXT_TRANSLATION)
+        height = style.size + LINE_GAP
+        max_width = pdf.w - pdf.r_margin - pdf.x - 2 * pdf.c_margin
+        # A single line is drawn left-aligned by multi_cell too, so cell
+        # produces the same page content.
+        if pdf.get_string_width(text) < max_width:
+            pdf.cell(0, height, text, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            return
+        pdf.multi_cell(
+            0, height, text, new_x=XPos.LMARGIN, new_y=YPos.NEXT, wrapmode=WrapMode.CHAR
+        )
+
+    def render(self, markdown_text: str) -> FPDF:
+        pdf = self._new_document()
+        font: List[Tuple[bool, int]] = [(False, 0)]
+        for line in markdown_text.splitlines():
+            if not line.strip():
+                pdf.ln(BLANK_LINE_HEIGHT)
+                continue
+            style = next(s for s in LINE_STYLES if line.startswith(s.marker))
+            text = line[len(style.marker) :].strip()
+            self._write_line(pdf, font, style.prefix + text, style)
+        return pdf
+
+    def render_to_file(self, markdown_text: str, output_path: Path) -> None:
+        pdf = self.render(markdown_text)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf.output(str(output_path))
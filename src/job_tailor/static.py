@@ -0,0 +1,128 @@
+"""Pre-compressed UI assets and HTTP caching helpers for the UI server."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt", ".md"}
+# Smaller bodies gain less from gzip than its header costs.
+GZIP_MIN_BYTES = 512
+# Asset URLs are not versioned, so browsers revalidate (cheaply, via ETag).
+ASSET_CACHE_CONTROL = "no-cache"
+FILE_CACHE_CONTROL = "private, no-cache"
+
+
+class Asset(NamedTuple):
+    content_type: str
+    body: bytes
+    etag: str
+    gzip_body: bytes | None
+    gzip_etag: str | None
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+def _content_type(path: Path) -> str:
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def load_assets(directory: Path, url_prefix: str) -> dict[str, Asset]:
+    """Read every file under ``directory`` and gzip the compressible ones, once.
+
+    Keys are URL paths (``url_prefix`` plus the relative path). ETags are
+    content hashes; the gzip variant gets its own, as it is a different
+    representation.
+    """
+    assets: dict[str, Asset] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        gzip_body = gzip_etag = None
+        if path.suffix.lower() in COMPRESSIBLE_SUFFIXES and len(body) >= GZIP_MIN_BYTES:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                gzip_body, gzip_etag = compressed, f'"{digest}-gzip"'
+        url = url_prefix + path.relative_to(directory).as_posix()
+        assets[url] = Asset(_content_type(path), body, f'"{digest}"', gzip_body, gzip_etag)
+    return assets
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q > 0)."""
+    if not accept_encoding:
+        return False
+    allowed: dict[str, bool] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        allowed[coding.strip().lower()] = q > 0
+    if "gzip" in allowed:
+        return allowed["gzip"]
+    return allowed.get("*", False)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check, using weak comparison as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in candidates}
+
+
+def file_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Returns None when the whole file should be sent: no header, a syntax
+    error, or several ranges (which are not supported). Raises
+    RangeNotSatisfiable when the range lies outside the file.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes=") :].strip()
+    if "," in spec:
+        return None
+    first, sep, last = spec.partition("-")
+    if not sep:
+        return None
+    try:
+        if not first:
+            suffix = int(last)
+            if suffix <= 0 or size == 0:
+                raise RangeNotSatisfiable(header)
+            return max(0, size - suffix), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except RangeNotSatisfiable:
+        raise
+    except ValueError:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import functools
 import json
+import os
+import queue
 import sys
 import time
+import types
+import urllib.parse
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -12,12 +19,54 @@ from typing import Any
 
 from dotenv import load_dotenv
 
-from .core import markdown_to_pdf, slugify_token, tailor_documents
+from .async_server import (
+    DEFAULT_DRAIN_SECONDS,
+    DEFAULT_KEEPALIVE_SECONDS,
+    DEFAULT_MAX_CONCURRENT,
+    AsyncHttpServer,
+)
+from .core import (
+    atailor_documents,
+    load_candidate_json,
+    run_in_background,
+    slugify_token,
+    tailor_documents,
+)
+from .cv_text import CvTextCache
+from .http_cache import HttpCache
+from .jobs import DEFAULT_MAX_QUEUE, DEFAULT_WORKERS, JobQueue, QueueFullError
+from .llm_cache import LlmCache
+from .multipart import (
+    DEFAULT_MAX_FIELD_BYTES,
+    DEFAULT_MAX_FILE_BYTES,
+    DEFAULT_MAX_TOTAL_BYTES,
+    MultipartError,
+    MultipartLimits,
+    PayloadTooLargeError,
+    parse_multipart,
+)
+from .static import (
+    ASSET_CACHE_CONTROL,
+    FILE_CACHE_CONTROL,
+    Asset,
+    RangeNotSatisfiable,
+    accepts_gzip,
+    etag_matches,
+    file_etag,
+    load_assets,
+    parse_range,
+)
+from .uploads import UploadStore
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 ASSETS_DIR = ROOT_DIR / "assets" / "ui"
 OUTPUT_DIR = ROOT_DIR / "outputs" / "ui_runs"
 UPLOAD_DIR = OUTPUT_DIR / "uploads"
+JOBS_DIR = OUTPUT_DIR / "jobs"
+OUTPUTS_ROOT = ROOT_DIR / "outputs"
+FILE_CHUNK_SIZE = 64 * 1024
+SSE_KEEPALIVE_SECONDS = 15.0
+QUEUE_FULL_RETRY_AFTER = 10
 
 
 def _parse_bool(value: str | None, default: bool = False) -> bool:
@@ -51,6 +100,51 @@ def _format_audit_preview(audit_json: dict[str, Any]) -> str:
     return "\n".join(lines).strip()
 
 
+def _build_run_payload(created_paths: list[Path], run_kwargs: dict[str, Any]) -> dict[str, Any]:
+    output_dir = created_paths[0].parent if created_paths else OUTPUT_DIR
+    llm_cache = run_kwargs.get("llm_cache")
+    cv_preview = ""
+    cover_preview = ""
+    audit_preview = ""
+
+    for path in created_paths:
+        if path.name.endswith("_cv.md"):
+            cv_preview = path.read_text(encoding="utf-8").strip()
+        if path.name.endswith("_cover_letter.md"):
+            cover_preview = path.read_text(encoding="utf-8").strip()
+        if path.name.endswith("_ats_audit.json"):
+            audit_json = json.loads(path.read_text(encoding="utf-8"))
+            audit_preview = _format_audit_preview(audit_json)
+
+    return {
+        "status": "ok",
+        "created_files": [str(p.relative_to(ROOT_DIR)) for p in created_paths],
+        "output_dir": str(output_dir.relative_to(ROOT_DIR)),
+        "preview": {
+            "cv": cv_preview,
+            "cover": cover_preview,
+            "audit": audit_preview,
+        },
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+    }
+
+
+def _release_cv(upload_store: UploadStore | None, run_kwargs: dict[str, Any]) -> None:
+    """Drop the run's reference to its stored CV (named by its content hash)."""
+    if upload_store is not None:
+        upload_store.release(Path(run_kwargs["cv_file"]).stem)
+
+
+def _run_job(
+    run_kwargs: dict[str, Any], on_event: Any, upload_store: UploadStore | None = None
+) -> dict[str, Any]:
+    try:
+        created_paths = tailor_documents(**run_kwargs, on_event=on_event)
+    finally:
+        _release_cv(upload_store, run_kwargs)
+    return _build_run_payload(created_paths, run_kwargs)
+
+
 class UiHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, directory=str(ROOT_DIR), **kwargs)
@@ -58,11 +152,15 @@ class UiHandler(SimpleHTTPRequestHandler):
     def log_message(self, format: str, *args: Any) -> None:
         sys.stderr.write("%s - - [%s] %s\n" % (self.address_string(), self.log_date_time_string(), format % args))
 
-    def _send_json(self, payload: dict[str, Any], status: int = 200) -> None:
+    def _send_json(
+        self, payload: dict[str, Any], status: int = 200, headers: dict[str, str] | None = None
+    ) -> None:
         data = json.dumps(payload).encode("utf-8")
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
         self.wfile.write(data)
 
@@ -70,43 +168,210 @@ class UiHandler(SimpleHTTPRequestHandler):
         if self.path == "/api/health":
             self._send_json({"status": "ok"})
             return
+        if self.path.startswith("/api/jobs/"):
+            self._get_job(self.path[len("/api/jobs/") :])
+            return
+        if self.path.startswith("/api/uploads/"):
+            upload = self.upload_store.get(self.path[len("/api/uploads/") :])
+            if upload is None:
+                self._send_json({"status": "error", "message": "Unknown upload."}, status=404)
+            else:
+                self._send_json(upload.to_dict())
+            return
+        if self.path in {"/", "/ui", "/ui/"}:
+            self.path = "/assets/ui/index.html"
+        if not self._serve_static():
+            super().do_GET()
+
+    def do_HEAD(self) -> None:  # noqa: N802
         if self.path in {"/", "/ui", "/ui/"}:
             self.path = "/assets/ui/index.html"
-        super().do_GET()
+        if not self._serve_static(head=True):
+            super().do_HEAD()
+
+    @property
+    def assets(self) -> dict[str, Asset]:
+        return getattr(self.server, "assets", {})
+
+    def _serve_static(self, head: bool = False) -> bool:
+        """Serve a UI asset or a generated output file; False for other paths."""
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        asset = self.assets.get(path)
+        if asset is not None:
+            self._send_asset(asset, head)
+            return True
+        if path.startswith("/outputs/"):
+            file_path = (ROOT_DIR / path.lstrip("/")).resolve()
+            if file_path.is_relative_to(OUTPUTS_ROOT) and file_path.is_file():
+                self._send_file(file_path, head)
+                return True
+        return False
+
+    def _send_not_modified(self, etag: str, cache_control: str, vary: bool = False) -> None:
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        if vary:
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+
+    def _send_asset(self, asset: Asset, head: bool) -> None:
+        body, etag, encoding = asset.body, asset.etag, None
+        if asset.gzip_body is not None and accepts_gzip(self.headers.get("Accept-Encoding")):
+            body, etag, encoding = asset.gzip_body, asset.gzip_etag or etag, "gzip"
+        vary = asset.gzip_body is not None
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self._send_not_modified(etag, ASSET_CACHE_CONTROL, vary)
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", ASSET_CACHE_CONTROL)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if vary:
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_file(self, path: Path, head: bool) -> None:
+        """Send a file with a validator ETag and single-range support."""
+        with open(path, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            size = stat.st_size
+            etag = file_etag(stat)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self._send_not_modified(etag, FILE_CACHE_CONTROL)
+                return
+
+            byte_range = None
+            if_range = self.headers.get("If-Range")
+            if if_range is None or if_range.strip() == etag:
+                try:
+                    byte_range = parse_range(self.headers.get("Range"), size)
+                except RangeNotSatisfiable:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+            start, end = byte_range or (0, size - 1)
+            length = end - start + 1
+            self.send_response(HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK)
+            self.send_header("Content-Type", self.guess_type(str(path)))
+            self.send_header("Content-Length", str(length))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", FILE_CACHE_CONTROL)
+            self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+            if byte_range:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.end_headers()
+            if head:
+                return
+            handle.seek(start)
+            while length > 0:
+                chunk = handle.read(min(FILE_CHUNK_SIZE, length))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                length -= len(chunk)
 
     def do_POST(self) -> None:  # noqa: N802
-        if self.path != "/api/run":
+        if self.path not in {"/api/run", "/api/run/stream", "/api/jobs"}:
             self.send_error(HTTPStatus.NOT_FOUND, "Not found")
             return
 
+        run_kwargs = self._read_run_request()
+        if run_kwargs is None:
+            return
+
+        if self.path == "/api/jobs":
+            self._submit_job(run_kwargs)
+            return
+        if self.path == "/api/run/stream":
+            self._stream_run(run_kwargs)
+            return
+
+        try:
+            created_paths = tailor_documents(**run_kwargs)
+        except Exception as exc:  # noqa: BLE001
+            self._send_json({"status": "error", "message": str(exc)}, status=500)
+            return
+        finally:
+            _release_cv(self.upload_store, run_kwargs)
+
+        self._send_json(_build_run_payload(created_paths, run_kwargs))
+
+    def _read_run_request(self) -> dict[str, Any] | None:
+        """Parse the run form into tailor_documents kwargs, or send an error."""
         content_type = self.headers.get("Content-Type", "")
         if "multipart/form-data" not in content_type:
             self._send_json({"status": "error", "message": "Expected multipart form data."}, status=400)
-            return
+            return None
 
         length = self.headers.get("Content-Length")
         if not length or not length.isdigit():
             self._send_json({"status": "error", "message": "Missing Content-Length."}, status=411)
-            return
+            return None
 
-        body = self.rfile.read(int(length))
-        fields, files = self._parse_multipart(content_type, body)
+        try:
+            fields, files = parse_multipart(
+                self.rfile, content_type, int(length), UPLOAD_DIR, self.upload_limits
+            )
+        except MultipartError as exc:
+            # Part of the body may be unread, so the connection cannot be reused.
+            status = 413 if isinstance(exc, PayloadTooLargeError) else 400
+            self._send_json(
+                {"status": "error", "message": str(exc)}, status=status, headers={"Connection": "close"}
+            )
+            return None
 
-        cv_field = files.get("cv_file")
-        if not cv_field or not cv_field.get("filename"):
-            self._send_json({"status": "error", "message": "Upload a CV file."}, status=400)
-            return
+        cv_field = files.pop("cv_file", None)
+        for extra in files.values():
+            extra["path"].unlink(missing_ok=True)
+        cv_hash = (fields.get("cv_hash") or "").strip().lower()
 
         job_source = (fields.get("job_source") or "url").strip().lower()
         job_url = (fields.get("job_url") or "").strip()
         job_text = (fields.get("job_text") or "").strip()
 
-        if job_source == "url" and not job_url:
-            self._send_json({"status": "error", "message": "Provide a job URL."}, status=400)
-            return
-        if job_source == "text" and not job_text:
-            self._send_json({"status": "error", "message": "Provide job description text."}, status=400)
-            return
+        error = None
+        if not cv_field and not cv_hash:
+            error = "Upload a CV file."
+        elif job_source == "url" and not job_url:
+            error = "Provide a job URL."
+        elif job_source == "text" and not job_text:
+            error = "Provide job description text."
+        candidate_json = None
+        candidate_raw = (fields.get("candidate_json") or "").strip()
+        if error is None and candidate_raw:
+            # Inline JSON only: a form string is never opened as a server path.
+            try:
+                candidate_json = load_candidate_json(candidate_raw)
+            except ValueError as exc:
+                error = str(exc)
+        if error:
+            if cv_field:
+                cv_field["path"].unlink(missing_ok=True)
+            self._send_json({"status": "error", "message": error}, status=400)
+            return None
+
+        if cv_field:
+            upload = self.upload_store.add(
+                cv_field["path"], cv_field["sha256"], _safe_filename(cv_field["filename"])
+            )
+        else:
+            upload = self.upload_store.acquire(cv_hash)
+            if upload is None:
+                self._send_json(
+                    {"status": "error", "message": "Unknown CV upload; upload the file again."},
+                    status=404,
+                )
+                return None
 
         include_cover_letter = _parse_bool(fields.get("include_cover_letter"), default=True)
         make_pdf = _parse_bool(fields.get("make_pdf"), default=True)
@@ -114,6 +379,8 @@ class UiHandler(SimpleHTTPRequestHandler):
         dry_run = _parse_bool(fields.get("dry_run"), default=False)
         quiet = _parse_bool(fields.get("quiet"), default=False)
 
+        llm_cache = LlmCache() if _parse_bool(fields.get("use_cache"), default=True) else None
+
         model = (fields.get("model") or "gpt-5-mini").strip()
         temp_raw = fields.get("temperature") or "0.2"
         try:
@@ -124,11 +391,6 @@ class UiHandler(SimpleHTTPRequestHandler):
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-        cv_filename = _safe_filename(cv_field["filename"])
-        cv_path = UPLOAD_DIR / f"{timestamp}_{cv_filename}"
-        with open(cv_path, "wb") as handle:
-            handle.write(cv_field["content"])
-
         job_text_path = None
         job_urls: list[str] | None = None
 
@@ -138,134 +400,277 @@ class UiHandler(SimpleHTTPRequestHandler):
         else:
             job_urls = [job_url]
 
-        try:
-            created_paths = tailor_documents(
-                cv_file=cv_path,
-                job_urls=job_urls,
-                job_text_file=job_text_path,
-                out_dir=OUTPUT_DIR,
-                model=model,
-                temperature=temperature,
-                dry_run=dry_run,
-                make_pdf=make_pdf,
-                verbose=not quiet,
-                debug_artifacts=debug_artifacts,
-                include_cover_letter=include_cover_letter,
-            )
-        except Exception as exc:  # noqa: BLE001
-            self._send_json({"status": "error", "message": str(exc)}, status=500)
-            return
-
-        output_dir = created_paths[0].parent if created_paths else OUTPUT_DIR
-        cv_preview = ""
-        cover_preview = ""
-        audit_preview = ""
-
-        if make_pdf:
-            regenerated: list[Path] = []
-            for path in created_paths:
-                if path.name.endswith("_cv.md"):
-                    pdf_path = path.with_suffix(".pdf")
-                    markdown_to_pdf(path.read_text(encoding="utf-8"), pdf_path)
-                    if pdf_path not in created_paths:
-                        regenerated.append(pdf_path)
-                if path.name.endswith("_cover_letter.md"):
-                    pdf_path = path.with_suffix(".pdf")
-                    markdown_to_pdf(path.read_text(encoding="utf-8"), pdf_path)
-                    if pdf_path not in created_paths:
-                        regenerated.append(pdf_path)
-            if regenerated:
-                created_paths.extend(regenerated)
-
-        for path in created_paths:
-            if path.name.endswith("_cv.md"):
-                cv_preview = path.read_text(encoding="utf-8").strip()
-            if path.name.endswith("_cover_letter.md"):
-                cover_preview = path.read_text(encoding="utf-8").strip()
-            if path.name.endswith("_ats_audit.json"):
-                audit_json = json.loads(path.read_text(encoding="utf-8"))
-                audit_preview = _format_audit_preview(audit_json)
-
-        payload = {
-            "status": "ok",
-            "created_files": [str(p.relative_to(ROOT_DIR)) for p in created_paths],
-            "output_dir": str(output_dir.relative_to(ROOT_DIR)),
-            "preview": {
-                "cv": cv_preview,
-                "cover": cover_preview,
-                "audit": audit_preview,
-            },
+        return {
+            "cv_file": upload.path,
+            "job_urls": job_urls,
+            "job_text_file": job_text_path,
+            "out_dir": OUTPUT_DIR,
+            "model": model,
+            "temperature": temperature,
+            "dry_run": dry_run,
+            "make_pdf": make_pdf,
+            "verbose": not quiet,
+            "debug_artifacts": debug_artifacts,
+            "include_cover_letter": include_cover_letter,
+            "candidate_json": candidate_json,
+            "llm_cache": llm_cache,
+            "http_cache": HttpCache(),
+            "cv_text_cache": CvTextCache(),
         }
 
-        self._send_json(payload)
+    @property
+    def upload_limits(self) -> MultipartLimits:
+        return getattr(self.server, "upload_limits", MultipartLimits())
 
-    def _parse_multipart(self, content_type: str, body: bytes) -> tuple[dict[str, str], dict[str, dict[str, Any]]]:
-        boundary_token = "boundary="
-        if boundary_token not in content_type:
-            return {}, {}
+    @property
+    def upload_store(self) -> UploadStore:
+        return self.server.upload_store  # type: ignore[attr-defined]
 
-        boundary = content_type.split(boundary_token, 1)[1].strip()
-        if boundary.startswith('"') and boundary.endswith('"'):
-            boundary = boundary[1:-1]
+    @property
+    def job_queue(self) -> JobQueue:
+        return self.server.job_queue  # type: ignore[attr-defined]
 
-        delimiter = f"--{boundary}".encode("utf-8")
-        sections = body.split(delimiter)
+    def _submit_job(self, run_kwargs: dict[str, Any]) -> None:
+        try:
+            job = self.job_queue.submit(run_kwargs)
+        except QueueFullError as exc:
+            _release_cv(self.upload_store, run_kwargs)
+            data = json.dumps({"status": "error", "message": str(exc)}).encode("utf-8")
+            self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Retry-After", str(QUEUE_FULL_RETRY_AFTER))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self._send_json({"status": job.status, "job_id": job.id}, status=HTTPStatus.ACCEPTED)
 
-        fields: dict[str, str] = {}
-        files: dict[str, dict[str, Any]] = {}
+    def _get_job(self, tail: str) -> None:
+        job_id, _, action = tail.partition("/")
+        record = self.job_queue.get(job_id)
+        if record is None or action not in {"", "events"}:
+            self._send_json({"status": "error", "message": "Unknown job."}, status=404)
+            return
+        if action == "events":
+            self._stream_job(job_id)
+            return
+        self._send_json(record)
 
-        for section in sections:
-            if not section or section in {b"--\r\n", b"--"}:
-                continue
-            if section.startswith(b"\r\n"):
-                section = section[2:]
-            if section.endswith(b"\r\n"):
-                section = section[:-2]
+    def _start_sse(self) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Accel-Buffering", "no")
+        self.end_headers()
+        self.close_connection = True
 
-            header_blob, _, content = section.partition(b"\r\n\r\n")
-            if not header_blob:
-                continue
+    def _write_sse(self, event: str, data: Any) -> None:
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        self.wfile.write(message.encode("utf-8"))
+        self.wfile.flush()
 
-            headers: dict[str, str] = {}
-            for line in header_blob.split(b"\r\n"):
-                if b":" not in line:
-                    continue
-                name, value = line.split(b":", 1)
-                headers[name.decode("utf-8", errors="replace").lower()] = value.decode(
-                    "utf-8", errors="replace"
-                ).strip()
-
-            disposition = headers.get("content-disposition", "")
-            disp_parts = [part.strip() for part in disposition.split(";") if part.strip()]
-            disp_params: dict[str, str] = {}
-            for part in disp_parts[1:]:
-                if "=" not in part:
+    def _stream_run(self, run_kwargs: dict[str, Any]) -> None:
+        """Run the pipeline and push progress and tokens as server-sent events."""
+        events: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        future = run_in_background(atailor_documents(**run_kwargs, on_event=events.put))
+        future.add_done_callback(lambda _: events.put(None))
+        future.add_done_callback(lambda _: _release_cv(self.upload_store, run_kwargs))
+        self._start_sse()
+
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
                     continue
-                key, value = part.split("=", 1)
-                value = value.strip()
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                disp_params[key.strip()] = value
-
-            name = disp_params.get("name")
-            filename = disp_params.get("filename")
-            if not name:
-                continue
-
-            if filename:
-                files[name] = {"filename": filename, "content": content}
+                if event is None:
+                    break
+                self._write_sse(event["type"], event)
+
+            try:
+                created_paths = future.result()
+            except Exception as exc:  # noqa: BLE001
+                self._write_sse("error", {"status": "error", "message": str(exc)})
+                return
+            self._write_sse("result", _build_run_payload(created_paths, run_kwargs))
+        except (BrokenPipeError, ConnectionResetError):
+            future.cancel()
+
+    def _stream_job(self, job_id: str) -> None:
+        """Replay a queued job's events from the start, then follow it live."""
+        self._start_sse()
+        sent = 0
+        try:
+            while True:
+                events, sent, finished = self.job_queue.wait_for_events(
+                    job_id, sent, SSE_KEEPALIVE_SECONDS
+                )
+                for event in events:
+                    self._write_sse(event["type"], event)
+                if finished:
+                    break
+                if not events:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+
+            record = self.job_queue.get(job_id) or {}
+            if record.get("status") == "done":
+                self._write_sse("result", record["result"])
             else:
-                fields[name] = content.decode("utf-8", errors="replace").strip()
-
-        return fields, files
-
-
-def run(host: str = "127.0.0.1", port: int = 8000) -> None:
+                self._write_sse("error", {"status": "error", "message": record.get("message")})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class AsyncUiHandler(UiHandler):
+    """UiHandler for one request of the asyncio server, which owns the connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, server: Any, client_address: Any, rfile: Any, wfile: Any) -> None:
+        self.server = server  # type: ignore[assignment]
+        self.client_address = client_address
+        self.rfile = rfile
+        self.wfile = wfile
+        self.directory = str(ROOT_DIR)
+
+
+def _configure_server(
+    server: Any, workers: int, max_queue: int, upload_limits: MultipartLimits
+) -> JobQueue:
+    """Attach the state handlers read from ``self.server``."""
+    server.upload_limits = upload_limits
+    server.assets = load_assets(ASSETS_DIR, "/assets/ui/")
+    upload_store = UploadStore(UPLOAD_DIR)
+    upload_store.prune()
+    server.upload_store = upload_store
+    server.job_queue = JobQueue(
+        functools.partial(_run_job, upload_store=upload_store),
+        JOBS_DIR,
+        workers=workers,
+        max_queue=max_queue,
+    )
+    return server.job_queue
+
+
+def run(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = DEFAULT_WORKERS,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    upload_limits: MultipartLimits = MultipartLimits(),
+    server_mode: str = "threading",
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_SECONDS,
+    drain_timeout: float = DEFAULT_DRAIN_SECONDS,
+) -> None:
+    """Serve the UI with a thread per connection, or with ``server_mode="asyncio"``.
+
+    The asyncio mode runs at most ``max_concurrent`` requests at once
+    (others get 429) and, on SIGINT/SIGTERM, waits up to ``drain_timeout``
+    seconds for in-flight requests and then as long again for queued runs.
+    """
     load_dotenv()
-    server = ThreadingHTTPServer((host, port), UiHandler)
-    print(f"JobTailor UI server running at http://{host}:{port}/")
-    server.serve_forever()
+    ready = f"JobTailor UI server running at http://{host}:{port}/"
+    if server_mode != "asyncio":
+        server = ThreadingHTTPServer((host, port), UiHandler)
+        _configure_server(server, workers, max_queue, upload_limits)
+        print(ready)
+        server.serve_forever()
+        return
+
+    state = types.SimpleNamespace()
+    job_queue = _configure_server(state, workers, max_queue, upload_limits)
+    async_server = AsyncHttpServer(
+        AsyncUiHandler,
+        state,
+        max_concurrent=max_concurrent,
+        keepalive_timeout=keepalive_timeout,
+        drain_timeout=drain_timeout,
+    )
+    asyncio.run(async_server.serve(host, port, on_ready=lambda: print(f"{ready} (asyncio)")))
+    if not job_queue.drain(drain_timeout):
+        print("Stopped with queued runs unfinished; they are marked interrupted on the next start.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the JobTailor UI.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Background runs executed at once (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=DEFAULT_MAX_QUEUE,
+        help=f"Runs allowed to wait for a worker before submissions get 503 (default: {DEFAULT_MAX_QUEUE})",
+    )
+    parser.add_argument(
+        "--max-upload-mb",
+        type=float,
+        default=DEFAULT_MAX_TOTAL_BYTES / (1024 * 1024),
+        help="Largest accepted request body; bigger uploads get 413 before they are read",
+    )
+    parser.add_argument(
+        "--max-file-mb",
+        type=float,
+        default=DEFAULT_MAX_FILE_BYTES / (1024 * 1024),
+        help="Largest accepted CV file",
+    )
+    parser.add_argument(
+        "--max-field-kb",
+        type=float,
+        default=DEFAULT_MAX_FIELD_BYTES / 1024,
+        help="Largest accepted text field, such as pasted job text",
+    )
+    parser.add_argument(
+        "--server",
+        choices=["threading", "asyncio"],
+        default="threading",
+        help="threading: a thread per connection; asyncio: bounded concurrency and graceful shutdown",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT,
+        help=f"asyncio mode: requests handled at once before new ones get 429 (default: {DEFAULT_MAX_CONCURRENT})",
+    )
+    parser.add_argument(
+        "--keepalive-timeout",
+        type=float,
+        default=DEFAULT_KEEPALIVE_SECONDS,
+        help=f"asyncio mode: seconds an idle connection is kept open (default: {DEFAULT_KEEPALIVE_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=DEFAULT_DRAIN_SECONDS,
+        help=f"asyncio mode: seconds to let in-flight requests and queued runs finish on shutdown (default: {DEFAULT_DRAIN_SECONDS:g})",
+    )
+    args = parser.parse_args()
+    upload_limits = MultipartLimits(
+        max_field_bytes=int(args.max_field_kb * 1024),
+        max_file_bytes=int(args.max_file_mb * 1024 * 1024),
+        max_total_bytes=int(args.max_upload_mb * 1024 * 1024),
+    )
+    run(
+        args.host,
+        args.port,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        upload_limits=upload_limits,
+        server_mode=args.server,
+        max_concurrent=args.max_concurrent,
+        keepalive_timeout=args.keepalive_timeout,
+        drain_timeout=args.drain_timeout,
+    )
 
 
 if __name__ == "__main__":
-    run()
+    main()
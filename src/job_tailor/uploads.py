@@ -0,0 +1,134 @@
+"""Content-addressed store for CV uploads in the UI server."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+INDEX_FILENAME = "index.json"
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+UPLOAD_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class Upload(NamedTuple):
+    digest: str
+    path: Path
+    filename: str
+    size: int
+    refs: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"hash": self.digest, "filename": self.filename, "size": self.size, "refs": self.refs}
+
+
+class UploadStore:
+    """Uploaded files stored once per sha256 of their content.
+
+    Storing bytes that are already present only touches the index, so the
+    same CV submitted many times is written to disk once and can later be
+    referred to by its hash alone. ``refs`` counts the runs currently using
+    an upload: ``add`` and ``acquire`` take a reference and ``release``
+    drops it. Uploads without references that have not been used for
+    ``retention_seconds`` are removed by ``prune``. No run survives a
+    restart, so references are reset when the store is opened.
+    """
+
+    def __init__(self, directory: Path, retention_seconds: float = DEFAULT_RETENTION_SECONDS) -> None:
+        self.directory = directory
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        for entry in self._index.values():
+            entry["refs"] = 0
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads((self.directory / INDEX_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / INDEX_FILENAME
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._index, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _path(self, digest: str, entry: dict[str, Any]) -> Path:
+        return self.directory / f"{digest}{entry['suffix']}"
+
+    def _upload(self, digest: str, entry: dict[str, Any]) -> Upload:
+        return Upload(digest, self._path(digest, entry), entry["filename"], entry["size"], entry["refs"])
+
+    def add(self, tmp_path: Path, digest: str, filename: str) -> Upload:
+        """Move ``tmp_path`` into the store (or drop it if already stored) and take a reference."""
+        suffix = Path(filename).suffix.lower() or ".pdf"
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is not None and self._path(digest, entry).exists():
+                tmp_path.unlink(missing_ok=True)
+            else:
+                entry = {"filename": filename, "suffix": suffix, "size": tmp_path.stat().st_size, "refs": 0}
+                self.directory.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, self._path(digest, entry))
+                entry["created_at"] = time.time()
+                self._index[digest] = entry
+            entry["refs"] += 1
+            entry["last_used_at"] = time.time()
+            self._save_index()
+            return self._upload(digest, entry)
+
+    def get(self, digest: str) -> Upload | None:
+        if not UPLOAD_HASH_RE.match(digest):
+            return None
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None or not self._path(digest, entry).exists():
+                return None
+            return self._upload(digest, entry)
+
+    def acquire(self, digest: str) -> Upload | None:
+        """Take a reference to a stored upload, or return None if it is unknown."""
+        if not UPLOAD_HASH_RE.match(digest):
+            return None
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None or not self._path(digest, entry).exists():
+                return None
+            entry["refs"] += 1
+            entry["last_used_at"] = time.time()
+            self._save_index()
+            return self._upload(digest, entry)
+
+    def release(self, digest: str) -> None:
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None:
+                return
+            entry["refs"] = max(0, entry["refs"] - 1)
+            entry["last_used_at"] = time.time()
+            self._prune_locked()
+            self._save_index()
+
+    def prune(self) -> int:
+        with self._lock:
+            removed = self._prune_locked()
+            self._save_index()
+            return removed
+
+    def _prune_locked(self) -> int:
+        cutoff = time.time() - self.retention_seconds
+        stale = [
+            digest
+            for digest, entry in self._index.items()
+            if entry["refs"] == 0 and entry.get("last_used_at", 0) < cutoff
+        ]
+        for digest in stale:
+            self._path(digest, self._index.pop(digest)).unlink(missing_ok=True)
+        return len(stale)
@@ -0,0 +1,71 @@
+"""Re-run tailoring whenever the base CV or job text files change."""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_WATCH_INTERVAL = 1.0
+
+FileState = Optional[Tuple[int, int]]
+
+
+def snapshot(paths: Iterable[Path]) -> Dict[Path, FileState]:
+    """Modification time and size of each path (None if it is missing)."""
+    states: Dict[Path, FileState] = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            states[path] = None
+        else:
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+
+def changed_paths(before: Dict[Path, FileState], after: Dict[Path, FileState]) -> List[Path]:
+    return [path for path, state in after.items() if before.get(path) != state]
+
+
+def watch(
+    paths: Iterable[str | Path],
+    run: Callable[[], object],
+    interval: float = DEFAULT_WATCH_INTERVAL,
+) -> None:
+    """Call ``run`` now and again after every change to ``paths``, until Ctrl-C.
+
+    Files are polled every ``interval`` seconds and a change is acted on once
+    the files have stopped changing for one interval, so an editor's save
+    sequence triggers a single run. Errors from ``run`` are reported and
+    watching continues.
+    """
+    watched = [Path(path) for path in paths]
+
+    def run_once() -> None:
+        try:
+            run()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[watch] Run failed: {exc}", file=sys.stderr)
+        print(f"[watch] Watching {len(watched)} file(s) for changes (Ctrl-C to stop)")
+
+    state = snapshot(watched)
+    run_once()
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(watched)
+            if current == state:
+                continue
+            # Wait for the files to settle before re-running.
+            while True:
+                time.sleep(interval)
+                settled = snapshot(watched)
+                if settled == current:
+                    break
+                current = settled
+            changed = changed_paths(state, current)
+            state = current
+            print(f"[watch] Changed: {', '.join(str(path) for path in changed)}")
+            run_once()
+    except KeyboardInterrupt:
+        print("[watch] Stopped")
@@ -8,7 +8,7 @@ from datetime import date
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from fpdf import FPDF
@@ -45,7 +45,7 @@ def fetch_url_text(url: str, timeout: int = 20) -> str:
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
     }
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
     resp.raise_for_status()
     return extract_text_from_html(resp.text)
 
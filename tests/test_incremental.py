@@ -0,0 +1,58 @@
+"""Incremental (``--watch``) runs reuse checkpoints across CV edits."""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from benchmarks import seeds  # noqa: E402
+from benchmarks.fake_openai import FakeOpenAIServer  # noqa: E402
+from job_tailor import core  # noqa: E402
+from job_tailor.checkpoints import CHECKPOINT_DIRNAME  # noqa: E402
+from job_tailor.fetching import JobFetcher  # noqa: E402
+from job_tailor.manifest import MANIFEST_FILENAME  # noqa: E402
+
+
+def _run(server, cv_path, out_dir):
+    requests_before = server.requests
+    created = core.tailor_documents(
+        cv_file=cv_path,
+        job_urls=[server.job_url(1)],
+        out_dir=out_dir,
+        model="test-model",
+        make_pdf=False,
+        verbose=False,
+        incremental=True,
+        fetcher=JobFetcher(per_host_delay=0.0),
+    )
+    manifest = next(path for path in created if path.name == MANIFEST_FILENAME)
+    return server.requests - requests_before, manifest.read_text(encoding="utf-8")
+
+
+def test_cv_edit_reuses_job_parse_and_checkpoint_dir(tmp_path, monkeypatch):
+    cv_path = tmp_path / "cv.md"
+    cv_path.write_text(seeds.seed_cv_markdown(), encoding="utf-8")
+    out_dir = tmp_path / "out"
+    core._candidate_cache.clear()
+
+    with FakeOpenAIServer(latency=0.0) as server:
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+
+        first, _ = _run(server, cv_path, out_dir)
+        assert first == 6
+        unchanged, _ = _run(server, cv_path, out_dir)
+        assert unchanged == 0
+
+        cv_path.write_text(seeds.seed_cv_markdown() + "\n- Added a new skill\n", encoding="utf-8")
+        edited, manifest = _run(server, cv_path, out_dir)
+
+    # Everything but the job parse depends on the CV.
+    assert edited == 5
+    stages = {stage["stage"]: stage for stage in json.loads(manifest)["stages"]}
+    assert stages["job"]["reused"] is True
+    assert stages["candidate"]["reused"] is False
+    assert len(list((out_dir / CHECKPOINT_DIRNAME).iterdir())) == 1